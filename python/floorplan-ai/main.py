@@ -6,6 +6,12 @@ InPick Floor Plan AI - 메인 엔트리포인트
   # 단일 이미지 인식
   python main.py recognize --input floorplan.png
 
+  # 다중 페이지 PDF 전체 인식
+  python main.py recognize --input complex.pdf --all-pages
+
+  # 여러 이미지 일괄 인식 (심볼 감지 배치 추론)
+  python main.py recognize --input plan1.png plan2.png plan3.jpg
+
   # API 서버 시작
   python main.py serve --port 8000
 
@@ -25,13 +31,30 @@ def cmd_recognize(args):
     """평면도 인식"""
     from src.pipeline import FloorPlanPipeline
     pipeline = FloorPlanPipeline(args.config)
+    if args.all_pages:
+        for path in args.input:
+            doc = pipeline.run_document(path, output_dir=args.output, visualize=args.visualize)
+            for page in doc["pages"]:
+                print(f"\n[페이지 {page['page']}] SVG: {page['svg_path']}")
+            print(f"\n총 {doc['summary']['pages']}페이지, {doc['timing']['total']}초")
+        pipeline.wait_visualizations()
+        return
+    if len(args.input) > 1:
+        results = pipeline.run_files(args.input, output_dir=args.output, visualize=args.visualize)
+        for path, result in zip(args.input, results):
+            print(f"\n[{path}] SVG: {result['svg_path']}")
+        pipeline.wait_visualizations()
+        return
     result = pipeline.run(
-        image_path=args.input,
+        image_path=args.input[0],
         output_dir=args.output,
+        visualize=args.visualize,
     )
+    pipeline.wait_visualizations()
     print(f"\nSVG: {result['svg_path']}")
     print(f"JSON: {result['json_path']}")
-    print(f"시각화: {result['vis_path']}")
+    if result["vis_path"]:
+        print(f"시각화: {result['vis_path']}")
 
 
 def cmd_serve(args):
@@ -77,9 +100,12 @@ def main():
 
     # recognize
     p_rec = subparsers.add_parser("recognize", help="평면도 인식")
-    p_rec.add_argument("--input", "-i", required=True, help="입력 이미지 경로")
+    p_rec.add_argument("--input", "-i", required=True, nargs="+", help="입력 이미지 경로 (여러 개 가능)")
     p_rec.add_argument("--output", "-o", default="outputs", help="출력 디렉토리")
     p_rec.add_argument("--config", default="configs/pipeline_config.yaml")
+    p_rec.add_argument("--all-pages", action="store_true", help="PDF 전체 페이지 인식")
+    p_rec.add_argument("--visualize", action="store_true", default=None,
+                       help="감지 결과 시각화 PNG 저장")
 
     # serve
     p_srv = subparsers.add_parser("serve", help="API 서버 시작")
@@ -71,6 +71,7 @@ def main():
             result = {
                 "vector_data": result.get("vector_data", {}),
                 "timing": result.get("timing", {}),
+                "memory": result.get("memory", {}),
                 "summary": result.get("summary", {}),
             }
 
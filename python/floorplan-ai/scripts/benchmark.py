@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+파이프라인 성능 벤치마크
+
+사용법:
+  # 노이즈 제거 엔진별 지연시간 + 후속 단계 정확도 비교
+  python scripts/benchmark.py denoise --input plan1.png plan2.pdf --repeat 3
+
+  # 입력이 없으면 합성 평면도(노이즈 포함)로 측정
+  python scripts/benchmark.py denoise --report outputs/denoise_report.md
+
+  # 심볼 감지: 전체 이미지(imgsz별) vs 슬라이스 추론(타일 크기별) 재현율/지연시간
+  python scripts/benchmark.py slicing --images ../../datasets/floorplan-yolo/images/val \
+      --imgsz 1280 1920 --tile-sizes 512 640 --report outputs/slicing_report.md
+
+  # OCR: 전체 페이지 vs 텍스트 후보 크롭별 vs 모자이크 vs 숫자 2단 인식 지연시간 + 텍스트/치수 일치율
+  python scripts/benchmark.py ocr --input plan1.png plan2.pdf --report outputs/ocr_report.md
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+from loguru import logger
+
+ROOT = Path(__file__).parent.parent
+DATASET_DIR = ROOT.parent.parent / "datasets" / "floorplan-yolo"
+sys.path.insert(0, str(ROOT))
+logger.remove()
+logger.add(sys.stderr, level="WARNING")
+
+from src.preprocessor import DENOISE_ENGINES, FloorPlanPreprocessor  # noqa: E402
+from src.symbol_detector import SymbolDetector, class_id_map  # noqa: E402
+from src.text_recognizer import TextRecognizer  # noqa: E402
+from src.wall_extractor import WallExtractor  # noqa: E402
+
+
+def synthetic_plan(seed: int = 0, size: tuple = (2480, 3508)) -> np.ndarray:
+    """스캔 노이즈가 섞인 합성 평면도 생성 (A4 300DPI 기본)"""
+    rng = np.random.default_rng(seed)
+    h, w = size
+    img = np.full((h, w, 3), 255, np.uint8)
+
+    # 외벽 + 내부 벽
+    x0, y0, x1, y1 = w // 10, h // 10, w * 9 // 10, h * 9 // 10
+    cv2.rectangle(img, (x0, y0), (x1, y1), (0, 0, 0), 14)
+    for _ in range(6):
+        if rng.random() < 0.5:
+            x = int(rng.integers(x0 + 100, x1 - 100))
+            cv2.line(img, (x, y0), (x, int(rng.integers(y0 + 200, y1))), (0, 0, 0), 10)
+        else:
+            y = int(rng.integers(y0 + 100, y1 - 100))
+            cv2.line(img, (x0, y), (int(rng.integers(x0 + 200, x1)), y), (0, 0, 0), 10)
+
+    # 치수선 + 치수 텍스트
+    cv2.line(img, (x0, y0 - 60), (x1, y0 - 60), (0, 0, 0), 2)
+    for i in range(5):
+        tx = x0 + (x1 - x0) * i // 5 + 40
+        cv2.putText(img, f"{int(rng.integers(9, 48)) * 100:,}", (tx, y0 - 75),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+
+    # 스캔 노이즈 (가우시안 + 점 노이즈)
+    noise = rng.normal(0, 12, img.shape[:2])
+    img = np.clip(img.astype(np.float32) + noise[..., None], 0, 255).astype(np.uint8)
+    salt = rng.random(img.shape[:2]) < 0.002
+    img[salt] = 0
+    return img
+
+
+def load_inputs(paths: list) -> list:
+    """입력 경로 → (이름, BGR 이미지) 리스트"""
+    if not paths:
+        return [(f"synthetic_{i}", synthetic_plan(seed=i)) for i in range(2)]
+    return [(Path(p).stem, FloorPlanPreprocessor.load_image(p)) for p in paths]
+
+
+def _wall_recall(reference: list, candidate: list, tol: float) -> float:
+    """기준 벽 중 후보 벽과 양 끝점이 tol 이내로 일치하는 비율"""
+    if not reference:
+        return 1.0
+    if not candidate:
+        return 0.0
+    ref = np.array([[*w.start, *w.end] for w in reference], dtype=np.float32)
+    cand = np.array([[*w.start, *w.end] for w in candidate], dtype=np.float32)
+
+    # 방향이 뒤집힌 선분도 같은 벽으로 취급
+    def endpoint_dist(c: np.ndarray) -> np.ndarray:
+        d_start = np.linalg.norm(ref[:, None, 0:2] - c[None, :, 0:2], axis=-1)
+        d_end = np.linalg.norm(ref[:, None, 2:4] - c[None, :, 2:4], axis=-1)
+        return np.maximum(d_start, d_end)
+
+    dist = np.minimum(endpoint_dist(cand), endpoint_dist(cand[:, [2, 3, 0, 1]]))
+    matched = (dist <= tol).any(axis=1)
+    return float(matched.mean())
+
+
+def bench_denoise(args) -> dict:
+    """노이즈 제거 엔진별 지연시간 + 이진화/벽 추출 정확도"""
+    config = _load_config(args.config)
+    pp_config = dict(config.get("preprocessor", {}), deskew=False)
+    extractor = WallExtractor(config.get("wall_extractor", {}))
+
+    engines = args.engines or list(DENOISE_ENGINES)
+    reference_engine = "nlm"
+    report = {"inputs": [], "engines": {}}
+
+    for name, image in load_inputs(args.input):
+        report["inputs"].append({"name": name, "size": list(image.shape[:2])})
+        reference = None
+        per_engine = {}
+        # 기준 엔진을 먼저 실행
+        for engine in [reference_engine] + [e for e in engines if e != reference_engine]:
+            pp = FloorPlanPreprocessor(dict(pp_config, denoise_engine=engine))
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            enhanced = pp._enhance_contrast(gray) if pp.enhance_contrast else gray
+
+            latencies = []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                pp._denoise(enhanced)
+                latencies.append(time.perf_counter() - t)
+
+            t = time.perf_counter()
+            binary = pp.process(image)["binary"]
+            process_time = time.perf_counter() - t
+            walls = extractor.extract(binary)["walls"]
+
+            if reference is None:
+                reference = (binary > 0, walls)
+            ref_fg, ref_walls = reference
+            fg = binary > 0
+            union = np.count_nonzero(ref_fg | fg)
+            iou = np.count_nonzero(ref_fg & fg) / union if union else 1.0
+
+            per_engine[engine] = {
+                "denoise_ms": round(statistics.median(latencies) * 1000, 1),
+                "process_ms": round(process_time * 1000, 1),
+                "binary_iou": round(float(iou), 4),
+                "walls": len(walls),
+                "wall_recall": round(_wall_recall(ref_walls, walls, args.wall_tol), 4),
+            }
+            print(f"  [{name}] {engine:16s} {per_engine[engine]}", file=sys.stderr)
+
+        if reference_engine not in engines:
+            per_engine.pop(reference_engine)
+        for engine, metrics in per_engine.items():
+            report["engines"].setdefault(engine, []).append(metrics)
+
+    # 입력 평균
+    report["summary"] = {
+        engine: {
+            key: round(statistics.mean(m[key] for m in runs), 4)
+            for key in ("denoise_ms", "process_ms", "binary_iou", "wall_recall")
+        }
+        for engine, runs in report["engines"].items()
+    }
+    return report
+
+
+def _load_config(path: str) -> dict:
+    if path and Path(path).exists():
+        import yaml
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    return {}
+
+
+def load_labeled(images_dir: str, labels_dir: str = None, limit: int = 0) -> list:
+    """YOLO 형식 데이터셋 → (이름, BGR 이미지, (M, 5) [cls, x1, y1, x2, y2]) 리스트"""
+    images_dir = Path(images_dir)
+    if labels_dir is None:
+        labels_dir = images_dir.parent.parent / "labels" / images_dir.name
+    labels_dir = Path(labels_dir)
+    paths = sorted(p for p in images_dir.iterdir() if p.suffix.lower() in (".png", ".jpg", ".jpeg"))
+    if limit:
+        paths = paths[:limit]
+
+    samples = []
+    for path in paths:
+        image = cv2.imread(str(path))
+        if image is None:
+            continue
+        h, w = image.shape[:2]
+        label_file = labels_dir / f"{path.stem}.txt"
+        rows = np.loadtxt(label_file, ndmin=2) if label_file.exists() else np.empty((0, 5))
+        gt = np.empty((len(rows), 5), dtype=np.float32)
+        if len(rows):
+            cls, cx, cy, bw, bh = rows[:, :5].T
+            gt[:] = np.stack([cls, (cx - bw / 2) * w, (cy - bh / 2) * h,
+                              (cx + bw / 2) * w, (cy + bh / 2) * h], axis=1)
+        samples.append((path.stem, image, gt))
+    return samples
+
+
+def _canonical_labels(gt: np.ndarray, names) -> np.ndarray:
+    """데이터셋 클래스 순서의 GT → 표준 클래스 id (감지 결과와 같은 기준, 표준에 없는 클래스 제외)"""
+    lut = class_id_map(names)
+    if lut is None or not len(gt):
+        return gt
+    cls = gt[:, 0].astype(np.int64)
+    canonical = np.where((cls >= 0) & (cls < len(lut)), lut[cls.clip(0, len(lut) - 1)], -1)
+    gt = gt[canonical >= 0].copy()
+    gt[:, 0] = canonical[canonical >= 0]
+    return gt
+
+
+def _match_counts(gt: np.ndarray, detections, iou_thr: float) -> tuple:
+    """클래스별 IoU 매칭 → (맞춘 GT 수, 맞춘 예측 수)"""
+    if not len(gt) or not len(detections):
+        return 0, 0
+    pred = np.column_stack([detections.class_ids, detections.boxes]).astype(np.float32)
+    lt = np.maximum(gt[:, None, 1:3], pred[None, :, 1:3])
+    rb = np.minimum(gt[:, None, 3:5], pred[None, :, 3:5])
+    inter = (rb - lt).clip(0).prod(axis=2)
+    area_g = (gt[:, 3] - gt[:, 1]) * (gt[:, 4] - gt[:, 2])
+    area_p = (pred[:, 3] - pred[:, 1]) * (pred[:, 4] - pred[:, 2])
+    iou = inter / np.maximum(area_g[:, None] + area_p[None, :] - inter, 1e-9)
+    iou[gt[:, None, 0] != pred[None, :, 0]] = 0
+
+    # 예측은 신뢰도순이므로 열 순서대로 가장 잘 맞는 GT에 한 번만 배정
+    matched_gt = np.zeros(len(gt), dtype=bool)
+    tp = 0
+    for j in range(len(pred)):
+        cand = np.where(matched_gt, 0, iou[:, j])
+        i = int(cand.argmax())
+        if cand[i] >= iou_thr:
+            matched_gt[i] = True
+            tp += 1
+    return int(matched_gt.sum()), tp
+
+
+def bench_slicing(args) -> dict:
+    """전체 이미지 추론(imgsz별) vs 슬라이스 추론(타일 크기별) vs 캐스케이드 재현율 + 지연시간"""
+    config = _load_config(args.config).get("symbol_detector", {})
+    samples = load_labeled(args.images, args.labels, args.limit)
+    if not samples:
+        raise SystemExit(f"평가 이미지가 없습니다: {args.images}")
+
+    modes = {f"full@{size}": dict(config, img_size=size, slicing={"enabled": False})
+             for size in args.imgsz}
+    for tile in args.tile_sizes:
+        modes[f"sliced@{tile}"] = dict(config, slicing={
+            **config.get("slicing", {}), "enabled": True, "tile_size": tile,
+            "overlap": args.overlap, "full_frame": not args.no_full_frame,
+        })
+    for coarse in args.cascade:
+        fine = max(args.imgsz)
+        modes[f"cascade@{coarse}/{fine}"] = dict(config, slicing={"enabled": False}, cascade={
+            **config.get("cascade", {}), "enabled": True,
+            "coarse_size": coarse, "fine_size": fine,
+        })
+
+    report = {"inputs": [{"name": n, "size": list(img.shape[:2]), "objects": len(gt)}
+                         for n, img, gt in samples], "modes": {}}
+    model = None
+    for mode, det_config in modes.items():
+        detector = SymbolDetector(det_config)
+        if model is None:
+            detector.load_model()
+            model = (detector.model, detector.device)
+            # 라벨은 학습 데이터셋 순서 = 모델 names 순서
+            names = getattr(detector.model, "names", None)
+            samples = [(n, img, _canonical_labels(gt, names)) for n, img, gt in samples]
+        detector.model, detector.device = model
+
+        detect = (detector.detect_sliced if detector.slicing
+                  else detector.detect_cascade if detector.cascade else detector.detect)
+        detect(samples[0][1])  # 워밍업
+
+        latencies = []
+        n_gt = n_pred = hit_gt = hit_pred = 0
+        for _, image, gt in samples:
+            runs = []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                detections = detect(image)
+                runs.append(time.perf_counter() - t)
+            latencies.append(statistics.median(runs))
+
+            g, p = _match_counts(gt, detections, args.iou)
+            n_gt += len(gt)
+            n_pred += len(detections)
+            hit_gt += g
+            hit_pred += p
+
+        report["modes"][mode] = {
+            "recall": round(hit_gt / n_gt, 4) if n_gt else 0.0,
+            "precision": round(hit_pred / n_pred, 4) if n_pred else 0.0,
+            "p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 1),
+            "p95_ms": round(float(np.percentile(latencies, 95)) * 1000, 1),
+        }
+        print(f"  {mode:14s} {report['modes'][mode]}", file=sys.stderr)
+
+    report["summary"] = report["modes"]
+    return report
+
+
+def bench_ocr(args) -> dict:
+    """
+    전체 페이지 OCR vs 후보 크롭별 vs 후보 모자이크 vs 숫자 2단 인식
+    (지연시간, 처리 면적, 텍스트/치수 값 일치율 - 전체 페이지 결과 기준)
+    """
+    config = _load_config(args.config)
+    pp = FloorPlanPreprocessor(dict(config.get("preprocessor", {}), deskew=False))
+    ocr_config = config.get("text_recognizer", {})
+    proposals = ocr_config.get("proposals", {})
+    batch = ocr_config.get("batch", {})
+    digits = ocr_config.get("digits", {})
+
+    def recognizer(use_proposals: bool, use_batch: bool, use_digits: bool) -> TextRecognizer:
+        return TextRecognizer(dict(
+            ocr_config,
+            proposals=dict(proposals, enabled=use_proposals),
+            batch=dict(batch, enabled=use_batch),
+            digits=dict(digits, enabled=use_digits),
+        ))
+
+    modes = {
+        "page": recognizer(False, False, False),
+        "proposals": recognizer(True, False, False),
+        "mosaic": recognizer(True, True, False),
+        "two_tier": recognizer(True, True, True),
+    }
+    report = {"inputs": [], "modes": {}}
+
+    for name, image in load_inputs(args.input):
+        prepared = pp.process(image)
+        page, binary = prepared["for_ocr"], prepared["binary"]
+        report["inputs"].append({"name": name, "size": list(page.shape[:2])})
+
+        # 후보 추출 비용과 OCR에 넘기는 면적 비율
+        proposer = modes["proposals"].proposer
+        t = time.perf_counter()
+        regions = proposer.propose(binary)
+        propose_ms = (time.perf_counter() - t) * 1000
+        area = page.shape[0] * page.shape[1]
+        covered = (area if regions is None else
+                   int(((regions[:, 2] - regions[:, 0]) * (regions[:, 3] - regions[:, 1])).sum()))
+
+        reference = None
+        for mode, ocr in modes.items():
+            ocr.recognize(page, binary=binary)  # 워밍업 (모델 로드 포함)
+            runs = []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                blocks = ocr.recognize(page, binary=binary)
+                runs.append(time.perf_counter() - t)
+            texts = [b.text for b in blocks]
+            dims = [d["value_mm"] for d in ocr.extract_dimensions(blocks)]
+            if reference is None:
+                reference = texts, dims
+            ref_texts, ref_dims = reference
+            found = sum(min(texts.count(x), ref_texts.count(x)) for x in set(ref_texts))
+            found_dims = sum(min(dims.count(x), ref_dims.count(x)) for x in set(ref_dims))
+            metrics = {
+                "ocr_ms": round(statistics.median(runs) * 1000, 1),
+                "propose_ms": round(propose_ms, 1) if mode != "page" else 0.0,
+                "regions": (0 if regions is None else len(regions)) if mode != "page" else 1,
+                "area_ratio": round(covered / area, 4) if mode != "page" else 1.0,
+                "texts": len(texts),
+                "text_recall": round(found / len(ref_texts), 4) if ref_texts else 1.0,
+                "dimensions": len(dims),
+                "dim_recall": round(found_dims / len(ref_dims), 4) if ref_dims else 1.0,
+            }
+            report["modes"].setdefault(mode, []).append(metrics)
+            print(f"  [{name}] {mode:10s} {metrics}", file=sys.stderr)
+        prepared.release()
+
+    report["summary"] = {
+        mode: {key: round(statistics.mean(m[key] for m in runs), 4) for key in runs[0]}
+        for mode, runs in report["modes"].items()
+    }
+    return report
+
+
+def _to_markdown(title: str, summary: dict) -> str:
+    """요약 dict → 마크다운 표"""
+    keys = list(next(iter(summary.values())).keys()) if summary else []
+    lines = [f"# {title}", "", "| name | " + " | ".join(keys) + " |",
+             "|---" * (len(keys) + 1) + "|"]
+    for name, metrics in summary.items():
+        lines.append(f"| {name} | " + " | ".join(str(metrics[k]) for k in keys) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="InPick Floor Plan AI Benchmark")
+    subparsers = parser.add_subparsers(dest="command", help="벤치마크 종류")
+
+    # 공통 옵션
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--config", default=str(ROOT / "configs" / "pipeline_config.yaml"))
+    common.add_argument("--report", default=None, help="리포트 저장 경로 (.md 또는 .json)")
+
+    p_dn = subparsers.add_parser("denoise", parents=[common], help="노이즈 제거 엔진 비교")
+    p_dn.add_argument("--input", "-i", nargs="*", default=[], help="입력 이미지/PDF")
+    p_dn.add_argument("--engines", nargs="*", choices=DENOISE_ENGINES, default=None)
+    p_dn.add_argument("--repeat", type=int, default=3)
+    p_dn.add_argument("--wall-tol", type=float, default=10.0, help="벽 일치 허용 오차 (px)")
+
+    p_sl = subparsers.add_parser("slicing", parents=[common], help="슬라이스 심볼 감지 비교")
+    p_sl.add_argument("--images", default=str(DATASET_DIR / "images" / "val"),
+                      help="평가 이미지 디렉토리 (YOLO 형식)")
+    p_sl.add_argument("--labels", default=None, help="라벨 디렉토리 (기본: ../../labels/<split>)")
+    p_sl.add_argument("--imgsz", type=int, nargs="*", default=[1280], help="전체 이미지 추론 크기")
+    p_sl.add_argument("--tile-sizes", type=int, nargs="*", default=[640])
+    p_sl.add_argument("--overlap", type=float, default=0.2, help="타일 겹침 (타일 크기 대비)")
+    p_sl.add_argument("--no-full-frame", action="store_true", help="슬라이스 결과만 사용")
+    p_sl.add_argument("--cascade", type=int, nargs="*", default=[],
+                      help="캐스케이드 저해상도 크기 (크롭 해상도는 --imgsz 최대값)")
+    p_sl.add_argument("--iou", type=float, default=0.5, help="GT 매칭 IoU")
+    p_sl.add_argument("--repeat", type=int, default=3)
+    p_sl.add_argument("--limit", type=int, default=0, help="평가 이미지 수 제한 (0 = 전체)")
+
+    p_ocr = subparsers.add_parser("ocr", parents=[common], help="전체 페이지 vs 텍스트 후보 OCR 비교")
+    p_ocr.add_argument("--input", "-i", nargs="*", default=[], help="입력 이미지/PDF")
+    p_ocr.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args()
+
+    if args.command == "denoise":
+        report = bench_denoise(args)
+        title = "Denoise engine benchmark (reference: nlm)"
+    elif args.command == "slicing":
+        report = bench_slicing(args)
+        title = f"Sliced symbol detection benchmark (recall @ IoU {args.iou})"
+    elif args.command == "ocr":
+        report = bench_ocr(args)
+        title = "OCR benchmark: whole page vs crops vs mosaic vs digit tier (recall vs page)"
+    else:
+        parser.print_help()
+        return
+
+    markdown = _to_markdown(title, report["summary"])
+    print(markdown)
+    if args.report:
+        out = Path(args.report)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        if out.suffix == ".json":
+            out.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        else:
+            out.write_text(markdown, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
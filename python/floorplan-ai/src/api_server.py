@@ -5,14 +5,17 @@ InPick 프론트엔드에서 호출하는 REST API
 
 import io
 import json
+import re
+import shutil
 import tempfile
+import time
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-import cv2
 import numpy as np
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query
+from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, Response
 from loguru import logger
@@ -62,34 +65,135 @@ app.add_middleware(
 pipeline: Optional[FloorPlanPipeline] = None
 ALLOWED_EXT = {".png", ".jpg", ".jpeg", ".pdf", ".tiff", ".bmp"}
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+# 작업별 출력 디렉토리 (시각화 이미지를 job_id로 다시 조회)
+# api.job_ttl_seconds가 지나거나 최근 api.max_jobs개를 넘으면 새 작업을 만들 때 삭제
+JOB_ROOT = Path(tempfile.gettempdir()) / "inpick-floorplan"
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{8}$")
+# 교체 요청으로 읽을 수 있는 모델 파일 (.pt는 pickle - 설정된 디렉토리 밖의 파일은 거부)
+MODEL_EXT = {".pt", ".onnx"}
 
 
 @app.on_event("startup")
 async def startup():
-    """서버 시작 시 파이프라인 초기화"""
+    """서버 시작 시 파이프라인 초기화 + 모델 선로드 (첫 요청 콜드 스타트 제거)"""
     global pipeline
     logger.info("파이프라인 초기화 중...")
     pipeline = FloorPlanPipeline()
+    detector = pipeline.symbol_detector
+    if pipeline.config.get("api", {}).get("preload_model", True):
+        # 로드/워밍업은 백그라운드 - 끝나기 전 요청은 detect()에서 동기 로드
+        detector.reload_model()
     logger.info("서버 준비 완료")
 
 
 @app.get("/api/v1/health")
 async def health_check():
     """헬스체크"""
+    models = pipeline.symbol_detector.registry.status() if pipeline else None
     return {
         "status": "ok",
         "version": "0.1.0",
-        "model_loaded": pipeline is not None,
+        "model_loaded": bool(models and models["active"]),
+        "model_version": pipeline.symbol_detector.model_version if pipeline else None,
+        "models": models,
+        "buffer_pool": pipeline.buffer_pool.stats() if pipeline else None,
     }
 
 
+class ModelReloadRequest(BaseModel):
+    """모델 교체 요청 (name 생략 시 설정 경로의 파일을 다시 읽음)"""
+    name: Optional[str] = None  # api.models_dir 안의 모델 파일 이름
+    version: Optional[str] = None
+    force: bool = False
+
+
+def _resolve_model_name(name: str) -> Path:
+    """모델 파일 이름 → api.models_dir 안의 경로 (디렉토리 구분자/상위 경로/절대 경로 거부)"""
+    models_dir = Path(pipeline.config.get("api", {}).get("models_dir", "models")).resolve()
+    if Path(name).name != name or name in (".", ".."):
+        raise HTTPException(400, f"모델 이름에 경로를 포함할 수 없습니다: {name}")
+    if Path(name).suffix not in MODEL_EXT:
+        raise HTTPException(400, f"지원하지 않는 모델 형식: {name}")
+    path = (models_dir / name).resolve()
+    if path.parent != models_dir:
+        raise HTTPException(400, f"모델 디렉토리 밖의 파일입니다: {name}")
+    if not path.is_file():
+        raise HTTPException(400, f"모델 파일이 없습니다: {name}")
+    return path
+
+
+@app.post("/api/v1/models/reload", status_code=202)
+async def reload_model(request: Optional[ModelReloadRequest] = None):
+    """
+    재학습 모델 무중단 교체 - 백그라운드 로드/워밍업 후 원자적 교체
+
+    처리 중인 요청은 기존 모델로 끝나고, 로드 실패 시 기존 모델을 유지한다.
+    진행 상황은 /api/v1/health의 models.loading / models.last_error로 확인.
+    """
+    request = request or ModelReloadRequest()
+    detector = pipeline.symbol_detector
+    if request.name:
+        path = str(_resolve_model_name(request.name))
+    else:
+        path = detector.default_model_path()
+    detector.reload_model(path, request.version, request.force)
+    return {
+        "status": "loading",
+        "path": path,
+        "active_version": detector.model_version,
+    }
+
+
+def _evict_jobs() -> None:
+    """보존 기간이 지났거나 최대 개수를 넘는 오래된 작업 디렉토리 삭제 (렌더링 중인 작업 제외)"""
+    api = pipeline.config.get("api", {})
+    ttl = api.get("job_ttl_seconds", 3600)
+    max_jobs = api.get("max_jobs", 200)
+    if not JOB_ROOT.is_dir():
+        return
+    jobs = []
+    for job in JOB_ROOT.iterdir():
+        if not JOB_ID_PATTERN.match(job.name):
+            continue
+        try:
+            jobs.append((job.stat().st_mtime, job))
+        except FileNotFoundError:
+            continue  # 다른 요청이 먼저 삭제
+    jobs.sort(reverse=True)
+    now = time.time()
+    for rank, (mtime, job) in enumerate(jobs):
+        if rank < max_jobs and now - mtime < ttl:
+            continue
+        if pipeline.visualization_pending(str(job / "floorplan_detected.png")):
+            continue
+        shutil.rmtree(job, ignore_errors=True)
+
+
+def _new_job() -> Tuple[str, Path]:
+    """새 작업 ID와 출력 디렉토리 (오래된 작업 정리 후)"""
+    _evict_jobs()
+    job_id = str(uuid.uuid4())[:8]
+    return job_id, JOB_ROOT / job_id
+
+
+def _decode_upload(content: bytes):
+    """업로드 이미지 디코딩 - 설정된 최대 픽셀 수에 맞춰 축소 디코딩"""
+    try:
+        return pipeline.preprocessor.decode_image(content)
+    except ValueError:
+        raise HTTPException(400, "이미지를 디코딩할 수 없습니다")
+
+
 @app.post("/api/v1/recognize")
-async def recognize_floorplan(file: UploadFile = File(...)):
+async def recognize_floorplan(
+    file: UploadFile = File(...),
+    visualize: bool = Query(False, description="감지 결과 시각화 PNG 생성 (vis_url로 조회)"),
+):
     """
     평면도 이미지 업로드 → 전체 인식 결과 (JSON)
 
     Returns:
-        JSON: vector_data, timing, summary
+        JSON: vector_data, timing, summary (+ visualize면 vis_url)
     """
     # 파일 검증
     ext = Path(file.filename or "").suffix.lower()
@@ -101,8 +205,7 @@ async def recognize_floorplan(file: UploadFile = File(...)):
         raise HTTPException(400, f"파일 크기 초과 (최대 {MAX_FILE_SIZE // 1024 // 1024}MB)")
 
     # 임시 파일로 저장 후 처리
-    job_id = str(uuid.uuid4())[:8]
-    output_dir = Path(tempfile.mkdtemp()) / job_id
+    job_id, output_dir = _new_job()
 
     try:
         # 이미지 로드
@@ -110,18 +213,24 @@ async def recognize_floorplan(file: UploadFile = File(...)):
             tmp_path = output_dir / f"input{ext}"
             tmp_path.parent.mkdir(parents=True, exist_ok=True)
             tmp_path.write_bytes(content)
-            result = pipeline.run(image_path=str(tmp_path), output_dir=str(output_dir))
+            result = pipeline.run(
+                image_path=str(tmp_path), output_dir=str(output_dir),
+                base_name="floorplan", visualize=visualize,
+            )
         else:
-            nparr = np.frombuffer(content, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            if image is None:
-                raise HTTPException(400, "이미지를 디코딩할 수 없습니다")
-            result = pipeline.run(image=image, output_dir=str(output_dir))
+            image, source_info = _decode_upload(content)
+            result = pipeline.run(
+                image=image, output_dir=str(output_dir), source_info=source_info,
+                visualize=visualize,
+            )
 
         return numpy_json_response({
             "job_id": job_id,
+            "vis_url": f"/api/v1/jobs/{job_id}/visualization" if result["vis_path"] else None,
+            "model_version": result["model_version"],
             "vector_data": result["vector_data"],
             "timing": result["timing"],
+            "memory": result["memory"],
             "summary": result["summary"],
         })
 
@@ -130,6 +239,24 @@ async def recognize_floorplan(file: UploadFile = File(...)):
         raise HTTPException(500, f"인식 처리 중 오류: {str(e)}")
 
 
+@app.get("/api/v1/jobs/{job_id}/visualization")
+async def get_visualization(job_id: str):
+    """
+    감지 결과 시각화 PNG 조회 (recognize?visualize=true 작업)
+
+    백그라운드 렌더링이 끝나지 않았으면 202 - 잠시 후 다시 요청.
+    작업 결과는 api.job_ttl_seconds 동안 보존되고 (최근 api.max_jobs개), 지나면 404.
+    """
+    if not JOB_ID_PATTERN.match(job_id):
+        raise HTTPException(400, "잘못된 job_id")
+    vis_path = JOB_ROOT / job_id / "floorplan_detected.png"
+    if pipeline.visualization_pending(str(vis_path)):
+        return Response(status_code=202, headers={"Retry-After": "1"})
+    if not vis_path.is_file():
+        raise HTTPException(404, "시각화 이미지가 없습니다")
+    return FileResponse(vis_path, media_type="image/png", filename=f"floorplan_{job_id}.png")
+
+
 @app.post("/api/v1/recognize/svg")
 async def recognize_to_svg(file: UploadFile = File(...)):
     """
@@ -140,8 +267,7 @@ async def recognize_to_svg(file: UploadFile = File(...)):
         raise HTTPException(400, f"지원하지 않는 파일 형식: {ext}")
 
     content = await file.read()
-    job_id = str(uuid.uuid4())[:8]
-    output_dir = Path(tempfile.mkdtemp()) / job_id
+    job_id, output_dir = _new_job()
 
     try:
         if ext == ".pdf":
@@ -150,17 +276,17 @@ async def recognize_to_svg(file: UploadFile = File(...)):
             tmp_path.write_bytes(content)
             result = pipeline.run(image_path=str(tmp_path), output_dir=str(output_dir))
         else:
-            nparr = np.frombuffer(content, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            if image is None:
-                raise HTTPException(400, "이미지를 디코딩할 수 없습니다")
-            result = pipeline.run(image=image, output_dir=str(output_dir))
+            image, source_info = _decode_upload(content)
+            result = pipeline.run(
+                image=image, output_dir=str(output_dir), source_info=source_info
+            )
 
         svg_path = result["svg_path"]
         return FileResponse(
             svg_path,
             media_type="image/svg+xml",
             filename=f"floorplan_{job_id}.svg",
+            headers={"X-Model-Version": result["model_version"] or ""},
         )
 
     except Exception as e:
@@ -186,14 +312,8 @@ async def recognize_quick(file: UploadFile = File(...)):
             tmp_path.write_bytes(content)
             result = pipeline.run_quick(str(tmp_path))
         else:
-            nparr = np.frombuffer(content, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            if image is None:
-                raise HTTPException(400, "이미지를 디코딩할 수 없습니다")
-            # run_quick은 파일 경로만 받으므로 임시 저장
-            tmp_path = Path(tempfile.mktemp(suffix=".png"))
-            cv2.imwrite(str(tmp_path), image)
-            result = pipeline.run_quick(str(tmp_path))
+            image, source_info = _decode_upload(content)
+            result = pipeline.run_quick(image=image, source_info=source_info)
 
         return numpy_json_response(result)
 
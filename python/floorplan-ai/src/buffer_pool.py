@@ -0,0 +1,130 @@
+"""
+배열 버퍼 풀
+요청마다 반복 할당되는 전체 프레임 중간 배열(그레이/이진/형태학 임시/거리변환)을
+크기 버킷별로 재사용해 할당기 부하와 페이지 폴트를 줄인다.
+
+OpenCV 함수의 dst= 인자로 풀 버퍼에 직접 결과를 기록한다.
+빈 버퍼 목록은 스레드 로컬이므로 락 없이 획득/반환한다.
+"""
+
+import threading
+import weakref
+from typing import Tuple
+
+import numpy as np
+
+# 최소 버킷 (이보다 작은 배열도 이 크기로 할당)
+MIN_BUCKET_BYTES = 64 * 1024
+
+
+def _bucket(nbytes: int) -> int:
+    """요청 바이트 수 → 버킷 크기 (2의 거듭제곱)"""
+    return max(MIN_BUCKET_BYTES, 1 << (max(1, nbytes) - 1).bit_length())
+
+
+class BufferPool:
+    """
+    크기 버킷 기반 스레드 로컬 배열 풀
+
+    acquire()는 버킷 크기의 1차원 버퍼에서 요청 shape/dtype 뷰를 잘라 반환하고,
+    release()는 그 뷰의 원본 버퍼를 현재 스레드의 빈 목록에 되돌린다.
+    반환하지 않은 버퍼는 일반 배열처럼 GC로 해제된다.
+    """
+
+    def __init__(self, enabled: bool = True, max_mb: float = 256):
+        self.enabled = enabled
+        self.max_bytes = int(max_mb * 1024 * 1024)  # 스레드당 보관 상한
+        self._local = threading.local()
+        # 풀에서 발급한 버퍼 (id → 버퍼), 외부 배열이 섞여 들어오는 것을 막는다
+        self._issued = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._saved_bytes = 0
+        self._allocated_bytes = 0
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "BufferPool":
+        config = config or {}
+        return cls(
+            enabled=config.get("enabled", True),
+            max_mb=config.get("max_mb", 256),
+        )
+
+    def _free_lists(self) -> dict:
+        local = self._local
+        if not hasattr(local, "free"):
+            local.free = {}  # 버킷 크기 → 빈 버퍼 리스트
+            local.cached_bytes = 0
+        return local.free
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """shape/dtype 배열 획득 (내용은 초기화되지 않음)"""
+        dtype = np.dtype(dtype)
+        if not self.enabled:
+            return np.empty(shape, dtype=dtype)
+
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        bucket = _bucket(nbytes)
+        free = self._free_lists().get(bucket)
+        if free:
+            buf = free.pop()
+            self._local.cached_bytes -= bucket
+            with self._lock:
+                self._hits += 1
+                self._saved_bytes += nbytes
+        else:
+            buf = np.empty(bucket, dtype=np.uint8)
+            self._issued[id(buf)] = buf
+            with self._lock:
+                self._misses += 1
+                self._allocated_bytes += bucket
+        return buf[:nbytes].view(dtype).reshape(shape)
+
+    def zeros(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """0으로 채운 배열 획득"""
+        arr = self.acquire(shape, dtype)
+        arr.fill(0)
+        return arr
+
+    def release(self, *arrays: np.ndarray) -> None:
+        """acquire()로 받은 배열 반환 (풀 버퍼가 아니면 무시)"""
+        if not self.enabled:
+            return
+        free = self._free_lists()
+        for arr in arrays:
+            if arr is None:
+                continue
+            buf = arr.base if arr.base is not None else arr
+            if self._issued.get(id(buf)) is not buf:
+                continue
+            bucket = buf.nbytes
+            if self._local.cached_bytes + bucket > self.max_bytes:
+                continue
+            bucket_list = free.setdefault(bucket, [])
+            if any(b is buf for b in bucket_list):
+                continue  # 중복 반환
+            bucket_list.append(buf)
+            self._local.cached_bytes += bucket
+
+    def owns(self, arr: np.ndarray) -> bool:
+        """풀에서 발급한 버퍼의 뷰인지 여부"""
+        buf = arr.base if arr.base is not None else arr
+        return self._issued.get(id(buf)) is buf
+
+    def stats(self) -> dict:
+        """누적 적중률 + 재사용으로 절약한 할당 바이트"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+                "saved_bytes": self._saved_bytes,
+                "allocated_bytes": self._allocated_bytes,
+            }
+
+
+# 풀을 주입받지 않은 모듈용 (할당만 하고 재사용하지 않음)
+NULL_POOL = BufferPool(enabled=False)
@@ -0,0 +1,159 @@
+"""
+버전 기반 모델 레지스트리
+재학습 모델을 서버 재시작 없이 백그라운드에서 로드/워밍업한 뒤 원자적으로 교체한다.
+
+활성 모델은 (버전 정보, 모델) 튜플 하나로 보관하고 교체는 참조 대입 한 번이므로,
+교체 전에 튜플을 잡은 요청은 이전 인스턴스로 끝까지 처리된다.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class ModelVersion:
+    """모델 버전 정보"""
+    version: str
+    path: str
+    sha256: Optional[str]  # 로컬 파일이 없으면 (사전학습 모델 이름 등) None
+    loaded_at: float
+    warmup_sec: float = 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> Optional[str]:
+    """파일 SHA-256 (파일이 없으면 None)"""
+    file = Path(path)
+    if not file.is_file():
+        return None
+    digest = hashlib.sha256()
+    with open(file, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    """
+    버전/체크섬 기반 모델 레지스트리
+
+    Args:
+        loader: 경로 → 모델 객체
+        warmup: 교체 전 모델에 1회 실행할 함수 (첫 요청 지연 제거), None이면 생략
+        history: status()에 남길 최근 버전 수
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        warmup: Optional[Callable[[Any], None]] = None,
+        history: int = 5,
+    ):
+        self._loader = loader
+        self._warmup = warmup
+        self._history = history
+        self._active: Optional[Tuple[ModelVersion, Any]] = None
+        self._versions: "OrderedDict[str, ModelVersion]" = OrderedDict()
+        self._load_lock = threading.Lock()  # 로드는 한 번에 하나씩
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[str] = None
+        self._last_error: Optional[str] = None
+
+    @property
+    def active(self) -> Optional[Tuple[ModelVersion, Any]]:
+        """현재 (버전 정보, 모델) - 요청 시작 시 한 번 잡아 끝까지 사용"""
+        return self._active
+
+    @property
+    def version(self) -> Optional[str]:
+        active = self._active
+        return active[0].version if active else None
+
+    def activate(self, model: Any, info: ModelVersion) -> None:
+        """로드된 모델로 교체 (원자적 참조 대입)"""
+        previous = self._active
+        self._active = (info, model)
+        self._versions[info.version] = info
+        self._versions.move_to_end(info.version)
+        while len(self._versions) > self._history:
+            self._versions.popitem(last=False)
+        if previous is not None and previous[0].version != info.version:
+            logger.info(f"모델 교체: {previous[0].version} → {info.version}")
+
+    def load(self, path: str, version: Optional[str] = None, force: bool = False) -> ModelVersion:
+        """
+        모델 로드 + 워밍업 후 교체 (동기)
+
+        활성 모델과 체크섬이 같으면 다시 로드하지 않는다 (force=True로 강제).
+
+        Args:
+            path: 모델 파일 경로
+            version: 버전 이름 (기본: 파일명@체크섬 앞 12자리)
+
+        Returns:
+            활성화된 ModelVersion
+        """
+        with self._load_lock:
+            sha256 = file_sha256(path)
+            active = self._active
+            if not force and active is not None and version in (None, active[0].version):
+                # 체크섬 비교 (로컬 파일이 없는 모델 이름은 경로 비교)
+                current = active[0]
+                same = current.sha256 == sha256 if sha256 else current.path == str(path)
+                if same:
+                    logger.info(f"같은 모델 → 교체 생략: {current.version}")
+                    return current
+
+            if version is None:
+                version = f"{Path(path).stem}@{sha256[:12]}" if sha256 else Path(path).stem
+            self._pending = version
+            try:
+                logger.info(f"모델 로드: {path} (버전 {version})")
+                model = self._loader(path)
+                t = time.time()
+                if self._warmup is not None:
+                    self._warmup(model)
+                info = ModelVersion(
+                    version=version,
+                    path=str(path),
+                    sha256=sha256,
+                    loaded_at=time.time(),
+                    warmup_sec=round(time.time() - t, 3),
+                )
+                self.activate(model, info)
+                self._last_error = None
+                return info
+            except Exception as e:
+                self._last_error = f"{version}: {e}"
+                logger.error(f"모델 로드 실패 ({version}): {e} → 기존 모델 유지")
+                raise
+            finally:
+                self._pending = None
+
+    def load_async(
+        self, path: str, version: Optional[str] = None, force: bool = False
+    ) -> Future:
+        """백그라운드 스레드에서 load() - 교체 전까지 기존 모델로 계속 서비스"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-load")
+        return self._executor.submit(self.load, path, version, force)
+
+    def status(self) -> dict:
+        """헬스체크용 상태 (활성 버전, 로드 중 버전, 최근 버전 목록)"""
+        active = self._active
+        return {
+            "active": active[0].to_dict() if active else None,
+            "loading": self._pending,
+            "last_error": self._last_error,
+            "history": [v.version for v in self._versions.values()],
+        }
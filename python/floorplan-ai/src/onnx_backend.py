@@ -0,0 +1,185 @@
+"""
+ONNX Runtime 기반 YOLOv8 추론 백엔드
+ultralytics/torch 없이 내보낸 ONNX 그래프를 직접 실행 (NumPy 레터박스 + 디코드 + NMS)
+"""
+
+import ast
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from .symbol_detector import non_max_suppression
+
+GRAPH_OPTIMIZATION_LEVELS = ("disable", "basic", "extended", "all")
+EXECUTION_MODES = ("sequential", "parallel")
+# NMS에 넣을 최대 후보 수 (점수 상위만, ultralytics max_nms와 같은 값)
+MAX_NMS = 30000
+
+
+class OnnxYoloModel:
+    """
+    ONNX Runtime YOLOv8 모델
+
+    입력: (B, 3, S, S) RGB float32 [0, 1]
+    출력: (B, 4 + nc, N) - [cx, cy, w, h, 클래스별 점수] (ultralytics 내보내기 형식)
+    """
+
+    def __init__(self, model_path: str, options: Optional[dict] = None):
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logger.error("onnxruntime 패키지가 설치되지 않았습니다: pip install onnxruntime")
+            raise
+
+        options = options or {}
+        optimization = options.get("graph_optimization", "all")
+        execution_mode = options.get("execution_mode", "sequential")
+        if optimization not in GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"지원하지 않는 graph_optimization: {optimization} "
+                f"(가능: {', '.join(GRAPH_OPTIMIZATION_LEVELS)})"
+            )
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"지원하지 않는 execution_mode: {execution_mode} "
+                f"(가능: {', '.join(EXECUTION_MODES)})"
+            )
+        if not Path(model_path).exists():
+            raise FileNotFoundError(f"ONNX 모델이 없습니다: {model_path}")
+
+        so = ort.SessionOptions()
+        so.intra_op_num_threads = options.get("intra_op_threads", 0)  # 0 = 자동
+        so.inter_op_num_threads = options.get("inter_op_threads", 0)
+        so.execution_mode = {
+            "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+            "parallel": ort.ExecutionMode.ORT_PARALLEL,
+        }[execution_mode]
+        so.graph_optimization_level = {
+            "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+            "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+            "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+            "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+        }[optimization]
+
+        self.session = ort.InferenceSession(
+            str(model_path),
+            sess_options=so,
+            providers=options.get("providers", ["CPUExecutionProvider"]),
+        )
+        self.model_path = str(model_path)
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        batch, _, height, width = model_input.shape
+        # 고정 배치(정수) 그래프는 그 크기씩 나눠 실행, 동적 배치는 한 번에 실행
+        self.max_batch = batch if isinstance(batch, int) else None
+        self.input_size = height if isinstance(height, int) and height == width else None
+        self.names = self._read_names()
+        logger.info(
+            f"ONNX 모델 로드: {model_path} (입력 {model_input.shape}, "
+            f"{self.session.get_providers()[0]})"
+        )
+
+    def _read_names(self) -> Dict[int, str]:
+        """ultralytics 내보내기 메타데이터의 클래스 이름 (없으면 빈 dict)"""
+        meta = self.session.get_modelmeta().custom_metadata_map
+        try:
+            return ast.literal_eval(meta.get("names", "{}"))
+        except (ValueError, SyntaxError):
+            return {}
+
+    def infer(
+        self,
+        frames: List[np.ndarray],
+        imgsz: int,
+        conf: float,
+        iou: float,
+        max_det: int,
+    ) -> List[np.ndarray]:
+        """
+        BGR 프레임 묶음 추론
+
+        Returns:
+            프레임별 (N, 6) 배열 [x1, y1, x2, y2, conf, cls] - 프레임 픽셀 좌표
+        """
+        size = self.input_size or imgsz
+        letterboxed = [letterbox(frame, size) for frame in frames]
+        batch = np.stack([img for img, _, _ in letterboxed])
+        # BGR HWC uint8 → RGB CHW float32
+        batch = np.ascontiguousarray(batch[..., ::-1].transpose(0, 3, 1, 2), dtype=np.float32)
+        batch *= 1.0 / 255
+
+        step = self.max_batch or len(frames)
+        preds = np.concatenate([
+            self.session.run(None, {self.input_name: batch[i:i + step]})[0]
+            for i in range(0, len(frames), step)
+        ])
+
+        outputs = []
+        for pred, (_, gain, pad), frame in zip(preds, letterboxed, frames):
+            boxes = decode_predictions(pred, conf, iou, max_det)
+            outputs.append(scale_boxes(boxes, gain, pad, frame.shape[:2]))
+        return outputs
+
+
+def letterbox(image: np.ndarray, size: int) -> Tuple[np.ndarray, float, Tuple[int, int]]:
+    """
+    비율 유지 리사이즈 + 중앙 패딩 (ultralytics LetterBox와 같은 반올림)
+
+    Returns:
+        (size x size BGR 이미지, 배율, (좌측 패딩, 상단 패딩))
+    """
+    h, w = image.shape[:2]
+    gain = min(size / h, size / w)
+    new_w, new_h = int(round(w * gain)), int(round(h * gain))
+    dw, dh = (size - new_w) / 2, (size - new_h) / 2
+    left, top = int(round(dw - 0.1)), int(round(dh - 0.1))
+
+    canvas = np.full((size, size, 3), 114, dtype=np.uint8)
+    if (new_w, new_h) != (w, h):
+        image = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    canvas[top:top + new_h, left:left + new_w] = image
+    return canvas, gain, (left, top)
+
+
+def decode_predictions(
+    pred: np.ndarray, conf: float, iou: float, max_det: int, max_nms: int = MAX_NMS
+) -> np.ndarray:
+    """
+    YOLOv8 원시 출력 (4 + nc, N) → (M, 6) [x1, y1, x2, y2, conf, cls]
+
+    신뢰도 필터 → 점수 상위 max_nms개 → cxcywh를 xyxy로 변환 → 클래스별 NMS (모두 배열 연산)
+    """
+    pred = pred.T  # (N, 4 + nc)
+    scores = pred[:, 4:]
+    cls = scores.argmax(axis=1)
+    best = scores[np.arange(len(scores)), cls]
+    mask = best > conf
+    if not mask.any():
+        return np.empty((0, 6), dtype=np.float32)
+
+    xywh, best, cls = pred[mask, :4], best[mask], cls[mask]
+    if len(best) > max_nms:
+        # 낮은 신뢰도 임계값에서도 NMS 비용이 앵커 수 (1280px: 33.6k)에 묶이지 않게
+        top = np.argpartition(-best, max_nms)[:max_nms]
+        xywh, best, cls = xywh[top], best[top], cls[top]
+    boxes = np.empty((len(best), 6), dtype=np.float32)
+    boxes[:, :2] = xywh[:, :2] - xywh[:, 2:] / 2
+    boxes[:, 2:4] = xywh[:, :2] + xywh[:, 2:] / 2
+    boxes[:, 4] = best
+    boxes[:, 5] = cls
+
+    keep = non_max_suppression(boxes[:, :4], boxes[:, 4], boxes[:, 5], threshold=iou)
+    return boxes[keep[:max_det]]
+
+
+def scale_boxes(
+    boxes: np.ndarray, gain: float, pad: Tuple[int, int], shape: Tuple[int, int]
+) -> np.ndarray:
+    """레터박스 좌표 → 원본 프레임 좌표 (패딩 제거 후 배율 역산, 프레임 범위로 자르기)"""
+    h, w = shape
+    boxes[:, [0, 2]] = ((boxes[:, [0, 2]] - pad[0]) / gain).clip(0, w)
+    boxes[:, [1, 3]] = ((boxes[:, [1, 3]] - pad[1]) / gain).clip(0, h)
+    return boxes
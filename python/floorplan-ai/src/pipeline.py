@@ -3,25 +3,48 @@
 전체 인식 파이프라인을 단일 인터페이스로 실행
 """
 
+import queue
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import yaml
 import numpy as np
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from loguru import logger
 
+from .buffer_pool import BufferPool
 from .preprocessor import FloorPlanPreprocessor
-from .symbol_detector import SymbolDetector
+from .symbol_detector import DetectionSet, SymbolDetector
+from .symbol_snapper import SymbolSnapper
 from .text_recognizer import TextRecognizer
 from .wall_extractor import WallExtractor
 from .vectorizer import FloorPlanVectorizer
 
 
+def _shift_bbox(bbox: tuple, dx: float, dy: float, scale: float = 1.0) -> tuple:
+    """(x1, y1, x2, y2) 바운딩박스 평행이동 후 배율 적용"""
+    x1, y1, x2, y2 = bbox
+    return ((x1 + dx) * scale, (y1 + dy) * scale, (x2 + dx) * scale, (y2 + dy) * scale)
+
+
 class FloorPlanPipeline:
     """InPick 평면도 인식 파이프라인"""
 
     def __init__(self, config_path: str = "configs/pipeline_config.yaml"):
         self.config = self._load_config(config_path)
+        # 다중 페이지 문서: 인식 중 미리 렌더링해 둘 페이지 수 (메모리 상한)
+        self.prefetch_pages = max(1, self.config.get("pipeline", {}).get("prefetch_pages", 2))
+        # 심볼 감지를 배치로 묶어 처리할 페이지 수 (동시에 메모리에 올라오는 페이지 수)
+        self.batch_pages = max(1, self.config.get("pipeline", {}).get("batch_pages", 4))
+        # 감지 결과 시각화 PNG: 요청 시에만 렌더링 (축소 해상도, 백그라운드 인코딩)
+        vis_cfg = self.config.get("pipeline", {}).get("visualization", {})
+        self.visualize = vis_cfg.get("enabled", False)
+        self.vis_max_size = vis_cfg.get("max_size", 2048)  # 0 = 원본 해상도
+        self.vis_background = vis_cfg.get("background", True)
+        self._vis_executor: Optional[ThreadPoolExecutor] = None
+        self._vis_pending: Dict[str, Future] = {}  # 출력 경로 → 렌더링 작업
         self._init_stages()
         logger.info("파이프라인 초기화 완료")
 
@@ -60,10 +83,19 @@ class FloorPlanPipeline:
 
     def _init_stages(self) -> None:
         """각 Stage 모듈 초기화"""
-        self.preprocessor = FloorPlanPreprocessor(self.config.get("preprocessor", {}))
+        # 요청 간 중간 배열 재사용 (전처리 + 벽 추출 공용)
+        self.buffer_pool = BufferPool.from_dict(
+            self.config.get("pipeline", {}).get("buffer_pool", {})
+        )
+        self.preprocessor = FloorPlanPreprocessor(
+            self.config.get("preprocessor", {}), pool=self.buffer_pool
+        )
         self.symbol_detector = SymbolDetector(self.config.get("symbol_detector", {}))
         self.text_recognizer = TextRecognizer(self.config.get("text_recognizer", {}))
-        self.wall_extractor = WallExtractor(self.config.get("wall_extractor", {}))
+        self.wall_extractor = WallExtractor(
+            self.config.get("wall_extractor", {}), pool=self.buffer_pool
+        )
+        self.symbol_snapper = SymbolSnapper(self.config.get("symbol_snapper", {}))
         self.vectorizer = FloorPlanVectorizer(self.config.get("vectorizer", {}))
 
     def run(
@@ -71,6 +103,9 @@ class FloorPlanPipeline:
         image_path: Optional[str] = None,
         image: Optional[np.ndarray] = None,
         output_dir: str = "outputs",
+        base_name: Optional[str] = None,
+        source_info: Optional[Dict] = None,
+        visualize: Optional[bool] = None,
     ) -> Dict:
         """
         전체 파이프라인 실행
@@ -79,48 +114,127 @@ class FloorPlanPipeline:
             image_path: 이미지 파일 경로 (PDF 포함)
             image: BGR numpy 이미지 (직접 전달 시)
             output_dir: 결과물 저장 디렉토리
+            base_name: 출력 파일 이름 (기본: 입력 파일명)
+            source_info: image의 원본 해상도 정보 (decode_image 반환값)
+            visualize: 감지 결과 시각화 PNG 저장 여부 (기본: pipeline.visualization.enabled)
 
         Returns:
             dict: {
                 "vector_data": 벡터화된 구조 데이터,
                 "svg_path": SVG 파일 경로,
                 "json_path": JSON 파일 경로,
-                "vis_path": 시각화 이미지 경로,
-                "timing": 각 단계별 소요 시간,
+                "vis_path": 시각화 이미지 경로 (visualize가 꺼져 있으면 None),
+                "timing": 각 단계별 소요 시간 (preprocess는 감지/OCR 입력 생성 포함),
+                "memory": 전처리 산출물 메모리 사용량 (bytes),
             }
         """
-        total_start = time.time()
-        timings = {}
-
-        # 출력 디렉토리 생성
-        out = Path(output_dir)
-        out.mkdir(parents=True, exist_ok=True)
-
         # === 이미지 로드 ===
         if image is None:
             if image_path is None:
                 raise ValueError("image_path 또는 image 중 하나를 제공해야 합니다")
-            image = self.preprocessor.load_image(image_path)
-        logger.info(f"입력 이미지: {image.shape[:2]}")
+            image, source_info = self.preprocessor.load_page(image_path)
+        if base_name is None:
+            base_name = Path(image_path).stem if image_path else "floorplan"
+
+        return self.run_batch([(image, source_info, base_name)], output_dir, visualize)[0]
+
+    def run_batch(
+        self,
+        pages: Sequence[Tuple[np.ndarray, Optional[Dict], str]],
+        output_dir: str = "outputs",
+        visualize: Optional[bool] = None,
+    ) -> List[Dict]:
+        """
+        여러 이미지를 한 번에 실행 - 심볼 감지는 detect_batch로 묶어 추론
+
+        Args:
+            pages: (BGR 이미지, 원본 해상도 정보, 출력 파일 이름) 리스트
+            output_dir: 결과물 저장 디렉토리
+            visualize: 감지 결과 시각화 PNG 저장 여부 (기본: pipeline.visualization.enabled)
+
+        Returns:
+            이미지별 run() 결과 리스트 (입력 순서 유지)
+        """
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        if visualize is None:
+            visualize = self.visualize
 
         # === Stage 1: 전처리 ===
+        # 산출물은 지연 계산이므로 감지/OCR 입력은 여기서 만들어 전처리 시간에 포함
+        # (벽 추출용 for_wall은 벽 추출 시간에 포함)
+        products = self._preprocess_products()
+        prepared = []
+        for image, source_info, _ in pages:
+            logger.info(f"입력 이미지: {image.shape[:2]}")
+            t = time.time()
+            preprocessed = self.preprocessor.process(image, source_info=source_info)
+            for key in products:
+                preprocessed[key]
+            prepared.append((preprocessed, time.time() - t))
+
+        # === Stage 2: 심볼 감지 (YOLOv8, 레터박스 프레임을 배치 추론) ===
         t = time.time()
-        preprocessed = self.preprocessor.process(image)
-        timings["preprocess"] = round(time.time() - t, 3)
+        detections = self._detect([p for p, _ in prepared])
+        # 배치 추론 시간은 페이지 수로 나눠 기록
+        detect_time = (time.time() - t) / max(1, len(pages))
 
-        # === Stage 2: 심볼 감지 (YOLOv8) ===
+        # === Stage 3: 텍스트 인식 (OCR, 페이지들의 텍스트 후보를 모자이크로 묶어 인식) ===
+        # 텍스트 후보 추출은 벽 추출과 같은 이진 이미지 사용 (캐시 공유)
         t = time.time()
-        detections = self.symbol_detector.detect(
-            preprocessed["original"],
-            scale_info=preprocessed["scale_info"],
+        text_results = self.text_recognizer.recognize_batch(
+            [p["for_ocr"] for p, _ in prepared],
+            [p["binary"] for p, _ in prepared],
         )
-        timings["symbol_detection"] = round(time.time() - t, 3)
+        ocr_time = (time.time() - t) / max(1, len(pages))
 
-        # === Stage 3: 텍스트 인식 (OCR) ===
-        t = time.time()
-        text_blocks = self.text_recognizer.recognize(preprocessed["for_ocr"])
+        results = []
+        for (_, _, base_name), (preprocessed, preprocess_time), page_detections, text_blocks in zip(
+            pages, prepared, detections, text_results
+        ):
+            timings = {
+                "preprocess": round(preprocess_time, 3),
+                "symbol_detection": round(detect_time, 3),
+                "text_recognition": round(ocr_time, 3),
+            }
+            results.append(self._complete(
+                preprocessed, page_detections, text_blocks, out, base_name, timings,
+                elapsed=preprocess_time + detect_time + ocr_time, visualize=visualize,
+            ))
+        return results
+
+    def _preprocess_products(self) -> Tuple[str, ...]:
+        """심볼 감지/OCR이 읽는 전처리 산출물 - 슬라이스/캐스케이드 모드는 원본 해상도에서 감지"""
+        detector = self.symbol_detector
+        detection = ("original",) if detector.slicing or detector.cascade else ("for_yolo",)
+        return detection + ("scale_info", "binary", "for_ocr")
+
+    def _detect(self, prepared: List) -> List[DetectionSet]:
+        """전처리 결과별 심볼 감지 - 슬라이스/캐스케이드 모드는 원본 해상도에서 감지"""
+        detector = self.symbol_detector
+        if detector.slicing:
+            return [detector.detect_sliced(p["original"]) for p in prepared]
+        if detector.cascade:
+            return [detector.detect_cascade(p["original"]) for p in prepared]
+        return detector.detect_batch(
+            [p["for_yolo"] for p in prepared],
+            [p["scale_info"] for p in prepared],
+        )
+
+    def _complete(
+        self,
+        preprocessed,
+        detections: DetectionSet,
+        text_blocks: List,
+        out: Path,
+        base_name: str,
+        timings: Dict,
+        elapsed: float,
+        visualize: bool = False,
+    ) -> Dict:
+        """감지/OCR 이후 단계 (벽 추출 → 벡터화 → 출력) 실행"""
+        total_start = time.time() - elapsed
         dimensions = self.text_recognizer.extract_dimensions(text_blocks)
-        timings["text_recognition"] = round(time.time() - t, 3)
 
         # === Stage 4: 벽 추출 ===
         t = time.time()
@@ -129,31 +243,39 @@ class FloorPlanPipeline:
         rooms = wall_data["rooms"]
         timings["wall_extraction"] = round(time.time() - t, 3)
 
+        # === 후처리: 문/창문 → 벽 스냅 ===
+        t = time.time()
+        snaps = self.symbol_snapper.snap(detections, walls)
+        timings["symbol_snapping"] = round(time.time() - t, 3)
+
         # === Stage 5: 벡터화 ===
         t = time.time()
-        original_size = preprocessed["scale_info"]["original_size"]
+        scale_info = preprocessed["scale_info"]
         vector_data = self.vectorizer.vectorize(
             walls=walls,
             rooms=rooms,
             symbols=detections,
             texts=text_blocks,
             dimensions=dimensions,
-            image_size=original_size,
+            image_size=scale_info["page_size"],
+            offset=scale_info["roi"][:2],
+            snaps=snaps,
+            input_scale=scale_info["working_scale"],
         )
+        # 감지에 사용한 모델 버전 (model_registry) - 재학습 모델 교체 후 결과 추적용
+        model_version = detections.model_version
+        vector_data["model_version"] = model_version
         timings["vectorization"] = round(time.time() - t, 3)
 
         # === 출력 파일 생성 ===
-        base_name = Path(image_path).stem if image_path else "floorplan"
-
         svg_path = str(out / f"{base_name}.svg")
         json_path = str(out / f"{base_name}.json")
-        vis_path = str(out / f"{base_name}_detected.png")
-
         self.vectorizer.to_svg(vector_data, svg_path)
         self.vectorizer.to_json(vector_data, json_path)
-        self.symbol_detector.export_results_image(
-            preprocessed["original"], detections, vis_path
-        )
+        vis_path = None
+        if visualize:
+            vis_path = str(out / f"{base_name}_detected.png")
+            self._render_visualization(preprocessed["original"], detections, vis_path)
 
         timings["total"] = round(time.time() - total_start, 3)
 
@@ -165,6 +287,11 @@ class FloorPlanPipeline:
         logger.info(f"  벽 선분: {len(walls)}개")
         logger.info(f"  방 영역: {len(rooms)}개")
         logger.info(f"  총 소요시간: {timings['total']}초")
+        memory = preprocessed.memory_stats
+        preprocessed.release()
+        memory["buffer_pool"] = self.buffer_pool.stats()
+        logger.info(f"  최대 메모리: {memory['peak_bytes'] / 1024 / 1024:.1f}MB")
+        logger.info(f"  버퍼 풀 적중률: {memory['buffer_pool']['hit_rate']:.1%}")
         logger.info("=" * 50)
 
         return {
@@ -172,7 +299,9 @@ class FloorPlanPipeline:
             "svg_path": svg_path,
             "json_path": json_path,
             "vis_path": vis_path,
+            "model_version": model_version,
             "timing": timings,
+            "memory": memory,
             "summary": {
                 "symbols": len(detections),
                 "texts": len(text_blocks),
@@ -181,19 +310,174 @@ class FloorPlanPipeline:
             },
         }
 
-    def run_quick(self, image_path: str) -> Dict:
-        """빠른 실행 (벽 추출 생략, 심볼+OCR만)"""
-        image = self.preprocessor.load_image(image_path)
-        preprocessed = self.preprocessor.process(image)
+    def _render_visualization(self, image: np.ndarray, detections: DetectionSet, path: str) -> None:
+        """
+        감지 결과 시각화 저장 - background면 전용 스레드에서 그리기/PNG 인코딩
 
-        detections = self.symbol_detector.detect(
-            preprocessed["original"],
-            preprocessed["scale_info"],
+        image는 전처리 원본 (버퍼 풀 소유가 아님)이라 release() 뒤에도 안전하게 읽을 수 있다.
+        """
+        render = self.symbol_detector.export_results_image
+        if not self.vis_background:
+            render(image, detections, path, max_size=self.vis_max_size)
+            return
+        if self._vis_executor is None:
+            self._vis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vis-render")
+        self._vis_pending = {k: f for k, f in self._vis_pending.items() if not f.done()}
+        self._vis_pending[path] = self._vis_executor.submit(
+            render, image, detections, path, max_size=self.vis_max_size
         )
+
+    def visualization_pending(self, path: str) -> bool:
+        """시각화가 아직 렌더링 중인지 (API 조회 시 미완성 파일 반환 방지)"""
+        future = self._vis_pending.get(path)
+        return future is not None and not future.done()
+
+    def wait_visualizations(self, timeout: Optional[float] = None) -> None:
+        """백그라운드 시각화 렌더링 완료 대기 (CLI 종료 전 등)"""
+        pending, self._vis_pending = self._vis_pending, {}
+        for future in pending.values():
+            future.result(timeout=timeout)
+
+    def run_document(
+        self, document_path: str, output_dir: str = "outputs", visualize: Optional[bool] = None
+    ) -> Dict:
+        """
+        다중 페이지 문서(PDF) 전체 실행
+
+        렌더링 스레드가 다음 페이지를 미리 렌더링하는 동안 현재 페이지를 인식한다.
+        대기 큐가 prefetch_pages로 제한되므로 메모리에는 몇 페이지만 상주하고,
+        전체 소요시간은 두 단계의 합이 아니라 느린 단계에 수렴한다.
+        인식은 batch_pages 페이지씩 run_batch()로 묶어 심볼 감지를 배치 추론한다.
+
+        Returns:
+            dict: {"pages": 페이지별 run() 결과, "timing": {...}, "summary": {...}}
+        """
+        total_start = time.time()
+        stem = Path(document_path).stem
+        pages: queue.Queue = queue.Queue(maxsize=self.prefetch_pages)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            # 소비자가 중단되면 블로킹 없이 종료
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def render() -> None:
+            try:
+                for page in self.preprocessor.load_pages(document_path):
+                    if not put(page):
+                        return
+            except Exception as e:  # 소비자 쪽에서 다시 발생
+                put(e)
+                return
+            put(done)
+
+        renderer = threading.Thread(target=render, name="pdf-render", daemon=True)
+        renderer.start()
+
+        results = []
+        render_wait = 0.0
+        finished = False
+        try:
+            while not finished:
+                # batch_pages 페이지를 모아 심볼 감지를 한 번에 추론
+                batch = []
+                while len(batch) < self.batch_pages:
+                    t = time.time()
+                    item = pages.get()
+                    render_wait += time.time() - t
+                    if item is done:
+                        finished = True
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    page, source_info = item
+                    page_no = len(results) + len(batch) + 1
+                    batch.append((page, source_info, f"{stem}_p{page_no:03d}"))
+                    del item, page  # 배치만 참조 유지
+                if not batch:
+                    break
+
+                first = len(results) + 1
+                logger.info(f"페이지 {first}-{first + len(batch) - 1} 인식 시작")
+                for result in self.run_batch(batch, output_dir=output_dir, visualize=visualize):
+                    result["page"] = len(results) + 1
+                    results.append(result)
+                del batch  # 다음 배치 대기 전 참조 해제
+        finally:
+            stop.set()
+            renderer.join()
+
+        timings = {
+            "render_wait": round(render_wait, 3),
+            "total": round(time.time() - total_start, 3),
+        }
+        logger.info(f"문서 처리 완료 - {len(results)}페이지, {timings['total']}초")
+        return {
+            "pages": results,
+            "timing": timings,
+            "summary": {
+                "pages": len(results),
+                **{
+                    key: sum(r["summary"][key] for r in results)
+                    for key in ("symbols", "texts", "walls", "rooms")
+                },
+            },
+        }
+
+    def run_files(
+        self, paths: Sequence[str], output_dir: str = "outputs", visualize: Optional[bool] = None
+    ) -> List[Dict]:
+        """
+        여러 이미지 파일 실행 (각 파일의 첫 페이지) - batch_pages 장씩 묶어 run_batch()
+
+        Returns:
+            파일별 run() 결과 리스트 (입력 순서 유지)
+        """
+        results = []
+        for i in range(0, len(paths), self.batch_pages):
+            batch = []
+            for path in paths[i:i + self.batch_pages]:
+                image, source_info = self.preprocessor.load_page(path)
+                batch.append((image, source_info, Path(path).stem))
+            results.extend(self.run_batch(batch, output_dir=output_dir, visualize=visualize))
+        return results
+
+    def run_quick(
+        self,
+        image_path: Optional[str] = None,
+        image: Optional[np.ndarray] = None,
+        source_info: Optional[Dict] = None,
+    ) -> Dict:
+        """빠른 실행 (벽 추출 생략, 심볼+OCR만)"""
+        if image is None:
+            if image_path is None:
+                raise ValueError("image_path 또는 image 중 하나를 제공해야 합니다")
+            image, source_info = self.preprocessor.load_page(image_path)
+        # 이진화/기울기 보정은 벽 추출에만 필요하므로 생략
+        preprocessed = self.preprocessor.process(image, deskew=False, source_info=source_info)
+
+        detections = self._detect([preprocessed])[0]
         text_blocks = self.text_recognizer.recognize(preprocessed["for_ocr"])
 
+        # 도면 영역 크롭 좌표 → 페이지 좌표 (메모리 예산으로 축소했으면 원래 해상도로 복원)
+        scale_info = preprocessed["scale_info"]
+        dx, dy = scale_info["roi"][:2]
+        k = 1.0 / scale_info["working_scale"]
+        preprocessed.release()
+        if dx or dy or k != 1.0:
+            detections = detections.translate(dx, dy).scale(k)
+            text_blocks = [replace(t, bbox=_shift_bbox(t.bbox, dx, dy, k)) for t in text_blocks]
+
         return {
-            "symbols": [d.to_dict() for d in detections],
+            "model_version": detections.model_version,
+            "symbols": detections.to_dicts(),
             "texts": [t.to_dict() for t in text_blocks],
             "rooms_from_text": self.text_recognizer.extract_rooms(text_blocks),
             "dimensions": self.text_recognizer.extract_dimensions(text_blocks),
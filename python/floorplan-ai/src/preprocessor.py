@@ -3,191 +3,975 @@
 평면도 이미지를 YOLOv8 및 각 Stage에 최적화된 형태로 변환
 """
 
+import io
+import math
+
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import Tuple, Optional
+from functools import cached_property
+from typing import Callable, Iterator, Optional, Sequence, Tuple
 from loguru import logger
 
+from .buffer_pool import NULL_POOL, BufferPool
+from .tiling import TilingConfig, map_tiles
+
+
+# 노이즈 제거 엔진
+DENOISE_ENGINES = ("nlm", "nlm_downsampled", "median", "bilateral", "none")
+
+# 전처리 + 벽 추출 작업 세트의 픽셀당 바이트 추정치
+# (BGR 3 + gray/enhanced/denoised/binary 4 + 거리변환 float32 4 + 형태학 임시 3)
+BYTES_PER_PIXEL = 14
+
+# 색상 레이어 라벨 (0 = 배경/미분류)
+COLOR_LAYERS = {"walls": 1, "dimensions": 2, "annotation": 3}
+_CHANNEL_INDEX = {"blue": 0, "green": 1, "red": 2}
+
+# 축소 디코딩 배율 → imread 플래그 (JPEG는 디코더 단계에서 1/2, 1/4, 1/8 축소)
+REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
 
 class FloorPlanPreprocessor:
     """평면도 이미지 전처리기"""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, pool: Optional[BufferPool] = None):
         self.target_size = config.get("target_size", 1280)
         self.binarize_threshold = config.get("binarize_threshold", 127)
         self.denoise_kernel = config.get("denoise_kernel", 3)
+        self.denoise_engine = config.get("denoise_engine", "nlm")
+        self.denoise_strength = config.get("denoise_strength", 10)
+        self.denoise_scale = config.get("denoise_scale", 0.5)
+        if self.denoise_engine not in DENOISE_ENGINES:
+            raise ValueError(
+                f"지원하지 않는 denoise_engine: {self.denoise_engine} "
+                f"(가능: {', '.join(DENOISE_ENGINES)})"
+            )
+        # 1 이상이면 nlm_downsampled가 전체 해상도 NLM (느린 경로)이 되므로 거부
+        if not 0 < self.denoise_scale < 1:
+            raise ValueError(f"denoise_scale은 (0, 1) 범위여야 합니다: {self.denoise_scale}")
         self.deskew = config.get("deskew", True)
+        self.detect_orientation = config.get("detect_orientation", False)
+        # PDF 렌더링 해상도: 벽 디테일 DPI 상한 + 최대 픽셀 수 + 도면 영역 클립 (pt)
+        self.render_dpi = config.get("render_dpi", 300)
+        self.render_max_pixels = config.get("render_max_pixels", 20_000_000)
+        self.render_clip = config.get("render_clip")
+        # 요청당 메모리 예산 (MB, None이면 무제한) - 초과 시 작업 해상도 하향
+        self.memory_budget_mb = config.get("memory_budget_mb")
+        # 대형 스캔 타일 처리 (노이즈 제거 + 이진화를 겹치는 타일 단위로 병렬 실행)
+        self.tiling = TilingConfig.from_dict(config.get("tiling", {}))
+        self.skew_max_size = config.get("skew_max_size", 1024)
+        # 도면 영역(ROI) 자동 크롭 - 여백/표제란/범례 제외 후 모든 Stage 처리
+        self.roi_crop = config.get("roi_crop", False)
+        self.roi_margin = config.get("roi_margin", 0.02)
+        self.roi_max_size = config.get("roi_max_size", 1024)
+        # 가장 큰 도면 대비 이 비율 이상의 잉크를 가진 성분은 모두 도면 영역에 포함 (여러 세대 평면도)
+        self.roi_min_fraction = config.get("roi_min_fraction", 0.25)
+        if not 0 < self.roi_min_fraction <= 1:
+            raise ValueError(f"roi_min_fraction은 (0, 1] 범위여야 합니다: {self.roi_min_fraction}")
+        # 색상 레이어 분리 (컬러 CAD 출력: 검정 벽 / 빨강 치수 / 기타 색상 주석)
+        layers = config.get("color_layers", {})
+        self.color_layers = layers.get("enabled", False)
+        self.layer_min_chroma = layers.get("min_chroma", 60)
+        self.layer_wall_max_value = layers.get("wall_max_value", 120)
+        self.layer_dimension_color = layers.get("dimension_color", "red")
+        self.layer_text_layers = tuple(layers.get("text_layers", ("dimensions", "annotation")))
+        if self.layer_dimension_color not in _CHANNEL_INDEX:
+            raise ValueError(
+                f"지원하지 않는 dimension_color: {self.layer_dimension_color} "
+                f"(가능: {', '.join(_CHANNEL_INDEX)})"
+            )
+        unknown = set(self.layer_text_layers) - set(COLOR_LAYERS)
+        if unknown:
+            raise ValueError(f"알 수 없는 text_layers: {sorted(unknown)}")
         self.enhance_contrast = config.get("enhance_contrast", True)
+        # 중간 배열 버퍼 풀 (서버에서 요청 간 재사용)
+        self.pool = pool or NULL_POOL
 
-    def process(self, image: np.ndarray) -> dict:
+    def process(
+        self,
+        image: np.ndarray,
+        deskew: Optional[bool] = None,
+        source_info: Optional[dict] = None,
+    ) -> "PreprocessResult":
         """
-        전처리 파이프라인 실행
+        전처리 파이프라인 실행 (지연 계산)
+
+        각 산출물은 처음 읽을 때 계산되어 저장되므로, 사용하지 않는
+        산출물(예: 빠른 모드의 이진화/기울기 보정)은 비용이 들지 않는다.
 
         Args:
             image: BGR 원본 이미지
+            deskew: 기울기 보정 여부 (None이면 설정값 사용)
+            source_info: load_page/decode_image가 반환한 원본 해상도 정보
 
         Returns:
-            dict: {
-                "original": 원본 이미지,
+            PreprocessResult: dict 스타일 접근 지원 {
+                "original": 원본 이미지 (기울기 보정 적용),
                 "gray": 그레이스케일,
                 "binary": 이진화 이미지,
                 "enhanced": 대비 강화 이미지,
                 "for_yolo": YOLO 입력용 이미지,
-                "for_ocr": OCR 입력용 이미지,
-                "for_wall": 벽 추출용 이미지,
+                "for_ocr": OCR 입력용 이미지 (색상 레이어 사용 시 텍스트 레이어만),
+                "for_wall": 벽 추출용 이미지 (색상 레이어 사용 시 치수/주석 제외),
+                "color_layers": 색상 레이어 라벨 맵 (비활성화 시 None),
                 "scale_info": 크기 정보
             }
         """
-        logger.info(f"전처리 시작 - 원본 크기: {image.shape[:2]}")
-
-        results = {"original": image.copy()}
-
-        # 1. 그레이스케일 변환
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        results["gray"] = gray
-
-        # 2. 대비 강화 (CLAHE)
-        if self.enhance_contrast:
-            enhanced = self._enhance_contrast(gray)
-        else:
-            enhanced = gray.copy()
-        results["enhanced"] = enhanced
-
-        # 3. 노이즈 제거
-        denoised = cv2.fastNlMeansDenoising(
-            enhanced, None, h=10, templateWindowSize=7, searchWindowSize=21
+        logger.info(f"전처리 준비 - 원본 크기: {image.shape[:2]}")
+        return PreprocessResult(
+            self, image, self.deskew if deskew is None else deskew, source_info
         )
 
-        # 4. 이진화 (Adaptive Threshold - 도면에 적합)
+    def _binarize(self, denoised: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """Adaptive Threshold 이진화 + 소규모 노이즈 제거 (dst가 있으면 그 버퍼에 기록)"""
         binary = cv2.adaptiveThreshold(
             denoised, 255,
             cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
             cv2.THRESH_BINARY_INV,
             blockSize=11,
-            C=2
+            C=2,
+            dst=dst,
         )
 
-        # 소규모 노이즈 제거
         kernel = np.ones((self.denoise_kernel, self.denoise_kernel), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=1)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel, iterations=1)
-        results["binary"] = binary
-
-        # 5. 기울기 보정
-        if self.deskew:
-            angle = self._detect_skew(binary)
-            if abs(angle) > 0.5:
-                logger.info(f"기울기 감지: {angle:.2f}° → 보정 적용")
-                image = self._rotate_image(image, angle)
-                gray = self._rotate_image(gray, angle)
-                binary = self._rotate_image(binary, angle)
-                results["original"] = image
-                results["gray"] = gray
-                results["binary"] = binary
-
-        # 6. YOLO 입력용 (리사이즈, BGR 유지)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, dst=binary, iterations=1)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel, dst=binary, iterations=1)
+        return binary
+
+    def _letterbox(self, image: np.ndarray) -> Tuple[np.ndarray, float, Tuple[int, int]]:
+        """YOLO 입력용 리사이즈 + 정사각형 패딩 (우측/하단)"""
         h, w = image.shape[:2]
         scale = self.target_size / max(h, w)
         new_w, new_h = int(w * scale), int(h * scale)
-        yolo_img = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
 
-        # YOLO는 정사각형 패딩 필요
         pad_w = self.target_size - new_w
         pad_h = self.target_size - new_h
-        yolo_img = cv2.copyMakeBorder(
-            yolo_img, 0, pad_h, 0, pad_w,
+        padded = cv2.copyMakeBorder(
+            resized, 0, pad_h, 0, pad_w,
             cv2.BORDER_CONSTANT, value=(114, 114, 114)
         )
-        results["for_yolo"] = yolo_img
+        return padded, scale, (pad_w, pad_h)
 
-        # 7. OCR 입력용 (그레이스케일, 대비 강화)
-        results["for_ocr"] = enhanced
+    def _enhance_contrast(self, gray: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """CLAHE 기반 대비 강화"""
+        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        return clahe.apply(gray, dst=dst)
 
-        # 8. 벽 추출용 (이진화 이미지)
-        results["for_wall"] = binary
+    def _separate_layers(self, image: np.ndarray) -> np.ndarray:
+        """
+        BGR 이미지 → 색상 레이어 라벨 맵 (uint8, COLOR_LAYERS 값)
 
-        # 9. 스케일 정보
-        results["scale_info"] = {
-            "original_size": (w, h),
-            "yolo_size": (self.target_size, self.target_size),
-            "scale_factor": scale,
-            "pad": (pad_w, pad_h)
-        }
+        채널 최대/최소값만으로 한 번에 분류한다 (HSV 변환 없음).
+        - walls: 어둡고 무채색인 픽셀
+        - dimensions: 유채색 중 dimension_color 채널이 가장 강한 픽셀
+        - annotation: 나머지 유채색 픽셀 (가구, 색상 문자 등)
+        """
+        channels = cv2.split(image)
+        max_c = cv2.max(cv2.max(channels[0], channels[1]), channels[2])
+        min_c = cv2.min(cv2.min(channels[0], channels[1]), channels[2])
+        colored = cv2.subtract(max_c, min_c) >= self.layer_min_chroma
+        dimensions = colored & (channels[_CHANNEL_INDEX[self.layer_dimension_color]] == max_c)
 
-        logger.info(f"전처리 완료 - YOLO 입력: {self.target_size}x{self.target_size}")
-        return results
+        labels = np.zeros(image.shape[:2], dtype=np.uint8)
+        labels[~colored & (max_c <= self.layer_wall_max_value)] = COLOR_LAYERS["walls"]
+        labels[dimensions] = COLOR_LAYERS["dimensions"]
+        labels[colored & ~dimensions] = COLOR_LAYERS["annotation"]
+        return labels
 
-    def _enhance_contrast(self, gray: np.ndarray) -> np.ndarray:
-        """CLAHE 기반 대비 강화"""
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        return clahe.apply(gray)
+    @staticmethod
+    def _layer_lut(
+        layers: Sequence[str], inside: int, outside: int, background: int = 0
+    ) -> np.ndarray:
+        """라벨 → 마스크 값 LUT (layers에 속하면 inside, 다른 레이어는 outside)"""
+        lut = np.full(256, background, dtype=np.uint8)
+        for name, label in COLOR_LAYERS.items():
+            lut[label] = inside if name in layers else outside
+        return lut
+
+    def _denoise(self, gray: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        설정된 엔진으로 노이즈 제거 (dst가 있으면 그 버퍼에 기록, none은 입력 그대로)
+
+        - nlm: 원본 해상도 Non-Local Means (가장 느림, 기준 품질)
+        - nlm_downsampled: 축소본에 NLM 적용 후 원본 크기로 업샘플
+        - median: 메디안 필터 (점 노이즈에 강함, 가장 빠름)
+        - bilateral: 양방향 필터 (엣지 보존)
+        - none: 노이즈 제거 생략
+        """
+        engine = self.denoise_engine
+        if engine == "none":
+            return gray
+
+        if engine == "median":
+            ksize = self.denoise_kernel | 1  # 홀수 커널만 허용
+            return cv2.medianBlur(gray, ksize, dst=dst)
+
+        if engine == "bilateral":
+            return cv2.bilateralFilter(gray, d=5, sigmaColor=50, sigmaSpace=5, dst=dst)
+
+        if engine == "nlm_downsampled":
+            h, w = gray.shape[:2]
+            small = cv2.resize(
+                gray, (max(1, int(w * self.denoise_scale)), max(1, int(h * self.denoise_scale))),
+                interpolation=cv2.INTER_AREA,
+            )
+            small = cv2.fastNlMeansDenoising(
+                small, None, h=self.denoise_strength,
+                templateWindowSize=7, searchWindowSize=21,
+            )
+            return cv2.resize(small, (w, h), dst=dst, interpolation=cv2.INTER_LINEAR)
+
+        return cv2.fastNlMeansDenoising(
+            gray, dst, h=self.denoise_strength,
+            templateWindowSize=7, searchWindowSize=21,
+        )
+
+    def _estimate_alignment(self, image: np.ndarray) -> Tuple[int, float]:
+        """
+        축소 이미지에서 페이지 방향 + 기울기 추정
+
+        Returns:
+            (orientation, angle): 90° 단위 방향 보정각, 미세 기울기 보정각 (도, 반시계)
+        """
+        gray, _ = self._downsample_gray(image, self.skew_max_size)
+        orientation = self._detect_orientation(gray) if self.detect_orientation else 0
+        return orientation, self._detect_skew(gray)
+
+    @staticmethod
+    def _downsample_gray(image: np.ndarray, max_size: int) -> Tuple[np.ndarray, float]:
+        """분석용 축소 그레이스케일 이미지 + 축소 배율"""
+        h, w = image.shape[:2]
+        scale = min(1.0, max_size / max(h, w))
+        if scale < 1.0:
+            image = cv2.resize(image, (max(1, int(w * scale)), max(1, int(h * scale))),
+                               interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        return gray, scale
+
+    def _detect_drawing_area(self, image: np.ndarray) -> Tuple[int, int, int, int]:
+        """
+        도면 영역(ROI) 감지 - 여백, 표제란, 범례, 키플랜을 제외한 본 도면
+
+        축소 이진화 이미지에서 도곽선(페이지 테두리 선)을 제거하고 획을 이어붙인 뒤,
+        잉크가 가장 많은 연결 성분 대비 roi_min_fraction 이상인 성분들의 합집합 외접 사각형을
+        도면 영역으로 본다 (한 장에 여러 평면도가 있으면 모두 포함, 작은 표제란/범례는 제외).
+
+        Returns:
+            (x, y, w, h): 원본 해상도 기준 도면 영역 (감지 실패 시 전체)
+        """
+        h, w = image.shape[:2]
+        full = (0, 0, w, h)
+        gray, scale = self._downsample_gray(image, self.roi_max_size)
+        sh, sw = gray.shape[:2]
+
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        n, labels, stats, _ = cv2.connectedComponentsWithStats(binary)
+        if n <= 1:
+            return full
 
-    def _detect_skew(self, binary: np.ndarray) -> float:
-        """Hough Transform으로 기울기 각도 감지"""
+        # 도곽선: 페이지 대부분에 걸쳐 있지만 속이 빈 성분
+        bw, bh = stats[1:, cv2.CC_STAT_WIDTH], stats[1:, cv2.CC_STAT_HEIGHT]
+        density = stats[1:, cv2.CC_STAT_AREA] / np.maximum(bw * bh, 1)
+        frame = ((bw > sw * 0.9) | (bh > sh * 0.9)) & (density < 0.05)
+        keep = np.ones(n, dtype=bool)
+        keep[0] = False
+        keep[1:] = ~frame
+        ink = keep[labels].astype(np.uint8) * 255
+
+        # 가까운 획 이어붙이기 (페이지 크기의 약 2%)
+        k = max(3, int(max(sh, sw) * 0.02))
+        blobs = cv2.morphologyEx(
+            ink, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (k, k))
+        )
+        n, labels, stats, _ = cv2.connectedComponentsWithStats(blobs)
+        if n <= 1:
+            return full
+
+        # 성분별 실제 잉크 픽셀 수 - 가장 큰 도면과 비슷한 규모의 성분은 모두 도면
+        ink_count = np.bincount(labels[ink > 0], minlength=n)[1:]
+        drawings = stats[1:][ink_count >= ink_count.max() * self.roi_min_fraction]
+        x, y = drawings[:, 0].min(), drawings[:, 1].min()
+        x_end = (drawings[:, 0] + drawings[:, 2]).max()
+        y_end = (drawings[:, 1] + drawings[:, 3]).max()
+
+        margin = int(max(sh, sw) * self.roi_margin)
+        x0, y0 = max(0, x - margin), max(0, y - margin)
+        x1, y1 = min(sw, x_end + margin), min(sh, y_end + margin)
+
+        # 원본 해상도로 복원
+        inv = 1.0 / scale
+        x0, y0 = int(x0 * inv), int(y0 * inv)
+        x1, y1 = min(w, int(np.ceil(x1 * inv))), min(h, int(np.ceil(y1 * inv)))
+        if (x1 - x0) * (y1 - y0) > w * h * 0.9:
+            return full
+        return x0, y0, x1 - x0, y1 - y0
+
+    def _detect_skew(self, gray: np.ndarray) -> float:
+        """축소 엣지맵에서 Hough Transform으로 기울기 각도 감지"""
+        edges = cv2.Canny(gray, 50, 150)
         lines = cv2.HoughLinesP(
-            binary, 1, np.pi / 180, threshold=100,
-            minLineLength=100, maxLineGap=10
+            edges, 1, np.pi / 360, threshold=50,
+            minLineLength=max(20, min(gray.shape[:2]) // 10), maxLineGap=5
         )
         if lines is None:
             return 0.0
 
-        angles = []
-        for line in lines:
-            x1, y1, x2, y2 = line[0]
-            angle = np.degrees(np.arctan2(y2 - y1, x2 - x1))
-            # 수평/수직에 가까운 선만 고려
-            if abs(angle) < 15 or abs(angle - 90) < 15 or abs(angle + 90) < 15:
-                if abs(angle) < 15:
-                    angles.append(angle)
-
-        if not angles:
+        seg = lines.reshape(-1, 4).astype(np.float32)
+        angles = np.degrees(np.arctan2(seg[:, 3] - seg[:, 1], seg[:, 2] - seg[:, 0]))
+        # 수직선도 수평 기준으로 접어서 함께 사용 (-45° ~ 45°)
+        angles = angles - 90 * np.round(angles / 90)
+        angles = angles[np.abs(angles) < 15]
+        if angles.size == 0:
             return 0.0
 
         return float(np.median(angles))
 
-    def _rotate_image(self, image: np.ndarray, angle: float) -> np.ndarray:
-        """이미지 회전 (크기 유지)"""
+    def _detect_orientation(self, gray: np.ndarray) -> int:
+        """
+        90° 단위 페이지 방향 추정 (보정에 필요한 반시계 회전각)
+
+        - 글자 크기 성분을 가로/세로로 이었을 때 세로 문자열이 우세하면 90°/270° 회전 페이지
+        - 표제란·범례 등 글자 밀집 영역은 보통 도면 우측·하단에 위치하므로
+          글자 분포의 무게중심이 그쪽으로 가는 방향을 선택
+        """
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        n, labels, stats, centroids = cv2.connectedComponentsWithStats(binary)
+        if n <= 1:
+            return 0
+
+        h, w = gray.shape[:2]
+        max_glyph = max(6, min(h, w) // 40)
+        cw, ch = stats[1:, cv2.CC_STAT_WIDTH], stats[1:, cv2.CC_STAT_HEIGHT]
+        glyph = (cw >= 2) & (ch >= 2) & (cw <= max_glyph) & (ch <= max_glyph)
+        if glyph.sum() < 10:
+            return 0
+
+        keep = np.zeros(n, dtype=bool)
+        keep[1:] = glyph
+        glyph_mask = keep[labels].astype(np.uint8) * 255
+
+        def count_lines(kernel_size: Tuple[int, int], horizontal: bool) -> int:
+            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, kernel_size)
+            smeared = cv2.morphologyEx(glyph_mask, cv2.MORPH_CLOSE, kernel)
+            _, _, st, _ = cv2.connectedComponentsWithStats(smeared)
+            lw, lh = st[1:, cv2.CC_STAT_WIDTH], st[1:, cv2.CC_STAT_HEIGHT]
+            return int(np.count_nonzero(lw > 3 * lh if horizontal else lh > 3 * lw))
+
+        gap = max_glyph
+        h_lines = count_lines((gap, 1), horizontal=True)
+        v_lines = count_lines((1, gap), horizontal=False)
+        vertical_text = v_lines >= 3 and v_lines > 1.5 * h_lines
+
+        # 글자 무게중심의 페이지 중심 대비 오프셋 (정규화)
+        cx, cy = centroids[1:][glyph].mean(axis=0)
+        dx, dy = (cx - w / 2) / w, (cy - h / 2) / h
+        # 반시계 회전 후 오프셋의 우측+하단 성분
+        scores = {0: dx + dy, 90: dy - dx, 180: -dx - dy, 270: dx - dy}
+
+        if vertical_text:
+            return 90 if scores[90] >= scores[270] else 270
+        # 가로 문자열이면 뚜렷하게 반대편에 몰려 있을 때만 180°
+        return 180 if scores[180] > scores[0] + 0.1 else 0
+
+    def _align_image(self, image: np.ndarray, orientation: int, angle: float) -> np.ndarray:
+        """방향 + 기울기 보정을 한 번의 변환으로 적용"""
+        if not angle:
+            rotate_codes = {
+                90: cv2.ROTATE_90_COUNTERCLOCKWISE,
+                180: cv2.ROTATE_180,
+                270: cv2.ROTATE_90_CLOCKWISE,
+            }
+            return cv2.rotate(image, rotate_codes[orientation]) if orientation else image
+
         h, w = image.shape[:2]
-        center = (w // 2, h // 2)
-        M = cv2.getRotationMatrix2D(center, angle, 1.0)
-        return cv2.warpAffine(image, M, (w, h),
+        out_w, out_h = (h, w) if orientation in (90, 270) else (w, h)
+        M = cv2.getRotationMatrix2D(((w - 1) / 2, (h - 1) / 2), orientation + angle, 1.0)
+        # 90°/270° 회전 시 출력 캔버스 중심으로 이동
+        M[0, 2] += (out_w - w) / 2
+        M[1, 2] += (out_h - h) / 2
+        return cv2.warpAffine(image, M, (out_w, out_h),
                               flags=cv2.INTER_LINEAR,
                               borderMode=cv2.BORDER_REPLICATE)
 
     @staticmethod
-    def load_image(path: str) -> np.ndarray:
-        """이미지 파일 로드 (PDF 지원 포함)"""
+    def load_image(
+        path: str,
+        dpi: float = 300,
+        max_pixels: Optional[int] = None,
+        clip: Optional[Sequence[float]] = None,
+    ) -> np.ndarray:
+        """
+        이미지 파일 로드 (PDF 지원 포함)
+
+        Args:
+            path: 이미지 또는 PDF 경로
+            dpi, max_pixels, clip: PDF 렌더링 옵션 (_render_pdf_page 참조)
+            max_pixels는 래스터 이미지 디코딩에도 적용된다 (_decode_raster 참조)
+        """
+        image, _ = FloorPlanPreprocessor._load_with_info(
+            path, dpi=dpi, max_pixels=max_pixels, clip=clip
+        )
+        return image
+
+    @staticmethod
+    def _load_with_info(
+        path: str,
+        dpi: float = 300,
+        max_pixels: Optional[int] = None,
+        clip: Optional[Sequence[float]] = None,
+    ) -> Tuple[np.ndarray, dict]:
+        """이미지/PDF 첫 페이지 로드 + 원본 해상도 정보"""
         path = Path(path)
 
         if path.suffix.lower() == ".pdf":
-            return FloorPlanPreprocessor._load_pdf(path)
+            return FloorPlanPreprocessor._load_pdf(
+                path, dpi=dpi, max_pixels=max_pixels, clip=clip
+            )
+
+        return FloorPlanPreprocessor._decode_raster(
+            lambda flags: cv2.imread(str(path), flags), path, max_pixels, str(path)
+        )
+
+    def decode_image(self, data: bytes) -> Tuple[np.ndarray, dict]:
+        """
+        업로드된 이미지 바이트 디코딩 (설정된 최대 픽셀 수로 축소 디코딩)
+
+        Returns:
+            (BGR 이미지, 원본 해상도 정보 - _decode_raster 참조)
+        """
+        buf = np.frombuffer(data, dtype=np.uint8)
+        return self._decode_raster(
+            lambda flags: cv2.imdecode(buf, flags),
+            io.BytesIO(data),
+            self.render_options["max_pixels"],
+            "업로드 데이터",
+        )
+
+    @staticmethod
+    def _decode_raster(
+        read: Callable[[int], Optional[np.ndarray]],
+        source,
+        max_pixels: Optional[int],
+        label: str,
+    ) -> Tuple[np.ndarray, dict]:
+        """
+        래스터 이미지를 필요한 최소 해상도로 디코딩
+
+        헤더에서 크기를 먼저 읽어 max_pixels를 만족하는 가장 작은
+        IMREAD_REDUCED_* 배율로 디코딩한다 (JPEG는 DCT 단계에서 축소되어
+        전체 해상도 버퍼가 만들어지지 않는다). 남은 차이는 INTER_AREA로 맞춘다.
+
+        Args:
+            read: imread 플래그 → 이미지 (실패 시 None)
+            source: 헤더 크기 조회 대상 (경로 또는 파일 객체)
+            max_pixels: 최대 픽셀 수 (None이면 원본 해상도)
+            label: 오류 메시지용 이름
 
-        image = cv2.imread(str(path))
+        Returns:
+            (BGR 이미지, {"source_size": 원본 (w, h),
+                          "source_scale": 원본 대비 디코딩 배율,
+                          "unit": "px"})
+        """
+        size = FloorPlanPreprocessor._probe_size(source) if max_pixels else None
+        factor = FloorPlanPreprocessor._reduction_factor(size, max_pixels)
+        image = read(REDUCED_DECODE_FLAGS[factor])
         if image is None:
-            raise ValueError(f"이미지를 로드할 수 없습니다: {path}")
-        return image
+            raise ValueError(f"이미지를 로드할 수 없습니다: {label}")
+
+        h, w = image.shape[:2]
+        if max_pixels and w * h > max_pixels:
+            scale = math.sqrt(max_pixels / (w * h))
+            new_size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            image = cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
+
+        source_size = size or (w, h)
+        # EXIF 회전으로 가로/세로가 바뀔 수 있으므로 긴 변 기준
+        source_scale = max(image.shape[:2]) / max(source_size)
+        if source_scale < 1.0:
+            logger.info(
+                f"축소 디코딩: {source_size[0]}x{source_size[1]} → "
+                f"{image.shape[1]}x{image.shape[0]} (1/{factor} 디코딩)"
+            )
+        return image, {"source_size": source_size, "source_scale": source_scale, "unit": "px"}
+
+    @staticmethod
+    def _probe_size(source) -> Optional[Tuple[int, int]]:
+        """이미지 헤더만 읽어 (w, h) 반환 - 픽셀 데이터는 디코딩하지 않음"""
+        try:
+            from PIL import Image
+        except ImportError:
+            return None
+        try:
+            with Image.open(source) as img:
+                return img.size
+        except Exception:
+            return None
 
     @staticmethod
-    def _load_pdf(path: Path) -> np.ndarray:
+    def _reduction_factor(size: Optional[Tuple[int, int]], max_pixels: Optional[int]) -> int:
+        """max_pixels 이상을 유지하는 가장 큰 축소 디코딩 배율 (1, 2, 4, 8)"""
+        if not size or not max_pixels:
+            return 1
+        w, h = size
+        for factor in (8, 4, 2):
+            if (w // factor) * (h // factor) >= max_pixels:
+                return factor
+        return 1
+
+    @property
+    def render_options(self) -> dict:
+        """설정된 렌더링/디코딩 옵션 (메모리 예산에 맞는 최대 픽셀 수 반영)"""
+        max_pixels = self.render_max_pixels
+        budget_pixels = self._budget_pixels()
+        if budget_pixels and (not max_pixels or budget_pixels < max_pixels):
+            max_pixels = budget_pixels
+        return {"dpi": self.render_dpi, "max_pixels": max_pixels, "clip": self.render_clip}
+
+    def _budget_pixels(self) -> Optional[int]:
+        """메모리 예산 내에서 처리 가능한 최대 픽셀 수"""
+        if not self.memory_budget_mb:
+            return None
+        return int(self.memory_budget_mb * 1024 * 1024 / BYTES_PER_PIXEL)
+
+    def _working_scale(self, shape: Tuple[int, ...]) -> float:
+        """메모리 예산에 맞춘 작업 해상도 배율 (1.0 = 원본)"""
+        budget_pixels = self._budget_pixels()
+        pixels = shape[0] * shape[1]
+        if not budget_pixels or pixels <= budget_pixels:
+            return 1.0
+        return math.sqrt(budget_pixels / pixels)
+
+    def load_page(self, path: str) -> Tuple[np.ndarray, dict]:
+        """
+        설정된 렌더링 옵션으로 첫 페이지(또는 이미지) 로드
+
+        Returns:
+            (BGR 이미지, 원본 해상도 정보) - 정보는 process(source_info=...)로 전달
+        """
+        return self._load_with_info(path, **self.render_options)
+
+    def load_pages(self, path: str) -> Iterator[Tuple[np.ndarray, dict]]:
+        """
+        문서의 페이지를 한 장씩 (이미지, 원본 해상도 정보)로 로드
+        (PDF는 페이지 순서대로 렌더링)
+
+        제너레이터이므로 소비된 페이지만 메모리에 올라온다.
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".pdf":
+            yield from self._iter_pdf_pages(path, **self.render_options)
+        else:
+            yield self.load_page(str(path))
+
+    @staticmethod
+    def _load_pdf(path: Path, **render) -> Tuple[np.ndarray, dict]:
         """PDF 첫 페이지를 이미지로 변환"""
+        pages = FloorPlanPreprocessor._iter_pdf_pages(path, **render)
+        try:
+            return next(pages)
+        except StopIteration:
+            raise ValueError(f"PDF에 페이지가 없습니다: {path}")
+        finally:
+            pages.close()
+
+    @staticmethod
+    def _iter_pdf_pages(path: Path, **render) -> Iterator[Tuple[np.ndarray, dict]]:
+        """PDF 페이지를 순서대로 렌더링 → (이미지, 원본 해상도 정보)"""
         try:
             import fitz  # PyMuPDF
-            doc = fitz.open(str(path))
-            page = doc[0]
-            # 300 DPI로 렌더링
-            mat = fitz.Matrix(300 / 72, 300 / 72)
-            pix = page.get_pixmap(matrix=mat)
-            img_array = np.frombuffer(pix.samples, dtype=np.uint8)
-            img_array = img_array.reshape(pix.height, pix.width, pix.n)
-            if pix.n == 4:  # RGBA → BGR
-                img_array = cv2.cvtColor(img_array, cv2.COLOR_RGBA2BGR)
-            elif pix.n == 3:  # RGB → BGR
-                img_array = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-            doc.close()
-            return img_array
         except ImportError:
             logger.warning("PyMuPDF 미설치 → pdf2image 시도")
-            from pdf2image import convert_from_path
-            images = convert_from_path(str(path), dpi=300, first_page=1, last_page=1)
-            return cv2.cvtColor(np.array(images[0]), cv2.COLOR_RGB2BGR)
+            yield from FloorPlanPreprocessor._iter_pdf_pages_pdf2image(path, **render)
+            return
+
+        doc = fitz.open(str(path))
+        try:
+            for page in doc:
+                yield FloorPlanPreprocessor._render_pdf_page(page, **render)
+        finally:
+            doc.close()
+
+    @staticmethod
+    def _render_zoom(
+        width_pt: float, height_pt: float, dpi: float, max_pixels: Optional[int]
+    ) -> float:
+        """
+        렌더링 배율 (pt → px) 계산
+
+        벽 디테일에 필요한 DPI를 상한으로 하되, 결과 픽셀 수가
+        max_pixels를 넘으면 그에 맞춰 배율을 낮춘다.
+        """
+        zoom = dpi / 72
+        if max_pixels and width_pt * height_pt * zoom * zoom > max_pixels:
+            zoom = math.sqrt(max_pixels / (width_pt * height_pt))
+        return zoom
+
+    @staticmethod
+    def _render_pdf_page(
+        page,
+        dpi: float = 300,
+        max_pixels: Optional[int] = None,
+        clip: Optional[Sequence[float]] = None,
+    ) -> Tuple[np.ndarray, dict]:
+        """
+        PyMuPDF 페이지 → (BGR 이미지, 원본 해상도 정보)
+
+        Args:
+            page: fitz.Page
+            dpi: 최대 렌더링 DPI
+            max_pixels: 최대 픽셀 수 (초과 시 DPI 하향)
+            clip: 렌더링 영역 (x0, y0, x1, y1), PDF pt 단위 - 도면 영역만 래스터화
+        """
+        import fitz
+
+        rect = page.rect
+        if clip is not None:
+            rect = fitz.Rect(clip) & page.rect
+            if rect.is_empty:
+                raise ValueError(f"렌더링 영역이 페이지 밖입니다: {clip}")
+
+        zoom = FloorPlanPreprocessor._render_zoom(rect.width, rect.height, dpi, max_pixels)
+        if zoom < dpi / 72:
+            logger.info(f"렌더링 DPI 하향: {dpi} → {zoom * 72:.0f} (최대 {max_pixels}px)")
+
+        pix = page.get_pixmap(
+            matrix=fitz.Matrix(zoom, zoom),
+            clip=rect if clip is not None else None,
+            alpha=False,
+        )
+        # samples_mv: 픽스맵 버퍼를 복사 없이 참조 → BGR 변환이 유일한 복사
+        img_array = np.frombuffer(pix.samples_mv, dtype=np.uint8)
+        img_array = img_array.reshape(pix.height, pix.width, pix.n)
+        if pix.n == 3:  # RGB → BGR
+            image = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        elif pix.n == 1:
+            image = cv2.cvtColor(img_array, cv2.COLOR_GRAY2BGR)
+        else:
+            image = cv2.cvtColor(img_array, cv2.COLOR_RGBA2BGR)
+        return image, FloorPlanPreprocessor._pdf_source_info(rect.width, rect.height, zoom)
+
+    @staticmethod
+    def _pdf_source_info(width_pt: float, height_pt: float, zoom: float) -> dict:
+        """PDF 렌더링 정보 - source_scale은 pt당 픽셀 수"""
+        return {
+            "source_size": (width_pt, height_pt),
+            "source_scale": zoom,
+            "unit": "pt",
+            "render_dpi": round(zoom * 72, 1),
+        }
+
+    @staticmethod
+    def _iter_pdf_pages_pdf2image(
+        path: Path,
+        dpi: float = 300,
+        max_pixels: Optional[int] = None,
+        clip: Optional[Sequence[float]] = None,
+    ) -> Iterator[Tuple[np.ndarray, dict]]:
+        """pdf2image 폴백 - 페이지별로 나눠 변환해 메모리 사용 제한"""
+        from pdf2image import convert_from_path, pdfinfo_from_path
+        info = pdfinfo_from_path(str(path))
+        # "595.276 x 841.89 pts (A4)" → 첫 페이지 크기로 배율 계산
+        width_pt, _, height_pt = info["Page size"].split()[:3]
+        if clip is not None:
+            width_pt, height_pt = clip[2] - clip[0], clip[3] - clip[1]
+        zoom = FloorPlanPreprocessor._render_zoom(
+            float(width_pt), float(height_pt), dpi, max_pixels
+        )
+
+        for i in range(1, info["Pages"] + 1):
+            images = convert_from_path(
+                str(path), dpi=zoom * 72, first_page=i, last_page=i
+            )
+            image = np.asarray(images[0].convert("RGB"))
+            if not image.flags.writeable:
+                image = image.copy()
+            cv2.cvtColor(image, cv2.COLOR_RGB2BGR, dst=image)  # 제자리 변환
+            if clip is not None:
+                x0, y0, x1, y1 = (int(round(v * zoom)) for v in clip)
+                image = image[max(0, y0):y1, max(0, x0):x1].copy()
+            yield image, FloorPlanPreprocessor._pdf_source_info(
+                float(width_pt), float(height_pt), zoom
+            )
+
+
+class PreprocessResult:
+    """
+    지연 계산 전처리 결과
+
+    산출물은 처음 접근할 때 계산되고 메모이즈된다.
+    기존 dict 결과와 같이 result["binary"] 형태로 접근할 수 있다.
+    입력 이미지는 복사하지 않고 읽기 전용 뷰로만 노출하며,
+    계산된 산출물의 메모리 사용량(상주/최대)을 집계한다.
+    """
+
+    PRODUCTS = (
+        "original", "gray", "enhanced", "denoised", "binary",
+        "for_yolo", "for_ocr", "for_wall", "color_layers", "scale_info",
+    )
+
+    def __init__(
+        self,
+        preprocessor: FloorPlanPreprocessor,
+        image: np.ndarray,
+        deskew: bool,
+        source_info: Optional[dict] = None,
+    ):
+        self._pp = preprocessor
+        self._input = image
+        self._deskew = deskew
+        self._source_info = source_info
+        self._owned = {}  # 산출물 이름 → 소유 버퍼 바이트
+        self._resident_bytes = image.nbytes
+        self._peak_bytes = image.nbytes
+
+    def _track(self, name: str, value):
+        """새로 할당된 산출물 버퍼(풀 버퍼 포함)만 메모리 사용량에 합산"""
+        if isinstance(value, np.ndarray) and (value.flags.owndata or self._pp.pool.owns(value)):
+            if not any(value is self.__dict__.get(k) for k in self._owned):
+                self._owned[name] = value.nbytes
+                self._resident_bytes += value.nbytes
+                self._peak_bytes = max(self._peak_bytes, self._resident_bytes)
+        return value
+
+    def _pooled(self, name: str, shape: Tuple[int, ...], compute) -> np.ndarray:
+        """풀 버퍼를 dst로 넘겨 산출물 계산 - 다른 배열이 반환되면 버퍼는 즉시 반환"""
+        pool = self._pp.pool
+        buf = pool.acquire(shape)
+        out = compute(buf)
+        if out is not buf:
+            pool.release(buf)
+        return self._track(name, out)
+
+    def _evict(self, name: str) -> None:
+        """더 이상 필요 없는 중간 산출물 해제 (풀 버퍼는 풀에 반환)"""
+        value = self.__dict__.pop(name, None)
+        self._resident_bytes -= self._owned.pop(name, 0)
+        if isinstance(value, np.ndarray) and not any(
+            value is v for v in self.__dict__.values()
+        ):
+            self._pp.pool.release(value)
+
+    def release(self) -> None:
+        """
+        계산된 산출물을 모두 해제하고 풀 버퍼를 반환
+
+        요청 처리가 끝난 뒤 호출한다. 이후 산출물에 다시 접근하면 새로 계산된다.
+        """
+        cached = [
+            name for name in list(self.__dict__)
+            if isinstance(getattr(type(self), name, None), cached_property)
+            and isinstance(self.__dict__[name], np.ndarray)
+        ]
+        arrays = [self.__dict__.pop(name) for name in cached]
+        self._pp.pool.release(*arrays)
+        self._owned.clear()
+        self._resident_bytes = self._input.nbytes
+
+    @property
+    def memory_stats(self) -> dict:
+        """요청 단위 메모리 사용량 (산출물 버퍼 기준, OpenCV 내부 임시 버퍼 제외)"""
+        return {
+            "input_bytes": self._input.nbytes,
+            "resident_bytes": self._resident_bytes,
+            "peak_bytes": self._peak_bytes,
+        }
+
+    # --- dict 호환 인터페이스 ---
+
+    def __getitem__(self, key: str):
+        if key not in self.PRODUCTS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.PRODUCTS
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.PRODUCTS
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self.PRODUCTS else default
+
+    @property
+    def computed(self) -> Tuple[str, ...]:
+        """지금까지 계산된 산출물 이름"""
+        return tuple(k for k in self.PRODUCTS if k in self.__dict__)
+
+    # --- 정렬 (축소본에서 추정, 한 번만 변환) ---
+
+    @cached_property
+    def alignment(self) -> Tuple[int, float]:
+        """(페이지 방향 보정각, 기울기 보정각) - 보정 불필요 시 (0, 0.0)"""
+        if not self._deskew:
+            return 0, 0.0
+        orientation, angle = self._pp._estimate_alignment(self._source)
+        if abs(angle) <= 0.5:
+            angle = 0.0
+        if orientation or angle:
+            logger.info(f"정렬 보정: 방향 {orientation}°, 기울기 {angle:.2f}°")
+        return orientation, angle
+
+    @property
+    def skew_angle(self) -> float:
+        """기울기 보정 각도 (보정 불필요 시 0.0)"""
+        return self.alignment[1]
+
+    # --- 작업 해상도 (메모리 예산 초과 시 축소) ---
+
+    @cached_property
+    def working_scale(self) -> float:
+        """입력 대비 작업 해상도 배율"""
+        return self._pp._working_scale(self._input.shape)
+
+    @cached_property
+    def _source(self) -> np.ndarray:
+        scale = self.working_scale
+        if scale >= 1.0:
+            return self._input
+        h, w = self._input.shape[:2]
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        logger.info(f"메모리 예산 초과 → 작업 해상도 {w}x{h} → {size[0]}x{size[1]}")
+        return self._track("_source", cv2.resize(self._input, size, interpolation=cv2.INTER_AREA))
+
+    @cached_property
+    def _aligned(self) -> np.ndarray:
+        orientation, angle = self.alignment
+        if orientation or angle:
+            return self._track(
+                "_aligned", self._pp._align_image(self._source, orientation, angle)
+            )
+        return self._source
+
+    # --- 도면 영역 (ROI) ---
+
+    @cached_property
+    def roi(self) -> Tuple[int, int, int, int]:
+        """정렬된 페이지 기준 도면 영역 (x, y, w, h)"""
+        h, w = self._aligned.shape[:2]
+        if not self._pp.roi_crop:
+            return 0, 0, w, h
+        roi = self._pp._detect_drawing_area(self._aligned)
+        if roi != (0, 0, w, h):
+            logger.info(f"도면 영역 크롭: {roi} (페이지 {w}x{h})")
+        return roi
+
+    # --- 산출물 (모두 정렬 + 크롭된 이미지에서 파생) ---
+
+    @cached_property
+    def original(self) -> np.ndarray:
+        # 복사 대신 읽기 전용 뷰 - 호출자의 이미지는 변경되지 않는다
+        x, y, w, h = self.roi
+        view = self._aligned[y:y + h, x:x + w]
+        view.flags.writeable = False
+        return view
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        return self._pooled(
+            "gray", self.original.shape[:2],
+            lambda dst: cv2.cvtColor(self.original, cv2.COLOR_BGR2GRAY, dst=dst),
+        )
+
+    @cached_property
+    def enhanced(self) -> np.ndarray:
+        if self._pp.enhance_contrast:
+            return self._pooled(
+                "enhanced", self.gray.shape,
+                lambda dst: self._pp._enhance_contrast(self.gray, dst=dst),
+            )
+        return self.gray
+
+    @cached_property
+    def denoised(self) -> np.ndarray:
+        return self._pooled(
+            "denoised", self.enhanced.shape,
+            lambda dst: self._pp._denoise(self.enhanced, dst=dst),
+        )
+
+    @cached_property
+    def binary(self) -> np.ndarray:
+        pp = self._pp
+        if pp.tiling.applies_to(self.enhanced.shape):
+            # 타일 단위 노이즈 제거 + 이진화: 임시 버퍼가 타일 크기에 비례
+            return self._track("binary", map_tiles(
+                self.enhanced, lambda tile: pp._binarize(pp._denoise(tile)), pp.tiling
+            ))
+        binary = self._pooled(
+            "binary", self.enhanced.shape, lambda dst: pp._binarize(self.denoised, dst=dst)
+        )
+        # 노이즈 제거본은 이진화에만 쓰이므로 해제
+        self._evict("denoised")
+        return binary
+
+    @cached_property
+    def for_yolo(self) -> np.ndarray:
+        yolo_img, _, _ = self._pp._letterbox(self.original)
+        return self._track("for_yolo", yolo_img)
+
+    @cached_property
+    def color_layers(self) -> Optional[np.ndarray]:
+        """색상 레이어 라벨 맵 (COLOR_LAYERS 값), 비활성화 시 None"""
+        if not self._pp.color_layers or self.original.ndim != 3:
+            return None
+        return self._track("color_layers", self._pp._separate_layers(self.original))
+
+    @cached_property
+    def for_ocr(self) -> np.ndarray:
+        labels = self.color_layers
+        if labels is None:
+            return self.enhanced
+        # 텍스트 레이어가 아닌 분류 픽셀을 흰색으로 → OCR 전경 축소
+        lut = self._pp._layer_lut(self._pp.layer_text_layers, inside=0, outside=255)
+        pool = self._pp.pool
+        mask = cv2.LUT(labels, lut, dst=pool.acquire(labels.shape))
+        for_ocr = self._pooled(
+            "for_ocr", labels.shape, lambda dst: cv2.max(self.enhanced, mask, dst=dst)
+        )
+        pool.release(mask)
+        return for_ocr
+
+    @cached_property
+    def for_wall(self) -> np.ndarray:
+        labels = self.color_layers
+        if labels is None:
+            return self.binary
+        # 치수/주석 레이어를 제외한 전경만 벽 추출에 사용
+        # 미분류 픽셀(선 경계의 안티앨리어싱)은 유지
+        lut = self._pp._layer_lut(("walls",), inside=255, outside=0, background=255)
+        pool = self._pp.pool
+        keep = cv2.LUT(labels, lut, dst=pool.acquire(labels.shape))
+        for_wall = self._pooled(
+            "for_wall", labels.shape, lambda dst: cv2.bitwise_and(self.binary, keep, dst=dst)
+        )
+        pool.release(keep)
+        return for_wall
+
+    @cached_property
+    def scale_info(self) -> dict:
+        # 각 Stage 좌표는 크롭된 도면 기준, roi로 페이지 좌표 복원
+        h, w = self.original.shape[:2]
+        page_h, page_w = self._aligned.shape[:2]
+        target = self._pp.target_size
+        scale = target / max(h, w)
+        source_scale = (self._source_info or {}).get("source_scale", 1.0)
+        return {
+            "original_size": (w, h),
+            "page_size": (page_w, page_h),
+            "roi": self.roi,
+            "yolo_size": (target, target),
+            "scale_factor": scale,
+            "pad": (target - int(w * scale), target - int(h * scale)),
+            # 레터박스 안 이미지의 좌상단 위치 (_letterbox는 우측/하단만 패딩)
+            "pad_offset": (0, 0),
+            "working_scale": self.working_scale,
+            # 원본 파일(래스터 px 또는 PDF pt) 대비 작업 이미지 배율
+            "source": self._source_info,
+            "effective_scale": source_scale * self.working_scale,
+        }
@@ -5,10 +5,15 @@ Stage 1: YOLOv8 기반 평면도 심볼 감지
 
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+import time
+from concurrent.futures import Future
+from typing import List, Dict, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 from loguru import logger
 
+from .model_registry import ModelRegistry, ModelVersion
+from .tiling import sliding_windows
+
 
 # 클래스 ID → 한국어 매핑
 CLASS_NAMES_KO = {
@@ -24,6 +29,87 @@ CLASS_NAMES_EN = {
     8: "sink", 9: "kitchen_sink", 10: "stairs", 11: "elevator",
     12: "dimension_line",
 }
+_CLASS_IDS = {name: cls_id for cls_id, name in CLASS_NAMES_EN.items()}
+
+
+# 추론 백엔드 (onnxruntime: torch 없이 내보낸 ONNX 그래프 직접 실행)
+BACKENDS = ("ultralytics", "onnxruntime")
+# ONNX 모델 정밀도 (int8: scripts/quantize-yolo-floorplan.py 양자화 결과)
+PRECISIONS = ("fp32", "int8")
+
+# 슬라이스 추론 중복 제거 기준 (iou: 합집합 대비, ios: 작은 박스 대비 - 타일 경계에서 잘린 박스 병합)
+MATCH_METRICS = ("iou", "ios")
+# NMS 한 번에 겹침을 계산할 박스 수 - 겹침 행렬 메모리 상한 (청크 x 남은 박스)
+NMS_CHUNK = 1024
+
+
+def _overlaps(a: np.ndarray, b: np.ndarray, threshold: float, metric: str) -> np.ndarray:
+    """(A, 4) x (B, 4) 박스 쌍의 겹침이 threshold를 넘는지 (A, B)"""
+    area_a = (a[:, 2] - a[:, 0]).clip(0) * (a[:, 3] - a[:, 1]).clip(0)
+    area_b = (b[:, 2] - b[:, 0]).clip(0) * (b[:, 3] - b[:, 1]).clip(0)
+    lt = np.maximum(a[:, None, :2], b[None, :, :2])
+    rb = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    inter = (rb - lt).clip(0).prod(axis=2)
+    if metric == "ios":
+        denom = np.minimum(area_a[:, None], area_b[None, :])
+    else:
+        denom = area_a[:, None] + area_b[None, :] - inter
+    return inter > threshold * np.maximum(denom, 1e-9)
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    classes: Optional[np.ndarray] = None,
+    threshold: float = 0.5,
+    metric: str = "iou",
+    chunk: int = NMS_CHUNK,
+) -> np.ndarray:
+    """
+    클래스별 NMS (점수순 청크 단위로 겹침 계산)
+
+    전체 N x N 겹침 행렬 대신 점수순 chunk개씩, 앞서 남긴 박스 + 청크 내부와의 겹침만
+    계산한다. 슬라이스 추론처럼 타일 결과를 모은 수천 개 박스도 메모리가 청크 크기에 비례.
+
+    Args:
+        boxes: (N, 4) [x1, y1, x2, y2]
+        scores: (N,) 신뢰도
+        classes: (N,) 클래스 ID (None이면 클래스 무시)
+        threshold: 이 값을 넘게 겹치면 낮은 점수 박스 제거
+        metric: "iou" 또는 "ios"
+        chunk: 한 번에 겹침을 계산할 박스 수
+
+    Returns:
+        남길 인덱스 (점수 내림차순)
+    """
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.int64)
+    if classes is None:
+        classes = np.zeros(len(boxes))
+
+    keep_all = []
+    for cls in np.unique(classes):
+        idx = np.flatnonzero(classes == cls)
+        idx = idx[np.argsort(-scores[idx], kind="stable")]
+        b = boxes[idx].astype(np.float32)
+
+        kept = np.empty(0, dtype=np.int64)  # b 기준 인덱스
+        for start in range(0, len(b), chunk):
+            block = b[start:start + chunk]
+            keep = np.ones(len(block), dtype=bool)
+            # 앞 청크에서 남긴 (점수가 더 높은) 박스와 겹치면 제거
+            if len(kept):
+                keep &= ~_overlaps(b[kept], block, threshold, metric).any(axis=0)
+            # 청크 안에서는 자기보다 점수가 높은 박스와의 겹침만 본다 (상삼각)
+            suppress = np.triu(_overlaps(block, block, threshold, metric), k=1)
+            for i in range(len(block)):
+                if keep[i]:
+                    keep &= ~suppress[i]
+            kept = np.concatenate([kept, start + np.flatnonzero(keep)])
+        keep_all.append(idx[kept])
+
+    keep = np.concatenate(keep_all)
+    return keep[np.argsort(-scores[keep], kind="stable")]
 
 
 @dataclass
@@ -62,6 +148,215 @@ class Detection:
         }
 
 
+def _class_name(cls_id: int) -> str:
+    return CLASS_NAMES_EN.get(cls_id, f"class_{cls_id}")
+
+
+def _class_name_ko(cls_id: int) -> str:
+    return CLASS_NAMES_KO.get(cls_id, f"클래스_{cls_id}")
+
+
+def class_id_map(names: Any) -> Optional[np.ndarray]:
+    """
+    모델 클래스 이름 → 표준 클래스 id 조회표
+
+    학습 데이터셋마다 클래스 순서가 달라 (예: dataset.yaml은 0=door_swing, 2=window)
+    모델 출력 id를 그대로 쓰면 CLASS_NAMES_EN과 라벨이 어긋난다.
+
+    Args:
+        names: 모델 메타데이터의 {id: 이름} (또는 이름 리스트)
+
+    Returns:
+        모델 id → 표준 id 배열 (표준에 없는 이름은 -1), 이름 정보가 없으면 None (id 그대로)
+    """
+    if not names:
+        return None
+    if not isinstance(names, dict):
+        names = dict(enumerate(names))
+    lut = np.full(max(int(k) for k in names) + 1, -1, dtype=np.int64)
+    for model_id, name in names.items():
+        lut[int(model_id)] = _CLASS_IDS.get(name, -1)
+    return lut
+
+
+def _remap_classes(boxes: np.ndarray, lut: Optional[np.ndarray]) -> np.ndarray:
+    """(N, 6) 추론 결과의 클래스 열을 표준 id로 변환 (표준에 없는 클래스는 제거)"""
+    if lut is None or not len(boxes):
+        return boxes
+    model_ids = boxes[:, 5].astype(np.int64)
+    known = (model_ids >= 0) & (model_ids < len(lut))
+    canonical = np.full(len(boxes), -1, dtype=np.int64)
+    canonical[known] = lut[model_ids[known]]
+    keep = canonical >= 0
+    boxes = boxes[keep].copy()
+    boxes[:, 5] = canonical[keep]
+    return boxes
+
+
+class DetectionSet:
+    """
+    배열 기반 감지 결과 묶음
+
+    추론 결과 (N, 6) 배열에서 한 번만 복사한 연속 배열(boxes/confidences/class_ids)로
+    필터/정렬/좌표 변환을 벡터 연산으로 처리하고, dict는 직렬화 시점에만 만든다.
+    변환 메서드는 새 DetectionSet을 반환한다 (원본 불변).
+
+    정수 인덱스/반복은 기존 코드와의 호환을 위해 Detection을 만들어 반환하고,
+    슬라이스/불리언 마스크/인덱스 배열은 DetectionSet을 반환한다.
+    model_version은 감지에 사용한 모델 버전 (model_registry)으로 변환 후에도 유지된다.
+    """
+
+    __slots__ = ("boxes", "confidences", "class_ids", "model_version")
+
+    def __init__(
+        self,
+        boxes: np.ndarray,
+        confidences: np.ndarray,
+        class_ids: np.ndarray,
+        model_version: Optional[str] = None,
+    ):
+        self.boxes = boxes              # (N, 4) float32 [x1, y1, x2, y2]
+        self.confidences = confidences  # (N,) float32
+        self.class_ids = class_ids      # (N,) int32
+        self.model_version = model_version
+
+    @classmethod
+    def from_array(cls, data: np.ndarray, model_version: Optional[str] = None) -> "DetectionSet":
+        """(N, 6) [x1, y1, x2, y2, conf, cls] 배열 → DetectionSet"""
+        data = np.asarray(data, dtype=np.float32).reshape(-1, 6)
+        return cls(
+            np.ascontiguousarray(data[:, :4]),
+            np.ascontiguousarray(data[:, 4]),
+            data[:, 5].astype(np.int32),
+            model_version,
+        )
+
+    @classmethod
+    def from_detections(cls, detections: Sequence[Detection]) -> "DetectionSet":
+        """Detection 리스트 → DetectionSet"""
+        if isinstance(detections, DetectionSet):
+            return detections
+        return cls.from_array(np.array(
+            [[*d.bbox, d.confidence, d.class_id] for d in detections], dtype=np.float32
+        ))
+
+    @classmethod
+    def empty(cls) -> "DetectionSet":
+        return cls.from_array(np.empty((0, 6), np.float32))
+
+    @classmethod
+    def concatenate(cls, sets: Sequence["DetectionSet"]) -> "DetectionSet":
+        if not sets:
+            return cls.empty()
+        return cls(
+            np.concatenate([s.boxes for s in sets]),
+            np.concatenate([s.confidences for s in sets]),
+            np.concatenate([s.class_ids for s in sets]),
+            sets[0].model_version,
+        )
+
+    def __len__(self) -> int:
+        return len(self.confidences)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            x1, y1, x2, y2 = self.boxes[index].tolist()
+            cls_id = int(self.class_ids[index])
+            return Detection(
+                class_id=cls_id,
+                class_name=_class_name(cls_id),
+                class_name_ko=_class_name_ko(cls_id),
+                confidence=float(self.confidences[index]),
+                bbox=(x1, y1, x2, y2),
+            )
+        return self._with(self.boxes[index], self.confidences[index], self.class_ids[index])
+
+    def _with(self, boxes, confidences, class_ids) -> "DetectionSet":
+        return DetectionSet(boxes, confidences, class_ids, self.model_version)
+
+    def __repr__(self) -> str:
+        return f"DetectionSet(n={len(self)})"
+
+    @property
+    def centers(self) -> np.ndarray:
+        """(N, 2) 중심점"""
+        return (self.boxes[:, :2] + self.boxes[:, 2:]) / 2
+
+    @property
+    def areas(self) -> np.ndarray:
+        """(N,) 면적"""
+        return (self.boxes[:, 2] - self.boxes[:, 0]) * (self.boxes[:, 3] - self.boxes[:, 1])
+
+    @property
+    def class_names(self) -> List[str]:
+        return [_class_name(c) for c in self.class_ids.tolist()]
+
+    def filter(self, mask: np.ndarray) -> "DetectionSet":
+        """불리언 마스크 또는 인덱스 배열로 선택"""
+        return self[np.asarray(mask)]
+
+    def above(self, confidence: float) -> "DetectionSet":
+        """신뢰도 confidence 이상만"""
+        return self.filter(self.confidences >= confidence)
+
+    def of_classes(self, class_ids: Sequence[int]) -> "DetectionSet":
+        """지정 클래스만"""
+        return self.filter(np.isin(self.class_ids, class_ids))
+
+    def sorted(self) -> "DetectionSet":
+        """신뢰도 내림차순 (같은 신뢰도는 입력 순서 유지)"""
+        return self.filter(np.argsort(-self.confidences, kind="stable"))
+
+    def translate(self, dx: float, dy: float) -> "DetectionSet":
+        """평행이동"""
+        if not dx and not dy:
+            return self
+        offset = np.array([dx, dy, dx, dy], dtype=np.float32)
+        return self._with(self.boxes + offset, self.confidences, self.class_ids)
+
+    def scale(self, factor: float) -> "DetectionSet":
+        """좌표 배율 (원점 기준)"""
+        if factor == 1.0:
+            return self
+        return self._with(self.boxes * np.float32(factor), self.confidences, self.class_ids)
+
+    def clip(self, width: float, height: float) -> "DetectionSet":
+        """이미지 범위로 자르고 면적이 0이 된 박스 제거"""
+        boxes = self.boxes.copy()
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, width)
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, height)
+        keep = (boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])
+        return self._with(boxes[keep], self.confidences[keep], self.class_ids[keep])
+
+    def to_array(self) -> np.ndarray:
+        """(N, 6) [x1, y1, x2, y2, conf, cls] 배열"""
+        return np.column_stack([self.boxes, self.confidences, self.class_ids]).astype(np.float32)
+
+    def to_dicts(self) -> List[dict]:
+        """Detection.to_dict()와 같은 형식의 dict 리스트 (반올림은 배열 단위)"""
+        boxes = np.round(self.boxes.astype(np.float64), 1).tolist()
+        centers = np.round(self.centers.astype(np.float64), 1).tolist()
+        areas = np.round(self.areas.astype(np.float64), 1).tolist()
+        confidences = np.round(self.confidences.astype(np.float64), 4).tolist()
+        return [
+            {
+                "class_id": cls_id,
+                "class_name": _class_name(cls_id),
+                "class_name_ko": _class_name_ko(cls_id),
+                "confidence": conf,
+                "bbox": {"x1": b[0], "y1": b[1], "x2": b[2], "y2": b[3]},
+                "center": {"x": c[0], "y": c[1]},
+                "area": area,
+            }
+            for cls_id, conf, b, c, area in zip(
+                self.class_ids.tolist(), confidences, boxes, centers, areas
+            )
+        ]
+
+
 class SymbolDetector:
     """YOLOv8 기반 평면도 심볼 감지기"""
 
@@ -73,32 +368,137 @@ class SymbolDetector:
         self.max_det = config.get("max_detections", 300)
         self.device = config.get("device", "auto")
         self.img_size = config.get("img_size", 1280)
-        self.model = None
+        self.backend = config.get("backend", "ultralytics")
+        if self.backend not in BACKENDS:
+            raise ValueError(
+                f"지원하지 않는 backend: {self.backend} (가능: {', '.join(BACKENDS)})"
+            )
+        self.onnx_path = config.get("onnx_path", "models/floorplan-yolo.onnx")
+        self.precision = config.get("precision", "fp32")
+        if self.precision not in PRECISIONS:
+            raise ValueError(
+                f"지원하지 않는 precision: {self.precision} (가능: {', '.join(PRECISIONS)})"
+            )
+        self.onnx_int8_path = config.get("onnx_int8_path", "models/floorplan-yolo.int8.onnx")
+        # 스레드 수 / 실행 모드 / 그래프 최적화 / 실행 공급자 (onnx_backend 참조)
+        self.onnx_options = config.get("onnxruntime", {})
+        # detect_batch 한 번의 추론에 묶을 최대 이미지 수
+        self.batch_size = max(1, config.get("batch_size", 8))
+        # 슬라이스 추론: 원본 해상도의 겹치는 고정 크기 타일을 배치 추론 후 전역 NMS
+        slicing = config.get("slicing", {})
+        self.slicing = slicing.get("enabled", False)
+        self.slice_size = slicing.get("tile_size", 640)
+        self.slice_overlap = slicing.get("overlap", 0.2)  # 타일 크기 대비 비율
+        self.slice_batch_size = max(1, slicing.get("batch_size", self.batch_size))
+        self.slice_full_frame = slicing.get("full_frame", True)
+        self.slice_match_metric = slicing.get("match_metric", "ios")
+        self.slice_match_threshold = slicing.get("match_threshold", 0.5)
+        if self.slice_match_metric not in MATCH_METRICS:
+            raise ValueError(
+                f"지원하지 않는 match_metric: {self.slice_match_metric} "
+                f"(가능: {', '.join(MATCH_METRICS)})"
+            )
+        # 캐스케이드: 저해상도 전체 추론 → 저신뢰/밀집 영역만 고해상도 크롭 재추론
+        cascade = config.get("cascade", {})
+        self.cascade = cascade.get("enabled", False)
+        self.cascade_coarse_size = cascade.get("coarse_size", 640)
+        self.cascade_fine_size = cascade.get("fine_size", self.img_size)  # 크롭의 등가 전체 해상도
+        self.cascade_crop_size = cascade.get("crop_size", 640)            # 크롭 추론 입력 크기
+        self.cascade_refine_below = cascade.get("refine_below", 0.5)      # 이 신뢰도 미만 재검사
+        self.cascade_dense_count = cascade.get("dense_count", 6)          # 크롭 영역당 감지 수 (밀집)
+        self.cascade_max_crops = cascade.get("max_crops", 8)
+        if self.cascade and self.slicing:
+            raise ValueError("slicing과 cascade는 동시에 사용할 수 없습니다")
+        # 버전 레지스트리: 백그라운드 로드 + 워밍업 후 원자적 교체
+        registry = config.get("registry", {})
+        self.warmup = registry.get("warmup", True)
+        self.registry = ModelRegistry(
+            self._load_weights,
+            warmup=self._warmup if self.warmup else None,
+            history=registry.get("history", 5),
+        )
 
-    def load_model(self) -> None:
-        """모델 로드 - 학습된 모델 또는 사전학습 모델"""
-        try:
-            from ultralytics import YOLO
+    @property
+    def model(self):
+        """현재 활성 모델 (없으면 None)"""
+        active = self.registry.active
+        return active[1] if active else None
+
+    @model.setter
+    def model(self, model) -> None:
+        """외부에서 만든 모델을 그대로 활성화 (테스트/벤치마크 공유용)"""
+        self.registry.activate(model, ModelVersion(
+            version="external", path="", sha256=None, loaded_at=time.time(),
+        ))
+
+    @property
+    def model_version(self) -> Optional[str]:
+        return self.registry.version
+
+    def default_model_path(self) -> str:
+        """설정상 모델 경로 - onnxruntime은 precision별 ONNX, ultralytics는 학습/사전학습 모델"""
+        if self.backend == "onnxruntime":
+            return self.onnx_int8_path if self.precision == "int8" else self.onnx_path
+        if Path(self.model_path).exists():
+            return self.model_path
+        logger.warning(f"학습 모델 없음 → 사전학습 모델 사용: {self.pretrained}")
+        return self.pretrained
+
+    def load_model(self, path: Optional[str] = None, version: Optional[str] = None) -> ModelVersion:
+        """
+        모델 로드 + 워밍업 후 활성화 (동기)
 
-            model_file = Path(self.model_path)
-            if model_file.exists():
-                logger.info(f"학습된 모델 로드: {self.model_path}")
-                self.model = YOLO(str(model_file))
-            else:
-                logger.warning(f"학습 모델 없음 → 사전학습 모델 사용: {self.pretrained}")
-                self.model = YOLO(self.pretrained)
+        Args:
+            path: 모델 경로 (기본: default_model_path())
+            version: 버전 이름 (기본: 파일명@체크섬)
+        """
+        return self.registry.load(path or self.default_model_path(), version)
+
+    def reload_model(
+        self, path: Optional[str] = None, version: Optional[str] = None, force: bool = False
+    ) -> Future:
+        """
+        새 모델을 백그라운드에서 로드/워밍업한 뒤 교체
+
+        교체 전까지 요청은 기존 모델로 처리되고, 교체 시점에 진행 중인 요청도
+        시작할 때 잡은 기존 인스턴스로 끝난다. 로드 실패 시 기존 모델 유지.
+        """
+        return self.registry.load_async(path or self.default_model_path(), version, force)
 
-            # 디바이스 설정
-            if self.device == "auto":
-                import torch
-                self.device = "cuda:0" if torch.cuda.is_available() else "cpu"
-            logger.info(f"모델 로드 완료 - 디바이스: {self.device}")
+    def _load_weights(self, path: str):
+        """경로 → 백엔드별 모델 객체"""
+        if self.backend == "onnxruntime":
+            from .onnx_backend import OnnxYoloModel
+            self.device = "cpu"
+            return OnnxYoloModel(path, self.onnx_options)
 
+        try:
+            from ultralytics import YOLO
         except ImportError:
             logger.error("ultralytics 패키지가 설치되지 않았습니다: pip install ultralytics")
             raise
 
-    def detect(self, image: np.ndarray, scale_info: Optional[dict] = None) -> List[Detection]:
+        model = YOLO(str(path))
+        # 디바이스 설정
+        if self.device == "auto":
+            import torch
+            self.device = "cuda:0" if torch.cuda.is_available() else "cpu"
+        logger.info(f"모델 로드 완료 - 디바이스: {self.device}")
+        return model
+
+    def _warmup(self, model) -> None:
+        """빈 프레임 1회 추론 (그래프 초기화/메모리 할당을 첫 요청 전에 끝냄)"""
+        frame = np.full((self.img_size, self.img_size, 3), 114, dtype=np.uint8)
+        self._infer([frame], self.img_size, model)
+
+    def _snapshot(self) -> Tuple[Optional[str], Any]:
+        """요청 단위로 사용할 (버전, 모델) - 도중에 교체되어도 같은 인스턴스 사용"""
+        if self.registry.active is None:
+            self.load_model()
+        info, model = self.registry.active
+        return info.version, model
+
+    def detect(self, image: np.ndarray, scale_info: Optional[dict] = None) -> DetectionSet:
         """
         이미지에서 심볼 감지
 
@@ -107,62 +507,291 @@ class SymbolDetector:
             scale_info: 전처리 스케일 정보 (좌표 역변환용)
 
         Returns:
-            List[Detection]: 감지된 심볼 리스트
+            DetectionSet: 감지된 심볼 (신뢰도 내림차순)
         """
-        if self.model is None:
-            self.load_model()
+        return self.detect_batch([image], [scale_info])[0]
+
+    def detect_batch(
+        self,
+        images: Sequence[np.ndarray],
+        scale_infos: Optional[Sequence[Optional[dict]]] = None,
+    ) -> List[DetectionSet]:
+        """
+        여러 이미지를 batch_size 단위로 묶어 한 번의 추론으로 감지
+
+        전처리의 for_yolo(레터박스, 같은 크기)를 넘기면 그 크기 그대로 추론해
+        추가 리사이즈 없이 하나의 배치 텐서로 처리되고, 박스는 scale_info로
+        원본 좌표에 역투영된다.
+
+        Args:
+            images: BGR 이미지 리스트
+            scale_infos: 이미지별 전처리 스케일 정보 (좌표 역변환용)
+
+        Returns:
+            이미지별 DetectionSet (입력 순서 유지)
+        """
+        version, model = self._snapshot()
+        if scale_infos is None:
+            scale_infos = [None] * len(images)
+        if len(scale_infos) != len(images):
+            raise ValueError(
+                f"images와 scale_infos 길이가 다릅니다: {len(images)} != {len(scale_infos)}"
+            )
+
+        logger.info(f"심볼 감지 시작 - 이미지 {len(images)}장 (배치 {self.batch_size})")
+
+        outputs = []
+        for i in range(0, len(images), self.batch_size):
+            chunk = list(images[i:i + self.batch_size])
+            imgsz = self._letterboxed_size(chunk, scale_infos[i:i + self.batch_size])
+            outputs.extend(self._infer(chunk, imgsz, model))
+
+        batches = []
+        for boxes, scale_info in zip(outputs, scale_infos):
+            detections = self._to_detections(boxes, scale_info, version)
+            logger.info(f"심볼 감지 완료 - {len(detections)}개 탐지")
+            self._log_detection_summary(detections)
+            batches.append(detections)
+        return batches
+
+    def detect_sliced(self, image: np.ndarray) -> DetectionSet:
+        """
+        슬라이스 추론 - 원본 해상도 타일을 배치로 감지하고 원본 좌표에서 병합
 
-        logger.info(f"심볼 감지 시작 - 이미지: {image.shape[:2]}")
+        축소 시 몇 픽셀로 줄어드는 소형 심볼(세면대, 변기, 미닫이문)도
+        타일 해상도 그대로 감지된다. full_frame이면 대형 심볼(계단 등)을 위해
+        전체 이미지 추론 결과도 함께 병합한다.
 
-        results = self.model.predict(
-            source=image,
+        Args:
+            image: BGR 원본 이미지 (전처리의 original)
+
+        Returns:
+            DetectionSet: 원본 이미지 좌표
+        """
+        version, model = self._snapshot()
+
+        overlap = int(self.slice_size * self.slice_overlap)
+        windows = sliding_windows(image.shape, self.slice_size, overlap)
+        logger.info(
+            f"슬라이스 감지 시작 - 이미지: {image.shape[:2]}, "
+            f"타일 {len(windows)}개 ({self.slice_size}px, 겹침 {overlap}px)"
+        )
+
+        arrays = []
+        for i in range(0, len(windows), self.slice_batch_size):
+            chunk = windows[i:i + self.slice_batch_size]
+            frames = [image[y0:y1, x0:x1] for x0, y0, x1, y1 in chunk]
+            for (x0, y0, _, _), boxes in zip(chunk, self._infer(frames, self.slice_size, model)):
+                boxes[:, [0, 2]] += x0
+                boxes[:, [1, 3]] += y0
+                arrays.append(boxes)
+        if self.slice_full_frame:
+            arrays.extend(self._infer([image], self.img_size, model))
+
+        merged = np.concatenate(arrays) if arrays else np.empty((0, 6), np.float32)
+        keep = non_max_suppression(
+            merged[:, :4], merged[:, 4], merged[:, 5],
+            threshold=self.slice_match_threshold,
+            metric=self.slice_match_metric,
+        )
+        detections = self._to_detections(merged[keep[:self.max_det]], None, version)
+        logger.info(f"슬라이스 감지 완료 - {len(merged)}개 → 병합 후 {len(detections)}개")
+        self._log_detection_summary(detections)
+        return detections
+
+    def detect_cascade(self, image: np.ndarray) -> DetectionSet:
+        """
+        캐스케이드 추론 - 저해상도 전체 추론 후 애매한 영역만 고해상도 크롭으로 재추론
+
+        1) coarse_size로 전체 이미지를 추론해 크고 뚜렷한 심볼을 찾는다.
+        2) 신뢰도 refine_below 미만 감지와 감지가 dense_count개 이상 모인 영역을
+           중심으로 크롭 창을 고른다 (최대 max_crops개, 겹치는 창은 합침).
+        3) 크롭은 전체 이미지를 fine_size로 추론한 것과 같은 해상도로 crop_size 입력 추론한다.
+        4) 크롭 안쪽의 저해상도 결과는 고해상도 결과로 대체하고, 나머지와 NMS로 병합한다.
+
+        Args:
+            image: BGR 원본 이미지 (전처리의 original)
+
+        Returns:
+            DetectionSet: 원본 이미지 좌표
+        """
+        version, model = self._snapshot()
+        h, w = image.shape[:2]
+        coarse = self._infer([image], self.cascade_coarse_size, model)[0]
+
+        # fine_size 등가 해상도의 크롭 한 변 (원본 픽셀, 원본보다 작은 해상도로는 확대하지 않음)
+        ratio = max(1.0, max(h, w) / self.cascade_fine_size)
+        crop = min(int(round(self.cascade_crop_size * ratio)), max(h, w))
+        windows = self._cascade_windows(coarse, (h, w), crop)
+
+        arrays = [coarse]
+        if windows:
+            windows_arr = np.array(windows, dtype=np.float32)
+            # 크롭 안쪽에 완전히 들어간 저해상도 감지는 재추론 결과로 대체
+            inside = (
+                (coarse[:, None, 0] >= windows_arr[None, :, 0])
+                & (coarse[:, None, 1] >= windows_arr[None, :, 1])
+                & (coarse[:, None, 2] <= windows_arr[None, :, 2])
+                & (coarse[:, None, 3] <= windows_arr[None, :, 3])
+            ).any(axis=1)
+            arrays = [coarse[~inside]]
+
+            frames = [image[y0:y1, x0:x1] for x0, y0, x1, y1 in windows]
+            for (x0, y0, x1, y1), boxes in zip(
+                windows, self._infer(frames, self.cascade_crop_size, model)
+            ):
+                boxes[:, [0, 2]] += x0
+                boxes[:, [1, 3]] += y0
+                # 이미지 경계가 아닌 크롭 경계에 잘린 박스는 버림 (저해상도 결과가 담당)
+                cut = (
+                    ((boxes[:, 0] <= x0 + 1) & (x0 > 0)) | ((boxes[:, 2] >= x1 - 1) & (x1 < w))
+                    | ((boxes[:, 1] <= y0 + 1) & (y0 > 0)) | ((boxes[:, 3] >= y1 - 1) & (y1 < h))
+                )
+                arrays.append(boxes[~cut])
+
+        merged = np.concatenate(arrays)
+        keep = non_max_suppression(
+            merged[:, :4], merged[:, 4], merged[:, 5],
+            threshold=self.slice_match_threshold,
+            metric=self.slice_match_metric,
+        )
+        detections = self._to_detections(merged[keep[:self.max_det]], None, version)
+
+        # 전체 fine_size 추론 대비 입력 픽셀 비율
+        pixels = self.cascade_coarse_size ** 2 + len(windows) * self.cascade_crop_size ** 2
+        logger.info(
+            f"캐스케이드 감지 완료 - 저해상도 {len(coarse)}개, 크롭 {len(windows)}개 "
+            f"({crop}px) → {len(detections)}개 "
+            f"(연산량 {pixels / self.cascade_fine_size ** 2:.0%} of {self.cascade_fine_size}px)"
+        )
+        self._log_detection_summary(detections)
+        return detections
+
+    def _cascade_windows(
+        self, coarse: np.ndarray, shape: Tuple[int, int], crop: int
+    ) -> List[Tuple[int, int, int, int]]:
+        """
+        재추론할 크롭 창 선택 - 저신뢰 감지(낮은 순) → 밀집 영역(많은 순)
+
+        이미 고른 창에 완전히 들어가는 중심은 건너뛴다.
+        """
+        h, w = shape
+        if not len(coarse):
+            return []
+        centers = (coarse[:, :2] + coarse[:, 2:4]) / 2
+        conf = coarse[:, 4]
+
+        seeds = [centers[i] for i in np.argsort(conf) if conf[i] < self.cascade_refine_below]
+        # 밀집: crop 크기 격자 셀별 감지 수
+        cells = (centers // crop).astype(np.int64)
+        uniq, inverse, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+        for c in np.argsort(-counts, kind="stable"):
+            if counts[c] < self.cascade_dense_count:
+                break
+            seeds.append(centers[inverse.ravel() == c].mean(axis=0))
+
+        windows = []
+        for cx, cy in seeds:
+            if len(windows) >= self.cascade_max_crops:
+                break
+            if any(x0 + crop / 8 <= cx <= x1 - crop / 8 and y0 + crop / 8 <= cy <= y1 - crop / 8
+                   for x0, y0, x1, y1 in windows):
+                continue
+            x0 = int(np.clip(cx - crop / 2, 0, max(0, w - crop)))
+            y0 = int(np.clip(cy - crop / 2, 0, max(0, h - crop)))
+            windows.append((x0, y0, min(w, x0 + crop), min(h, y0 + crop)))
+        return windows
+
+    def _infer(
+        self, frames: List[np.ndarray], imgsz: Optional[int] = None, model: Any = None
+    ) -> List[np.ndarray]:
+        """
+        프레임 묶음 추론 (한 번의 predict 호출)
+
+        Args:
+            frames: BGR 프레임 리스트
+            imgsz: 추론 입력 크기 (None이면 img_size)
+            model: 사용할 모델 인스턴스 (None이면 현재 활성 모델)
+
+        Returns:
+            프레임별 (N, 6) 배열 [x1, y1, x2, y2, conf, cls] - 프레임 픽셀 좌표
+            (cls는 표준 클래스 id, 표준에 없는 클래스는 제거)
+        """
+        model = model if model is not None else self.model
+        # 모델 클래스 순서 → 표준 클래스 (CLASS_NAMES_EN)
+        lut = class_id_map(getattr(model, "names", None))
+        if self.backend == "onnxruntime":
+            outputs = model.infer(
+                frames,
+                imgsz=imgsz or self.img_size,
+                conf=self.conf_threshold,
+                iou=self.iou_threshold,
+                max_det=self.max_det,
+            )
+            return [_remap_classes(boxes, lut) for boxes in outputs]
+
+        results = model.predict(
+            source=frames,
             conf=self.conf_threshold,
             iou=self.iou_threshold,
             max_det=self.max_det,
-            imgsz=self.img_size,
+            imgsz=imgsz or self.img_size,
             device=self.device,
+            batch=len(frames),
             verbose=False,
         )
-
-        detections = []
+        outputs = []
         for result in results:
-            if result.boxes is None:
-                continue
-
-            boxes = result.boxes
-            for i in range(len(boxes)):
-                cls_id = int(boxes.cls[i].item())
-                conf = float(boxes.conf[i].item())
-                x1, y1, x2, y2 = boxes.xyxy[i].tolist()
-
-                # 원본 좌표로 역변환
-                if scale_info:
-                    factor = scale_info.get("scale_factor", 1.0)
-                    if factor != 1.0:
-                        x1, y1, x2, y2 = x1 / factor, y1 / factor, x2 / factor, y2 / factor
-
-                det = Detection(
-                    class_id=cls_id,
-                    class_name=CLASS_NAMES_EN.get(cls_id, f"class_{cls_id}"),
-                    class_name_ko=CLASS_NAMES_KO.get(cls_id, f"클래스_{cls_id}"),
-                    confidence=conf,
-                    bbox=(x1, y1, x2, y2),
-                )
-                detections.append(det)
+            if result.boxes is None or len(result.boxes) == 0:
+                outputs.append(np.empty((0, 6), dtype=np.float32))
+            else:
+                outputs.append(_remap_classes(result.boxes.data.cpu().numpy()[:, :6], lut))
+        return outputs
 
-        # 신뢰도 기준 정렬
-        detections.sort(key=lambda d: d.confidence, reverse=True)
+    @staticmethod
+    def _letterboxed_size(
+        frames: List[np.ndarray], scale_infos: Sequence[Optional[dict]]
+    ) -> Optional[int]:
+        """
+        프레임이 모두 전처리 레터박스(yolo_size 정사각형)면 그 크기를 추론 크기로 사용
 
-        logger.info(f"심볼 감지 완료 - {len(detections)}개 탐지")
-        self._log_detection_summary(detections)
+        img_size와 target_size가 달라도 다시 리사이즈하지 않는다. 아니면 None (img_size).
+        """
+        sizes = set()
+        for frame, info in zip(frames, scale_infos):
+            yolo_size = (info or {}).get("yolo_size")
+            if yolo_size is None or tuple(frame.shape[1::-1]) != tuple(yolo_size):
+                return None
+            sizes.add(yolo_size[0])
+        return sizes.pop() if len(sizes) == 1 else None
+
+    @staticmethod
+    def _unletterbox(detections: DetectionSet, scale_info: dict) -> DetectionSet:
+        """레터박스 좌표 → 원본 좌표 (패딩 오프셋 제거 → 배율 역산 → 이미지 범위로 자르기)"""
+        off_x, off_y = scale_info.get("pad_offset", (0, 0))
+        detections = detections.translate(-off_x, -off_y).scale(
+            1.0 / scale_info.get("scale_factor", 1.0)
+        )
+        size = scale_info.get("original_size")
+        if size is not None:
+            # 패딩 영역에만 걸친 박스는 잘린 뒤 면적이 0 → 제거
+            detections = detections.clip(*size)
         return detections
 
-    def _log_detection_summary(self, detections: List[Detection]) -> None:
+    def _to_detections(
+        self, boxes: np.ndarray, scale_info: Optional[dict], version: Optional[str] = None
+    ) -> DetectionSet:
+        """추론 결과 배열 → DetectionSet (원본 좌표 역변환 + 신뢰도 정렬 + 모델 버전)"""
+        detections = DetectionSet.from_array(boxes, version)
+        if scale_info:
+            detections = self._unletterbox(detections, scale_info)
+        return detections.sorted()
+
+    def _log_detection_summary(self, detections: DetectionSet) -> None:
         """감지 결과 요약 로깅"""
-        from collections import Counter
-        counter = Counter(d.class_name_ko for d in detections)
-        for name, count in counter.most_common():
-            logger.debug(f"  {name}: {count}개")
+        ids, counts = np.unique(detections.class_ids, return_counts=True)
+        for i in np.argsort(-counts, kind="stable"):
+            logger.debug(f"  {_class_name_ko(int(ids[i]))}: {counts[i]}개")
 
     def train(
         self,
@@ -232,13 +861,30 @@ class SymbolDetector:
     def export_results_image(
         self,
         image: np.ndarray,
-        detections: List[Detection],
+        detections: DetectionSet,
         output_path: str,
+        max_size: int = 0,
     ) -> None:
-        """감지 결과를 이미지에 시각화하여 저장"""
+        """
+        감지 결과를 이미지에 시각화하여 저장
+
+        Args:
+            max_size: 긴 변 최대 크기 (0이면 원본 해상도) - 축소본에 그려 복사/PNG 인코딩 비용 절감
+        """
         import cv2
 
-        vis_image = image.copy()
+        detections = DetectionSet.from_detections(detections)
+        h, w = image.shape[:2]
+        scale = min(1.0, max_size / max(h, w)) if max_size else 1.0
+        if scale < 1.0:
+            # 축소 결과가 새 배열이므로 원본 복사 불필요
+            vis_image = cv2.resize(
+                image, (max(1, int(w * scale)), max(1, int(h * scale))),
+                interpolation=cv2.INTER_AREA,
+            )
+            detections = detections.scale(scale)
+        else:
+            vis_image = image.copy()
         colors = {
             "wall": (100, 100, 100), "door_swing": (0, 180, 0),
             "door_sliding": (0, 255, 0), "door_entrance": (0, 128, 255),
@@ -249,12 +895,15 @@ class SymbolDetector:
             "dimension_line": (128, 128, 128),
         }
 
-        for det in detections:
-            x1, y1, x2, y2 = [int(v) for v in det.bbox]
-            color = colors.get(det.class_name, (0, 255, 0))
+        for (x1, y1, x2, y2), conf, cls_id in zip(
+            detections.boxes.astype(np.int32).tolist(),
+            detections.confidences.tolist(),
+            detections.class_ids.tolist(),
+        ):
+            color = colors.get(_class_name(cls_id), (0, 255, 0))
             cv2.rectangle(vis_image, (x1, y1), (x2, y2), color, 2)
 
-            label = f"{det.class_name_ko} {det.confidence:.2f}"
+            label = f"{_class_name_ko(cls_id)} {conf:.2f}"
             (tw, th), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
             cv2.rectangle(vis_image, (x1, y1 - th - 6), (x1 + tw, y1), color, -1)
             cv2.putText(vis_image, label, (x1, y1 - 4),
@@ -0,0 +1,211 @@
+"""
+후처리: 문/창문 심볼 → 벽 스냅
+감지된 문/창문을 균일 격자 공간 인덱스로 찾은 주변 벽에 붙이고,
+호스트 벽 ID와 벽 시작점 기준 오프셋을 기록한다 (프론트엔드 에디터의 최근접 벽 탐색 대체).
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+from loguru import logger
+
+from .symbol_detector import CLASS_NAMES_EN, DetectionSet
+from .wall_extractor import WallSegment
+
+# 스냅 대상 기본 클래스
+SNAP_CLASSES = ("door_swing", "door_sliding", "door_entrance", "window")
+
+
+class WallGridIndex:
+    """
+    벽 선분 균일 격자 인덱스
+
+    각 선분을 바운딩박스가 걸치는 격자 셀에 등록하고 (셀 키, 벽 인덱스)를
+    셀 키 순으로 정렬해 둔다. 조회는 셀 키마다 이진 탐색 (O(log W)).
+    """
+
+    def __init__(self, segments: np.ndarray, cell_size: float):
+        """
+        Args:
+            segments: (W, 4) [x1, y1, x2, y2]
+            cell_size: 격자 셀 한 변 (픽셀)
+        """
+        self.segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        self.cell_size = float(cell_size)
+
+        lo = np.floor(np.minimum(self.segments[:, :2], self.segments[:, 2:]) / self.cell_size)
+        hi = np.floor(np.maximum(self.segments[:, :2], self.segments[:, 2:]) / self.cell_size)
+        lo, hi = lo.astype(np.int64), hi.astype(np.int64)
+        # 셀 키 = 행 * 열 수 + 열 (음수 좌표도 원점 이동으로 처리)
+        self._origin = lo.min(axis=0) if len(lo) else np.zeros(2, np.int64)
+        self._cols = int(hi[:, 0].max() - self._origin[0] + 1) if len(hi) else 1
+
+        # 벽마다 걸치는 셀 (cx0..cx1) x (cy0..cy1)을 한 번에 전개
+        spans = hi - lo + 1
+        counts = spans[:, 0] * spans[:, 1]
+        walls = np.repeat(np.arange(len(counts)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = lo[walls, 0] + local % spans[walls, 0]
+        cy = lo[walls, 1] + local // spans[walls, 0]
+
+        keys = self._key(cx, cy)
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._walls = walls[order]
+
+    def _key(self, cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+        return (cy - self._origin[1]) * self._cols + (cx - self._origin[0])
+
+    def query(self, x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
+        """사각 영역이 걸치는 셀에 등록된 벽 인덱스 (후보, 중복 제거)"""
+        if not len(self._keys):
+            return np.empty(0, dtype=np.int64)
+        cs = self.cell_size
+        cx = np.arange(int(np.floor(x1 / cs)), int(np.floor(x2 / cs)) + 1)
+        cy = np.arange(int(np.floor(y1 / cs)), int(np.floor(y2 / cs)) + 1)
+        # 인덱스 범위 밖 열은 다른 행의 키와 겹치므로 제외
+        cx = cx[(cx >= self._origin[0]) & (cx < self._origin[0] + self._cols)]
+        cy = cy[cy >= self._origin[1]]
+        if not len(cx) or not len(cy):
+            return np.empty(0, dtype=np.int64)
+        keys = self._key(cx[None, :], cy[:, None]).ravel()
+        start = np.searchsorted(self._keys, keys, side="left")
+        stop = np.searchsorted(self._keys, keys, side="right")
+        hits = [self._walls[a:b] for a, b in zip(start.tolist(), stop.tolist()) if b > a]
+        return np.unique(np.concatenate(hits)) if hits else np.empty(0, dtype=np.int64)
+
+
+@dataclass
+class SymbolSnaps:
+    """
+    심볼별 스냅 결과 (DetectionSet 순서와 같은 배열)
+
+    wall_ids: 호스트 벽 인덱스 (-1: 스냅 안 됨 또는 대상 클래스 아님)
+    offsets: 벽 시작점에서 심볼 중심 투영점까지 거리 (픽셀)
+    distances: 심볼 박스와 벽 선분 사이 거리 (픽셀, 0이면 겹침)
+    points: 벽 위 투영점 (N, 2)
+    """
+    wall_ids: np.ndarray
+    offsets: np.ndarray
+    distances: np.ndarray
+    points: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.wall_ids)
+
+    @classmethod
+    def empty(cls, n: int) -> "SymbolSnaps":
+        return cls(
+            np.full(n, -1, dtype=np.int64),
+            np.zeros(n),
+            np.full(n, np.inf),
+            np.zeros((n, 2)),
+        )
+
+
+class SymbolSnapper:
+    """문/창문 → 벽 스냅 후처리"""
+
+    def __init__(self, config: dict):
+        self.enabled = config.get("enabled", True)
+        self.max_distance = config.get("max_distance", 20)  # 박스-벽 최대 거리 (픽셀)
+        cell_size = config.get("cell_size", 0)  # 0 = 자동
+        self.cell_size = cell_size or max(64, 2 * self.max_distance)
+        classes = config.get("classes", list(SNAP_CLASSES))
+        names = {v: k for k, v in CLASS_NAMES_EN.items()}
+        unknown = [c for c in classes if c not in names]
+        if unknown:
+            raise ValueError(f"알 수 없는 스냅 대상 클래스: {', '.join(unknown)}")
+        self.class_ids = np.array([names[c] for c in classes], dtype=np.int32)
+
+    def snap(self, detections: DetectionSet, walls: Sequence[WallSegment]) -> SymbolSnaps:
+        """
+        대상 클래스 심볼을 가장 가까운 벽에 스냅
+
+        호스트 벽은 박스-선분 거리가 가장 짧은 벽이고, 같으면 박스 안을 지나는
+        길이가 긴 벽 (문틀 양쪽 벽보다 개구부를 관통하는 벽 우선)이다.
+
+        Returns:
+            SymbolSnaps (detections와 같은 순서)
+        """
+        snaps = SymbolSnaps.empty(len(detections))
+        targets = np.flatnonzero(np.isin(detections.class_ids, self.class_ids))
+        if not self.enabled or not len(targets) or not len(walls):
+            return snaps
+
+        segments = np.array([(*w.start, *w.end) for w in walls], dtype=np.float64)
+        index = WallGridIndex(segments, self.cell_size)
+        boxes = detections.boxes.astype(np.float64)
+        m = self.max_distance
+
+        for i in targets.tolist():
+            x1, y1, x2, y2 = boxes[i]
+            candidates = index.query(x1 - m, y1 - m, x2 + m, y2 + m)
+            if not len(candidates):
+                continue
+            seg = segments[candidates]
+            dist, overlap = _box_segment_metrics(boxes[i], seg)
+            ok = dist <= m
+            if not ok.any():
+                continue
+            # 거리 오름차순 → 관통 길이 내림차순
+            order = np.lexsort((-overlap[ok], dist[ok]))
+            best = np.flatnonzero(ok)[order[0]]
+
+            sx, sy, ex, ey = seg[best]
+            d = np.array([ex - sx, ey - sy])
+            length = float(np.hypot(*d)) or 1e-9
+            center = np.array([(x1 + x2) / 2, (y1 + y2) / 2])
+            t = float(np.clip(np.dot(center - (sx, sy), d) / length ** 2, 0.0, 1.0))
+            snaps.wall_ids[i] = candidates[best]
+            snaps.offsets[i] = t * length
+            snaps.distances[i] = dist[best]
+            snaps.points[i] = (sx + t * d[0], sy + t * d[1])
+
+        n = int((snaps.wall_ids >= 0).sum())
+        logger.info(f"벽 스냅 - 대상 {len(targets)}개 중 {n}개 (벽 {len(walls)}개)")
+        return snaps
+
+
+def _box_segment_metrics(box: np.ndarray, seg: np.ndarray):
+    """
+    축 정렬 박스와 선분들 사이 거리 + 박스 안을 지나는 선분 길이
+
+    Args:
+        box: (4,) [x1, y1, x2, y2]
+        seg: (K, 4) [sx, sy, ex, ey]
+
+    Returns:
+        (거리 (K,), 관통 길이 (K,))
+    """
+    bx1, by1, bx2, by2 = box
+    p0, p1 = seg[:, :2], seg[:, 2:]
+    d = p1 - p0
+
+    # Liang-Barsky 클리핑: 박스 안 구간 [t0, t1]
+    p = np.stack([-d[:, 0], d[:, 0], -d[:, 1], d[:, 1]], axis=1)
+    q = np.stack([p0[:, 0] - bx1, bx2 - p0[:, 0], p0[:, 1] - by1, by2 - p0[:, 1]], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = q / p
+    t0 = np.max(np.where(p < 0, r, 0.0), axis=1)
+    t1 = np.min(np.where(p > 0, r, 1.0), axis=1)
+    parallel_out = ((p == 0) & (q < 0)).any(axis=1)
+    inside = (t0 <= t1) & ~parallel_out
+    overlap = np.where(inside, (t1 - t0) * np.hypot(d[:, 0], d[:, 1]), 0.0)
+
+    # 교차하지 않으면 최소 거리는 끝점-박스 또는 꼭짓점-선분에서 나온다
+    def point_box(pt):
+        dx = np.maximum.reduce([bx1 - pt[:, 0], np.zeros(len(pt)), pt[:, 0] - bx2])
+        dy = np.maximum.reduce([by1 - pt[:, 1], np.zeros(len(pt)), pt[:, 1] - by2])
+        return np.hypot(dx, dy)
+
+    corners = np.array([[bx1, by1], [bx2, by1], [bx1, by2], [bx2, by2]])
+    len2 = np.maximum((d ** 2).sum(axis=1), 1e-9)
+    t = ((corners[:, None, :] - p0[None]) * d[None]).sum(axis=2) / len2
+    proj = p0[None] + t.clip(0, 1)[..., None] * d[None]
+    corner_dist = np.hypot(*(corners[:, None, :] - proj).transpose(2, 0, 1)).min(axis=0)
+
+    dist = np.minimum.reduce([point_box(p0), point_box(p1), corner_dist])
+    return np.where(inside, 0.0, dist), overlap
+
@@ -0,0 +1,134 @@
+"""
+텍스트 사전 인덱스
+방 이름 사전을 한 번 컴파일해 두고 OCR 텍스트마다 사전 크기와 무관한 시간에 조회한다.
+- AhoCorasick: 사전 단어가 텍스트에 부분 문자열로 있는지 (텍스트 길이에 비례)
+- FuzzyIndex: OCR 오인식 단어의 근사 일치 (SymSpell 방식 대칭 삭제 인덱스, 자모 단위)
+"""
+
+import unicodedata
+from collections import deque
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class AhoCorasick:
+    """다중 패턴 부분 문자열 검색 오토마톤"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Optional[str]] = [None]  # 이 상태에서 끝나는 가장 긴 패턴 (실패 링크 포함)
+
+        for pattern in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(None)
+                node = nxt
+            self._out[node] = pattern
+
+        # BFS로 실패 링크 연결 (루트 자식의 실패 링크는 루트)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                if self._out[nxt] is None:
+                    self._out[nxt] = self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> Optional[str]:
+        """텍스트에 처음 나타나는 (끝 위치 기준) 사전 단어, 없으면 None"""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node] is not None:
+                return out[node]
+        return None
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (NFD), 그 밖의 글자는 그대로"""
+    return unicodedata.normalize("NFD", text)
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """word에서 최대 max_distance 글자를 지운 모든 문자열 (word 포함)"""
+    result = {word}
+    for d in range(1, min(max_distance, len(word)) + 1):
+        for idx in combinations(range(len(word)), d):
+            skip = set(idx)
+            result.add("".join(ch for i, ch in enumerate(word) if i not in skip))
+    return result
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Damerau-Levenshtein 거리 (인접 글자 교환 포함, OSA)"""
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class FuzzyIndex:
+    """
+    대칭 삭제 (SymSpell) 근사 일치 인덱스
+
+    사전 단어마다 최대 max_distance 글자를 지운 변형을 미리 색인하고, 조회 단어도
+    같은 방식으로 지워 교집합 후보만 편집 거리로 검증한다. 조회 비용은 단어 길이에만 의존.
+    거리와 길이는 자모 단위 - OCR 오인식은 보통 음절 안의 자모 하나 ("거싈" → 거실)이고,
+    음절 전체가 바뀐 두 글자 단어 ("주차" → 주방)는 거리 2 이상이 되어 일치하지 않는다.
+
+    Args:
+        words: 사전 단어
+        max_distance: 허용 편집 거리 (자모)
+        min_length: 색인/조회할 최소 길이 (자모) - 한 음절 ("방")이나 두 글자 영문 약어 ("BR")는
+            거리 1도 다른 단어가 되므로 정확 일치만
+    """
+
+    def __init__(self, words: Iterable[str], max_distance: int = 1, min_length: int = 4):
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self._index: Dict[str, List[Tuple[str, str]]] = {}
+        for word in set(words):
+            jamo = decompose(word)
+            if len(jamo) < min_length:
+                continue
+            for variant in _deletes(jamo, max_distance):
+                self._index.setdefault(variant, []).append((jamo, word))
+
+    def lookup(self, term: str) -> Optional[Tuple[str, int]]:
+        """가장 가까운 사전 단어와 자모 편집 거리 (거리가 같으면 긴 단어), 없으면 None"""
+        term = decompose(term)
+        if len(term) < self.min_length:
+            return None
+        best = None
+        for variant in _deletes(term, self.max_distance):
+            for jamo, word in self._index.get(variant, ()):
+                distance = edit_distance(term, jamo)
+                if distance > self.max_distance:
+                    continue
+                key = (distance, -len(word), word)
+                if best is None or key < best[0]:
+                    best = (key, word, distance)
+        return (best[1], best[2]) if best else None
@@ -10,6 +10,9 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
+from .text_index import AhoCorasick, FuzzyIndex
+from .text_regions import TextRegionProposer, pack_mosaics
+
 
 @dataclass
 class TextBlock:
@@ -45,6 +48,9 @@ class TextRecognizer:
         r'(\d+\.?\d*)\s*(㎡|m²|m2|평|PY|py)', re.IGNORECASE
     )
 
+    # 근사 일치 대상 단어 (숫자/기호 제외 글자 묶음)
+    WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
     # 치수 패턴 (3,600 / 2400 / 1.2m 등)
     DIMENSION_PATTERN = re.compile(
         r'(\d{1,2}[,.]?\d{3}|\d{3,5})\s*(mm)?', re.IGNORECASE
@@ -56,7 +62,31 @@ class TextRecognizer:
         self.conf_threshold = config.get("confidence_threshold", 0.3)
         self.custom_room_names = set(config.get("room_names", []))
         self.all_room_names = self.ROOM_NAMES | self.custom_room_names
+        # 방 이름 사전은 한 번 컴파일 - 분류 시간은 사전 크기와 무관하게 텍스트 길이에 비례
+        self.room_matcher = AhoCorasick(self.all_room_names)
+        fuzzy = config.get("fuzzy", {})
+        self.room_index = FuzzyIndex(
+            self.all_room_names,
+            max_distance=fuzzy.get("max_distance", 1),
+            # 자모 단위 - 한 음절 ("방")과 두 글자 영문 약어 ("BR")는 정확 일치만
+            min_length=fuzzy.get("min_length", 4),
+        ) if fuzzy.get("enabled", True) else None
+        # 텍스트 영역 후보 크롭만 OCR (전체 페이지 대신)
+        self.proposer = TextRegionProposer(config.get("proposals", {}))
+        # 여러 크롭/페이지를 모자이크로 묶어 엔진 호출 횟수 축소
+        batch = config.get("batch", {})
+        self.batch_enabled = batch.get("enabled", True)
+        self.mosaic_size = batch.get("mosaic_size", 2560)  # EasyOCR canvas_size 이하
+        self.bucket_step = batch.get("bucket_step", 16)    # 크롭 높이 버킷 간격 (픽셀)
+        self.batch_size = batch.get("batch_size", 16)      # EasyOCR 인식기 배치 (GPU)
+        # 2단 인식: 숫자 후보 크롭은 숫자 전용 설정 (검출 생략 + 허용 문자 제한)으로 먼저 읽음
+        digits = config.get("digits", {})
+        self.digits_enabled = digits.get("enabled", True)
+        self.digit_languages = digits.get("languages", ["en"])
+        self.digit_allowlist = digits.get("allowlist", "0123456789,.")
+        self.digit_min_confidence = digits.get("min_confidence", 0.5)  # 미만이면 전체 모델로 재인식
         self.reader = None
+        self.digit_reader = None
 
     def _init_engine(self) -> None:
         """OCR 엔진 초기화 (lazy loading)"""
@@ -66,11 +96,17 @@ class TextRecognizer:
         if self.engine == "easyocr":
             try:
                 import easyocr
+                gpu = self._check_gpu()
                 self.reader = easyocr.Reader(
                     self.languages,
-                    gpu=self._check_gpu(),
+                    gpu=gpu,
                     verbose=False,
                 )
+                if self.digits_enabled:
+                    # 크롭 전체를 한 줄로 읽으므로 검출기(CRAFT) 없이 인식기만 로드
+                    self.digit_reader = easyocr.Reader(
+                        self.digit_languages, gpu=gpu, detector=False, verbose=False,
+                    )
                 logger.info(f"EasyOCR 초기화 완료 - 언어: {self.languages}")
             except ImportError:
                 logger.error("easyocr 미설치: pip install easyocr")
@@ -86,25 +122,164 @@ class TextRecognizer:
         except ImportError:
             return False
 
-    def recognize(self, image: np.ndarray) -> List[TextBlock]:
+    def recognize(self, image: np.ndarray, binary: Optional[np.ndarray] = None) -> List[TextBlock]:
         """
         평면도 이미지에서 텍스트 인식
 
         Args:
             image: 그레이스케일 또는 BGR 이미지
+            binary: image와 같은 크기의 이진 이미지 (텍스트 영역 후보 추출용, 없으면 직접 이진화)
 
         Returns:
             List[TextBlock]: 인식된 텍스트 블록 리스트
         """
+        return self.recognize_batch([image], [binary])[0]
+
+    def recognize_batch(
+        self,
+        images: List[np.ndarray],
+        binaries: Optional[List[Optional[np.ndarray]]] = None,
+    ) -> List[List[TextBlock]]:
+        """
+        여러 페이지 텍스트 인식 - 모든 페이지의 텍스트 후보 크롭을 모자이크로 묶어 인식
+
+        Args:
+            images: 그레이스케일 또는 BGR 이미지 리스트
+            binaries: 이미지별 이진 이미지 (없으면 직접 이진화)
+
+        Returns:
+            페이지별 TextBlock 리스트 (입력 순서 유지)
+        """
         self._init_engine()
-        logger.info("텍스트 인식 시작")
+        logger.info(f"텍스트 인식 시작 ({len(images)}페이지)")
 
-        if self.engine == "easyocr":
-            raw_results = self._recognize_easyocr(image)
-        else:
-            raw_results = self._recognize_tesseract(image)
+        engine = self._recognize_easyocr if self.engine == "easyocr" else self._recognize_tesseract
+        use_digits = self.digits_enabled and (
+            self.engine != "easyocr" or self.digit_reader is not None
+        )
+        binaries = binaries or [None] * len(images)
+        raw_results: List[List[tuple]] = [[] for _ in images]
+        crops = []  # (페이지, x1, y1, x2, y2)
+        digit_crops = []  # (페이지, x1, y1, x2, y2, 세로 여부)
+        for page, (image, binary) in enumerate(zip(images, binaries)):
+            regions = None
+            if self.proposer.enabled:
+                if binary is None:
+                    binary = self.proposer.binarize(image)
+                regions = self.proposer.propose(binary)
+            if regions is None:
+                raw_results[page] = engine(image)
+                continue
+            h, w = image.shape[:2]
+            area = int(((regions[:, 2] - regions[:, 0]) * (regions[:, 3] - regions[:, 1])).sum())
+            logger.debug(f"  페이지 {page + 1}: 후보 {len(regions)}개 (면적 {area / (h * w):.1%})")
+            numeric = np.zeros(len(regions), dtype=bool)
+            if use_digits:
+                numeric, vertical = self.proposer.classify_numeric(binary, regions)
+                digit_crops.extend(
+                    (page, *region, v) for region, v in
+                    zip(regions[numeric].tolist(), vertical[numeric].tolist())
+                )
+            crops.extend((page, *region) for region in regions[~numeric].tolist())
+
+        # 1단: 숫자 후보 → 숫자 전용 인식, 치수 형식이 아니거나 신뢰도가 낮으면 2단으로
+        if digit_crops:
+            crops.extend(self._recognize_digits(images, digit_crops, raw_results))
+
+        # 2단: 나머지 → 전체 모델 (검출 + 인식)
+        if crops:
+            logger.info(f"텍스트 후보 {len(crops)}개 전체 모델 인식")
+            crop_images = [images[page][y1:y2, x1:x2] for page, x1, y1, x2, y2 in crops]
+            for (page, x1, y1, _, _), found in zip(crops, self._read_crops(crop_images, engine)):
+                for (bx1, by1, bx2, by2), text, conf in found:
+                    raw_results[page].append(((bx1 + x1, by1 + y1, bx2 + x1, by2 + y1), text, conf))
+
+        results = [self._to_blocks(raw) for raw in raw_results]
+        n_blocks = sum(len(blocks) for blocks in results)
+        logger.info(f"텍스트 인식 완료 - {n_blocks}개 블록")
+        self._log_summary([b for blocks in results for b in blocks])
+        return results
+
+    def _recognize_digits(
+        self, images: List[np.ndarray], crops: List[tuple], raw_results: List[List[tuple]]
+    ) -> List[tuple]:
+        """
+        숫자 후보 크롭을 숫자 전용 설정으로 인식 (세로 줄은 돌려서 가로로)
+
+        치수 형식 (DIMENSION_PATTERN 전체 일치)이고 신뢰도가 충분한 결과만 raw_results에
+        추가하고, 나머지 크롭은 전체 모델로 다시 읽도록 반환한다.
 
-        # 필터링 및 카테고리 분류
+        Returns:
+            재인식할 크롭 [(페이지, x1, y1, x2, y2), ...]
+        """
+        engine = (self._recognize_digits_easyocr if self.engine == "easyocr"
+                  else self._recognize_digits_tesseract)
+        crop_images = []
+        for page, x1, y1, x2, y2, vertical in crops:
+            crop = images[page][y1:y2, x1:x2]
+            # 도면의 세로 치수는 아래→위로 쓰므로 시계 방향으로 돌려 가로로
+            crop_images.append(cv2.rotate(crop, cv2.ROTATE_90_CLOCKWISE) if vertical else crop)
+
+        retry = []
+        for (page, x1, y1, x2, y2, _), found in zip(crops, self._read_crops(crop_images, engine)):
+            # 한 줄로 합침 (tesseract는 단어 단위로 나눌 수 있음)
+            found = sorted(found, key=lambda r: r[0][0])
+            text = "".join(t for _, t, _ in found).strip()
+            conf = min((c for _, _, c in found), default=0.0)
+            match = self.DIMENSION_PATTERN.fullmatch(text)
+            if match is None or conf < self.digit_min_confidence:
+                retry.append((page, x1, y1, x2, y2))
+                continue
+            raw_results[page].append(((x1, y1, x2, y2), text, conf))
+        logger.info(f"숫자 후보 {len(crops)}개 숫자 전용 인식 (전체 모델 재인식 {len(retry)}개)")
+        return retry
+
+    def _read_crops(self, crop_images: List[np.ndarray], engine) -> List[List[tuple]]:
+        """
+        크롭별 인식 결과 (크롭 좌표) - batch가 켜져 있으면 모자이크 캔버스당 엔진 1회 호출
+
+        engine(image, cells)는 cells (K, 4) [x1, y1, x2, y2]에 크롭이 놓여 있다는 정보를 받아
+        [(bbox, text, conf), ...]를 image 좌표로 반환한다.
+        """
+        found: List[List[tuple]] = [[] for _ in crop_images]
+        if not self.batch_enabled:
+            for i, crop in enumerate(crop_images):
+                h, w = crop.shape[:2]
+                found[i] = engine(crop, np.array([(0, 0, w, h)]))
+            return found
+
+        sizes = [crop.shape[:2] for crop in crop_images]
+        mosaics = pack_mosaics(sizes, self.mosaic_size, self.bucket_step)
+        logger.debug(f"  크롭 {len(crop_images)}개 → 모자이크 {len(mosaics)}장")
+        for height, width, placed in mosaics:
+            canvas = np.full((height, width), 255, np.uint8)
+            for i, x, y in placed:
+                crop = crop_images[i]
+                if crop.ndim == 3:
+                    crop = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+                canvas[y:y + crop.shape[0], x:x + crop.shape[1]] = crop
+
+            # 배치 위치 (K, 4) [x1, y1, x2, y2] - 결과 박스 중심으로 크롭 찾기
+            cells = np.array([(x, y, x + sizes[i][1], y + sizes[i][0]) for i, x, y in placed])
+            for (bx1, by1, bx2, by2), text, conf in engine(canvas, cells):
+                cx, cy = (bx1 + bx2) / 2, (by1 + by2) / 2
+                hit = np.flatnonzero(
+                    (cells[:, 0] <= cx) & (cx < cells[:, 2])
+                    & (cells[:, 1] <= cy) & (cy < cells[:, 3])
+                )
+                if not len(hit):
+                    continue  # 여백에서 나온 결과
+                cx1, cy1, cx2, cy2 = cells[hit[0]].tolist()
+                # 크롭 영역으로 자른 뒤 크롭 좌표로
+                bbox = (
+                    max(bx1, cx1) - cx1, max(by1, cy1) - cy1,
+                    min(bx2, cx2) - cx1, min(by2, cy2) - cy1,
+                )
+                found[placed[hit[0]][0]].append((bbox, text, conf))
+        return found
+
+    def _to_blocks(self, raw_results: List[tuple]) -> List[TextBlock]:
+        """엔진 결과 필터링 및 카테고리 분류"""
         text_blocks = []
         for bbox, text, conf in raw_results:
             if conf < self.conf_threshold:
@@ -120,14 +295,27 @@ class TextRecognizer:
                 category=category,
             )
             text_blocks.append(block)
-
-        logger.info(f"텍스트 인식 완료 - {len(text_blocks)}개 블록")
-        self._log_summary(text_blocks)
         return text_blocks
 
-    def _recognize_easyocr(self, image: np.ndarray) -> List[tuple]:
-        """EasyOCR 엔진으로 인식"""
-        results = self.reader.readtext(image)
+    def _recognize_easyocr(
+        self, image: np.ndarray, cells: Optional[np.ndarray] = None
+    ) -> List[tuple]:
+        """EasyOCR 엔진으로 인식 (검출 + 인식)"""
+        return self._parse_easyocr(self.reader.readtext(image, batch_size=self.batch_size))
+
+    def _recognize_digits_easyocr(self, image: np.ndarray, cells: np.ndarray) -> List[tuple]:
+        """EasyOCR 숫자 전용 인식 - 검출 없이 cells를 한 줄씩 인식 (허용 문자 제한)"""
+        results = self.digit_reader.recognize(
+            image,
+            horizontal_list=[[x1, x2, y1, y2] for x1, y1, x2, y2 in cells.tolist()],
+            free_list=[],
+            allowlist=self.digit_allowlist,
+            batch_size=self.batch_size,
+        )
+        return self._parse_easyocr(results)
+
+    @staticmethod
+    def _parse_easyocr(results) -> List[tuple]:
         parsed = []
         for (pts, text, conf) in results:
             # EasyOCR bbox: [[x1,y1],[x2,y1],[x2,y2],[x1,y2]] → (x1,y1,x2,y2)
@@ -137,7 +325,10 @@ class TextRecognizer:
             parsed.append((bbox, text, conf))
         return parsed
 
-    def _recognize_tesseract(self, image: np.ndarray) -> List[tuple]:
+    def _recognize_tesseract(
+        self, image: np.ndarray, cells: Optional[np.ndarray] = None,
+        lang: str = "kor+eng", config: str = "",
+    ) -> List[tuple]:
         """Tesseract 엔진으로 인식"""
         try:
             import pytesseract
@@ -146,7 +337,7 @@ class TextRecognizer:
             raise
 
         data = pytesseract.image_to_data(
-            image, lang="kor+eng", output_type=pytesseract.Output.DICT
+            image, lang=lang, config=config, output_type=pytesseract.Output.DICT
         )
         parsed = []
         for i in range(len(data["text"])):
@@ -159,12 +350,17 @@ class TextRecognizer:
             parsed.append((bbox, text, conf))
         return parsed
 
+    def _recognize_digits_tesseract(self, image: np.ndarray, cells: np.ndarray) -> List[tuple]:
+        """Tesseract 숫자 전용 인식 (영문 모델 + 허용 문자 제한)"""
+        return self._recognize_tesseract(
+            image, lang="eng", config=f"--psm 6 -c tessedit_char_whitelist={self.digit_allowlist}",
+        )
+
     def _classify_text(self, text: str) -> str:
         """텍스트 카테고리 분류"""
-        # 1. 방 이름 체크
-        for room_name in self.all_room_names:
-            if room_name in text:
-                return "room_name"
+        # 1. 방 이름 체크 (사전 단어 부분 문자열)
+        if self.room_matcher.search(text) is not None:
+            return "room_name"
 
         # 2. 면적 체크
         if self.AREA_PATTERN.search(text):
@@ -179,6 +375,12 @@ class TextRecognizer:
         if cleaned.isdigit() and len(cleaned) >= 3:
             return "dimension"
 
+        # 5. OCR 오인식 방 이름 ("거싈" → 거실, 자모 하나 차이)
+        if self.room_index is not None and any(
+            self.room_index.lookup(word) for word in self.WORD_PATTERN.findall(text)
+        ):
+            return "room_name"
+
         return "unknown"
 
     def extract_dimensions(self, text_blocks: List[TextBlock]) -> List[Dict]:
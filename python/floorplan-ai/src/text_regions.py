@@ -0,0 +1,216 @@
+"""
+텍스트 영역 후보 추출
+이진 이미지의 연결 요소를 글자 크기/비율/밀도로 걸러 글자 후보를 고르고,
+가까운 글자끼리 묶어 텍스트 줄 박스를 만든다. OCR은 이 박스 크롭만 처리한다.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+from loguru import logger
+
+
+class TextRegionProposer:
+    """연결 요소 기반 텍스트 영역 후보 추출기"""
+
+    def __init__(self, config: dict):
+        self.enabled = config.get("enabled", True)
+        self.min_char_height = config.get("min_char_height", 8)    # 글자 긴 변 최소 (픽셀)
+        self.max_char_height = config.get("max_char_height", 120)  # 글자 긴 변 최대 (픽셀)
+        self.max_aspect = config.get("max_aspect", 12.0)           # 긴 변 / 짧은 변 최대
+        self.min_density = config.get("min_density", 0.1)   # 전경 픽셀 / 박스 면적 (사선, 호 제외)
+        self.max_density = config.get("max_density", 0.9)   # 채워진 기둥/심볼 제외
+        self.line_gap = config.get("line_gap", 1.5)         # 같은 줄로 묶을 글자 간격 (글자 높이 배수)
+        self.padding = config.get("padding", 0.3)           # 크롭 여백 (줄 글자 높이 배수)
+        self.min_glyphs = config.get("min_glyphs", 2)       # 줄 최소 글자 요소 수 (고립된 기둥/마커 제외)
+        self.max_coverage = config.get("max_coverage", 0.5)  # 후보 면적 비율이 넘으면 전체 페이지 OCR
+        if self.min_char_height > self.max_char_height:
+            raise ValueError("min_char_height가 max_char_height보다 큽니다")
+
+    def binarize(self, image: np.ndarray) -> np.ndarray:
+        """OCR 입력에서 직접 이진화 (전처리 이진 이미지가 없을 때, 전경 = 255)"""
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        # 대비 향상으로 커진 스캔 노이즈가 글자 후보로 잡히지 않도록 메디안 필터 + 높은 C
+        return cv2.adaptiveThreshold(
+            cv2.medianBlur(gray, 3), 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV,
+            blockSize=31, C=30,
+        )
+
+    def _glyph_mask(self, stats: np.ndarray) -> np.ndarray:
+        """연결 요소 통계 (N, 5) [x, y, w, h, area] → 글자 후보 여부 (크기/비율/밀도)"""
+        bw, bh, area = stats[:, 2], stats[:, 3], stats[:, 4]
+        long_side = np.maximum(bw, bh)
+        short_side = np.maximum(np.minimum(bw, bh), 1)
+        density = area / np.maximum(bw * bh, 1)
+        glyph = (
+            (long_side >= self.min_char_height)
+            & (long_side <= self.max_char_height)
+            & (long_side / short_side <= self.max_aspect)
+            & (density >= self.min_density)
+        )
+        # 가는 글자 ("1", "l")는 밀도가 높으므로 짧은 변도 충분히 큰 덩어리만 밀도 상한 적용
+        return glyph & ~((short_side >= self.min_char_height) & (density > self.max_density))
+
+    def propose(self, binary: np.ndarray) -> Optional[np.ndarray]:
+        """
+        텍스트 줄 후보 박스 추출
+
+        Args:
+            binary: 이진 이미지 (전경 = 255)
+
+        Returns:
+            (K, 4) int [x1, y1, x2, y2] (여백 포함, 이미지 범위로 자름),
+            후보 면적이 max_coverage를 넘으면 None (전체 페이지 OCR이 더 싸다)
+        """
+        h, w = binary.shape[:2]
+        _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        stats = stats[1:]  # 배경 제외
+        glyph = self._glyph_mask(stats)
+        boxes = stats[glyph, :4].astype(np.int64)
+        if not len(boxes):
+            return np.empty((0, 4), dtype=np.int64)
+        boxes[:, 2:] += boxes[:, :2]  # (x, y, w, h) → (x1, y1, x2, y2)
+
+        # 글자 박스를 자기 높이 비례 간격만큼 넓혀 칠함 → 연결 요소 = 텍스트 줄 (가로/세로 공통)
+        char_h = np.maximum(stats[glyph, 2], stats[glyph, 3])
+        grow = np.ceil(self.line_gap * char_h / 2).astype(np.int64)
+        mask = np.zeros((h, w), np.uint8)
+        for x1, y1, x2, y2, g in np.column_stack([boxes, grow]).tolist():
+            mask[max(y1 - g, 0):y2 + g, max(x1 - g, 0):x2 + g] = 255
+        n_lines, labels = cv2.connectedComponents(mask, connectivity=8)
+
+        # 팽창 전 글자 박스 합집합으로 줄 박스 복원
+        cx = (boxes[:, 0] + boxes[:, 2] - 1) // 2
+        cy = (boxes[:, 1] + boxes[:, 3] - 1) // 2
+        line = labels[cy, cx]
+        lines = np.empty((n_lines, 4), dtype=np.int64)
+        lines[:, :2] = np.iinfo(np.int64).max
+        lines[:, 2:] = np.iinfo(np.int64).min
+        np.minimum.at(lines[:, 0], line, boxes[:, 0])
+        np.minimum.at(lines[:, 1], line, boxes[:, 1])
+        np.maximum.at(lines[:, 2], line, boxes[:, 2])
+        np.maximum.at(lines[:, 3], line, boxes[:, 3])
+        line_h = np.zeros(n_lines, dtype=np.int64)
+        np.maximum.at(line_h, line, char_h)
+        # 한글 음절은 보통 여러 요소 (ㅂ+ㅏ+ㅇ), 숫자/영문 라벨은 여러 글자
+        used = np.flatnonzero(np.bincount(line, minlength=n_lines) >= self.min_glyphs)
+        lines, line_h = lines[used], line_h[used]
+
+        pad = np.round(self.padding * line_h).astype(np.int64)
+        lines[:, 0] = np.maximum(lines[:, 0] - pad, 0)
+        lines[:, 1] = np.maximum(lines[:, 1] - pad, 0)
+        lines[:, 2] = np.minimum(lines[:, 2] + pad, w)
+        lines[:, 3] = np.minimum(lines[:, 3] + pad, h)
+
+        areas = (lines[:, 2] - lines[:, 0]) * (lines[:, 3] - lines[:, 1])
+        coverage = float(areas.sum()) / (h * w)
+        logger.debug(
+            f"텍스트 후보 - 글자 {len(boxes)}개 → 줄 {len(lines)}개 (면적 {coverage:.1%})"
+        )
+        if coverage > self.max_coverage:
+            return None
+        return lines
+
+    def classify_numeric(
+        self, binary: np.ndarray, regions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        숫자(치수) 줄 후보 판별 - 글자 모양 또는 치수선 옆 위치
+
+        글자 요소가 3개 이상이고, 한 줄에서 모든 글자가 줄 높이를 채우는 좁은 모양이거나
+        (한글 자모는 줄 높이 일부만 차지) 줄과 나란한 치수선이 바로 옆에 있으면 숫자 후보.
+        오분류는 인식 결과 검증 (치수 형식/신뢰도)에서 전체 모델로 넘어간다.
+        세로 줄 (높이 > 폭)은 90도 돌린 기준으로 판별한다.
+
+        Args:
+            binary: propose()에 넣은 이진 이미지
+            regions: propose() 결과 (K, 4)
+
+        Returns:
+            (숫자 후보 (K,), 세로 줄 (K,))
+        """
+        vertical = (regions[:, 3] - regions[:, 1]) > (regions[:, 2] - regions[:, 0])
+        numeric = np.zeros(len(regions), dtype=bool)
+        for k, (x1, y1, x2, y2) in enumerate(regions.tolist()):
+            crop = binary[y1:y2, x1:x2]
+            if vertical[k]:
+                crop = np.ascontiguousarray(crop.T)  # 세로 줄 → 가로 기준 (행/열 교환)
+            _, _, stats, _ = cv2.connectedComponentsWithStats(crop, connectivity=8)
+            stats = stats[1:]
+            stats = stats[self._glyph_mask(stats)]
+            if len(stats) < 3:
+                continue
+            top, bottom = stats[:, 1], stats[:, 1] + stats[:, 3]
+            line_h = int(bottom.max() - top.min())
+            # 한 줄 (여러 줄이나 위아래로 쌓인 자모가 아님) + 모든 글자가 줄 높이를 채우는 좁은 모양
+            digit_shape = bool(
+                top.max() < bottom.min()
+                and ((stats[:, 3] >= 0.75 * line_h) & (stats[:, 2] <= 0.9 * line_h)).all()
+            )
+            numeric[k] = digit_shape or self._beside_line(
+                binary, (x1, y1, x2, y2), vertical[k], line_h
+            )
+        return numeric, vertical
+
+    @staticmethod
+    def _beside_line(binary: np.ndarray, region: tuple, vertical: bool, line_h: int) -> bool:
+        """줄 위아래 (세로 줄은 좌우) 글자 높이 안에 줄 길이를 거의 채우는 직선이 있는지"""
+        x1, y1, x2, y2 = region
+        if vertical:
+            band = binary[y1:y2, max(x1 - line_h, 0):x2 + line_h]
+            fill = (band > 0).mean(axis=0)
+        else:
+            band = binary[max(y1 - line_h, 0):y2 + line_h, x1:x2]
+            fill = (band > 0).mean(axis=1)
+        return bool(len(fill) and (fill >= 0.9).any())
+
+
+def pack_mosaics(
+    sizes: Sequence[Tuple[int, int]], mosaic_size: int, bucket_step: int
+) -> List[Tuple[int, int, List[Tuple[int, int, int]]]]:
+    """
+    텍스트 크롭을 높이 버킷별 행으로 모아 모자이크 캔버스에 배치 (선반 패킹)
+
+    같은 버킷 크롭은 같은 행 높이를 공유해 빈 공간이 적고, 크롭/행 사이 여백은
+    행 높이만큼 두어 OCR 검출기가 다른 크롭 글자를 한 덩어리로 잇지 않게 한다.
+    mosaic_size보다 큰 크롭은 단독 캔버스.
+
+    Args:
+        sizes: 크롭별 (높이, 너비)
+        mosaic_size: 캔버스 한 변 최대 (EasyOCR canvas_size 이하 - 넘으면 축소되어 인식률 저하)
+        bucket_step: 높이 버킷 간격 (픽셀)
+
+    Returns:
+        [(캔버스 높이, 캔버스 너비, [(크롭 인덱스, x, y), ...]), ...]
+    """
+    mosaics = []
+    placed: List[Tuple[int, int, int]] = []
+    x = y = row_h = canvas_w = 0
+
+    def flush():
+        nonlocal placed, x, y, row_h, canvas_w
+        if placed:
+            mosaics.append((y + row_h, canvas_w, placed))
+        placed, x, y, row_h, canvas_w = [], 0, 0, 0, 0
+
+    # 버킷 오름차순, 버킷 안에서는 넓은 크롭부터
+    buckets = [-(-h // bucket_step) for h, _ in sizes]
+    for i in sorted(range(len(sizes)), key=lambda i: (buckets[i], -sizes[i][1])):
+        h, w = sizes[i]
+        if h > mosaic_size or w > mosaic_size:
+            mosaics.append((h, w, [(i, 0, 0)]))
+            continue
+        height = buckets[i] * bucket_step
+        gap = height
+        if placed and (height != row_h or x + w > mosaic_size):
+            # 새 행 (버킷이 바뀌거나 행이 가득 참)
+            x, y = 0, y + row_h + max(row_h, height)
+            if y + height > mosaic_size:
+                flush()
+        placed.append((i, x, y))
+        row_h = height
+        canvas_w = max(canvas_w, x + w)
+        x += w + gap
+    flush()
+    return mosaics
@@ -0,0 +1,137 @@
+"""
+타일 처리 유틸리티
+대형 스캔을 겹치는 타일로 나눠 병렬 처리 (OpenCV 연산은 GIL을 해제하므로 스레드 풀 사용)
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Tile:
+    """타일 영역 - core는 결과를 기록할 영역, padded는 겹침을 포함한 입력 영역"""
+    y0: int
+    y1: int
+    x0: int
+    x1: int
+    py0: int
+    py1: int
+    px0: int
+    px1: int
+
+    @property
+    def core_in_padded(self) -> Tuple[slice, slice]:
+        """패딩 타일 좌표계에서의 core 영역"""
+        return (
+            slice(self.y0 - self.py0, self.y1 - self.py0),
+            slice(self.x0 - self.px0, self.x1 - self.px0),
+        )
+
+
+@dataclass(frozen=True)
+class TilingConfig:
+    """타일 처리 설정"""
+    enabled: bool = False
+    tile_size: int = 2048
+    overlap: int = 64
+    workers: int = 0  # 0 = CPU 코어 수
+
+    @classmethod
+    def from_dict(cls, config: dict, **defaults) -> "TilingConfig":
+        merged = {**defaults, **(config or {})}
+        return cls(
+            enabled=merged.get("enabled", cls.enabled),
+            tile_size=merged.get("tile_size", cls.tile_size),
+            overlap=merged.get("overlap", cls.overlap),
+            workers=merged.get("workers", cls.workers),
+        )
+
+    def applies_to(self, shape: Tuple[int, ...]) -> bool:
+        """타일 처리 대상 여부 (활성화 + 한 타일보다 큰 이미지)"""
+        return self.enabled and max(shape[:2]) > self.tile_size
+
+    @property
+    def max_workers(self) -> int:
+        return self.workers or os.cpu_count() or 1
+
+
+def iter_tiles(shape: Tuple[int, ...], tile_size: int, overlap: int) -> Iterator[Tile]:
+    """이미지를 tile_size 격자로 나누고 각 타일에 overlap만큼 여유를 붙인다"""
+    h, w = shape[:2]
+    for y0 in range(0, h, tile_size):
+        for x0 in range(0, w, tile_size):
+            y1, x1 = min(y0 + tile_size, h), min(x0 + tile_size, w)
+            yield Tile(
+                y0, y1, x0, x1,
+                max(0, y0 - overlap), min(h, y1 + overlap),
+                max(0, x0 - overlap), min(w, x1 + overlap),
+            )
+
+
+def map_tiles(
+    image: np.ndarray,
+    func: Callable[[np.ndarray], np.ndarray],
+    config: TilingConfig,
+) -> np.ndarray:
+    """
+    타일별로 func를 적용하고 core 영역을 이어붙인 결과 반환
+
+    func는 입력과 같은 높이/너비의 단일 채널 uint8 이미지를 반환해야 한다.
+    임시 버퍼는 타일 크기에 비례하고, 페이지 크기의 출력 버퍼 하나만 할당된다.
+    """
+    out = np.empty(image.shape[:2], dtype=np.uint8)
+    tiles = list(iter_tiles(image.shape, config.tile_size, config.overlap))
+
+    def run(tile: Tile) -> None:
+        result = func(image[tile.py0:tile.py1, tile.px0:tile.px1])
+        out[tile.y0:tile.y1, tile.x0:tile.x1] = result[tile.core_in_padded]
+
+    with ThreadPoolExecutor(max_workers=min(config.max_workers, len(tiles))) as pool:
+        list(pool.map(run, tiles))
+    return out
+
+
+def collect_tiles(
+    image: np.ndarray,
+    func: Callable[[np.ndarray, Tile], List],
+    config: TilingConfig,
+) -> List:
+    """타일별로 func(패딩 타일, 타일)를 실행하고 결과 리스트를 이어붙여 반환"""
+    tiles = list(iter_tiles(image.shape, config.tile_size, config.overlap))
+
+    def run(tile: Tile) -> List:
+        return func(image[tile.py0:tile.py1, tile.px0:tile.px1], tile)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=min(config.max_workers, len(tiles))) as pool:
+        for items in pool.map(run, tiles):
+            results.extend(items)
+    return results
+
+
+def sliding_windows(
+    shape: Tuple[int, ...], size: int, overlap: int
+) -> List[Tuple[int, int, int, int]]:
+    """
+    고정 크기로 겹치는 창 (x0, y0, x1, y1) 목록
+
+    마지막 창은 이미지 가장자리에 맞춰 당겨서 모든 창이 같은 크기를 유지한다
+    (이미지가 size보다 작은 축은 창 하나).
+    """
+    h, w = shape[:2]
+    stride = max(1, size - overlap)
+
+    def starts(n: int) -> List[int]:
+        if n <= size:
+            return [0]
+        return list(range(0, n - size, stride)) + [n - size]
+
+    return [
+        (x0, y0, min(x0 + size, w), min(y0 + size, h))
+        for y0 in starts(h)
+        for x0 in starts(w)
+    ]
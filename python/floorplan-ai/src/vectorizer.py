@@ -11,6 +11,13 @@ from pathlib import Path
 from loguru import logger
 import numpy as np
 
+from .symbol_detector import CLASS_NAMES_EN, CLASS_NAMES_KO, DetectionSet
+
+
+def _wall_id(index: int) -> str:
+    """벽 ID (프론트엔드 WallData.id 규칙)"""
+    return f"wall-{index}"
+
 
 class _NumpyEncoder(json.JSONEncoder):
     """numpy 타입을 JSON 직렬화 가능하게 변환"""
@@ -38,6 +45,8 @@ class FloorPlanVectorizer:
         self.svg_window_color = config.get("svg_window_color", "#00AA00")
         self.output_format = config.get("output_format", "both")
         self.precision = config.get("coordinate_precision", 1)
+        self._offset = (0, 0)
+        self._input_scale = 1.0
 
     def vectorize(
         self,
@@ -47,33 +56,46 @@ class FloorPlanVectorizer:
         texts: list,
         dimensions: list,
         image_size: Tuple[int, int],
+        offset: Tuple[float, float] = (0, 0),
+        snaps=None,
+        input_scale: float = 1.0,
     ) -> Dict:
         """
         모든 인식 결과를 통합 벡터 데이터로 변환
 
+        Args:
+            image_size: 페이지 크기 (입력 좌표계 픽셀)
+            offset: 입력 좌표계(도면 영역 크롭)의 페이지 내 원점 (입력 좌표계 픽셀)
+            snaps: 문/창문 → 벽 스냅 결과 (SymbolSnaps, symbols와 같은 순서)
+            input_scale: 페이지 대비 입력 좌표계 배율 (메모리 예산으로 축소한 작업 해상도,
+                scale_info["working_scale"]) - 출력 좌표는 원래 페이지 기준으로 복원
+
         Returns:
             dict: InPick 호환 구조화 데이터
         """
         logger.info("벡터화 시작")
 
+        self._input_scale = input_scale
         # 축척 자동 감지 (치수선 기반)
         if self.auto_detect_scale and dimensions:
             self.scale_factor = self._detect_scale(dimensions, walls)
             logger.info(f"축척 자동 감지: 1px = {self.scale_factor:.3f}mm")
 
-        # 좌표 변환 (px → mm)
+        # 좌표 변환 (크롭 px → 페이지 px → 원래 페이지 px → mm)
+        self._offset = offset
+        sf = self._input_mm()
         result = {
             "version": "1.0",
             "unit": "mm",
             "scale_factor": round(self.scale_factor, 4),
             "canvas": {
-                "width": round(image_size[0] * self.scale_factor, self.precision),
-                "height": round(image_size[1] * self.scale_factor, self.precision),
+                "width": round(image_size[0] * sf, self.precision),
+                "height": round(image_size[1] * sf, self.precision),
             },
             "walls": self._vectorize_walls(walls),
             "rooms": self._vectorize_rooms(rooms, texts),
-            "symbols": self._vectorize_symbols(symbols),
-            "texts": [t.to_dict() for t in texts] if texts else [],
+            "symbols": self._vectorize_symbols(symbols, snaps),
+            "texts": self._vectorize_texts(texts),
         }
 
         logger.info(
@@ -82,20 +104,40 @@ class FloorPlanVectorizer:
         )
         return result
 
+    def _input_mm(self) -> float:
+        """입력 좌표계 1px → mm (scale_factor는 원래 페이지 px 기준)"""
+        return self.scale_factor / self._input_scale
+
+    def _vectorize_texts(self, texts: list) -> List[Dict]:
+        """텍스트 블록을 페이지 픽셀 좌표로 변환"""
+        ox, oy = self._offset
+        k = 1.0 / self._input_scale
+        vectorized = []
+        for t in texts or []:
+            d = t.to_dict()
+            d["bbox"] = {
+                "x1": (d["bbox"]["x1"] + ox) * k, "y1": (d["bbox"]["y1"] + oy) * k,
+                "x2": (d["bbox"]["x2"] + ox) * k, "y2": (d["bbox"]["y2"] + oy) * k,
+            }
+            vectorized.append(d)
+        return vectorized
+
     def _vectorize_walls(self, walls: list) -> List[Dict]:
         """벽 선분을 mm 좌표로 변환"""
-        sf = self.scale_factor
+        sf = self._input_mm()
+        ox, oy = self._offset
         vectorized = []
-        for w in walls:
+        for i, w in enumerate(walls):
             vectorized.append({
+                "id": _wall_id(i),
                 "type": "wall",
                 "start": {
-                    "x": round(w.start[0] * sf, self.precision),
-                    "y": round(w.start[1] * sf, self.precision),
+                    "x": round((w.start[0] + ox) * sf, self.precision),
+                    "y": round((w.start[1] + oy) * sf, self.precision),
                 },
                 "end": {
-                    "x": round(w.end[0] * sf, self.precision),
-                    "y": round(w.end[1] * sf, self.precision),
+                    "x": round((w.end[0] + ox) * sf, self.precision),
+                    "y": round((w.end[1] + oy) * sf, self.precision),
                 },
                 "thickness": round(w.thickness * sf, self.precision),
                 "orientation": w.orientation,
@@ -105,7 +147,8 @@ class FloorPlanVectorizer:
 
     def _vectorize_rooms(self, rooms: list, texts: list) -> List[Dict]:
         """방 폴리곤을 mm 좌표로 변환 + 텍스트 매칭"""
-        sf = self.scale_factor
+        sf = self._input_mm()
+        ox, oy = self._offset
 
         # 방 이름 텍스트 위치 매핑
         room_names = {}
@@ -126,39 +169,54 @@ class FloorPlanVectorizer:
                 "type": "room",
                 "name": matched_name,
                 "vertices": [
-                    {"x": round(p[0] * sf, self.precision),
-                     "y": round(p[1] * sf, self.precision)}
+                    {"x": round((p[0] + ox) * sf, self.precision),
+                     "y": round((p[1] + oy) * sf, self.precision)}
                     for p in pts
                 ],
                 "center": {
-                    "x": round(room.center[0] * sf, self.precision),
-                    "y": round(room.center[1] * sf, self.precision),
+                    "x": round((room.center[0] + ox) * sf, self.precision),
+                    "y": round((room.center[1] + oy) * sf, self.precision),
                 },
                 "area_mm2": round(room.area * sf * sf, 0),
                 "area_m2": round(room.area * sf * sf / 1_000_000, 2),
             })
         return vectorized
 
-    def _vectorize_symbols(self, symbols: list) -> List[Dict]:
-        """심볼을 mm 좌표로 변환"""
-        sf = self.scale_factor
+    def _vectorize_symbols(self, symbols: list, snaps=None) -> List[Dict]:
+        """심볼을 mm 좌표로 변환 (스냅된 문/창문은 호스트 벽 ID + 벽 위 오프셋 포함)"""
+        # 배열 단위로 페이지 좌표 + mm 변환 후 직렬화 시점에만 dict 생성
+        symbols = DetectionSet.from_detections(symbols)
+        ox, oy = self._offset
+        boxes = (symbols.boxes + np.array([ox, oy, ox, oy], dtype=np.float64)) * self._input_mm()
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+        boxes = np.round(boxes, self.precision)
+        centers = np.round(centers, self.precision)
         vectorized = []
-        for s in symbols:
+        for cls_id, conf, b, c in zip(
+            symbols.class_ids.tolist(),
+            np.round(symbols.confidences.astype(np.float64), 4).tolist(),
+            boxes.tolist(),
+            centers.tolist(),
+        ):
             vectorized.append({
-                "type": s.class_name,
-                "type_ko": s.class_name_ko,
-                "confidence": round(s.confidence, 4),
-                "bbox": {
-                    "x1": round(s.bbox[0] * sf, self.precision),
-                    "y1": round(s.bbox[1] * sf, self.precision),
-                    "x2": round(s.bbox[2] * sf, self.precision),
-                    "y2": round(s.bbox[3] * sf, self.precision),
-                },
-                "center": {
-                    "x": round(s.center[0] * sf, self.precision),
-                    "y": round(s.center[1] * sf, self.precision),
-                },
+                "type": CLASS_NAMES_EN.get(cls_id, f"class_{cls_id}"),
+                "type_ko": CLASS_NAMES_KO.get(cls_id, f"클래스_{cls_id}"),
+                "confidence": conf,
+                "bbox": {"x1": b[0], "y1": b[1], "x2": b[2], "y2": b[3]},
+                "center": {"x": c[0], "y": c[1]},
             })
+
+        if snaps is not None:
+            sf, p = self._input_mm(), self.precision
+            offsets = np.round(snaps.offsets * sf, p).tolist()
+            points = np.round((snaps.points + (ox, oy)) * sf, p).tolist()
+            for sym, wall, off, pt in zip(vectorized, snaps.wall_ids.tolist(), offsets, points):
+                if wall < 0:
+                    sym["wallId"] = None
+                    continue
+                sym["wallId"] = _wall_id(wall)
+                sym["offset_mm"] = off  # 벽 시작점 → 심볼 중심 투영점
+                sym["wall_point"] = {"x": pt[0], "y": pt[1]}
         return vectorized
 
     def _match_room_name(self, room, room_names: dict) -> Optional[str]:
@@ -204,7 +262,8 @@ class FloorPlanVectorizer:
                     best_wall = w
 
             if best_wall and best_wall.length > 0:
-                scale = mm_value / best_wall.length
+                # 벽 길이는 입력 좌표계 px → 원래 페이지 px 기준 축척
+                scale = mm_value / best_wall.length * self._input_scale
                 if 0.1 < scale < 50:  # 합리적 범위
                     return scale
 
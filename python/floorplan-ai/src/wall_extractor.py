@@ -9,6 +9,9 @@ from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from loguru import logger
 
+from .buffer_pool import NULL_POOL, BufferPool
+from .tiling import Tile, TilingConfig, collect_tiles
+
 
 @dataclass
 class WallSegment:
@@ -55,7 +58,7 @@ class RoomPolygon:
 class WallExtractor:
     """벽 선분 추출기"""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, pool: Optional[BufferPool] = None):
         self.method = config.get("method", "hybrid")
         # Hough 파라미터
         hough = config.get("hough", {})
@@ -74,6 +77,10 @@ class WallExtractor:
         self.angle_tol = merge.get("angle_tolerance", 5)
         self.dist_tol = merge.get("distance_tolerance", 10)
         self.min_wall_length = merge.get("min_wall_length", 30)
+        # 대형 스캔 타일 처리 (겹침은 Hough 최소 선 길이보다 크게)
+        self.tiling = TilingConfig.from_dict(config.get("tiling", {}), overlap=128)
+        # 형태학 임시 배열/거리변환 맵 버퍼 풀
+        self.pool = pool or NULL_POOL
 
     def extract(self, binary_image: np.ndarray) -> Dict:
         """
@@ -87,22 +94,70 @@ class WallExtractor:
         """
         logger.info(f"벽 추출 시작 - 방법: {self.method}")
 
-        if self.method == "hough":
-            walls = self._extract_hough(binary_image)
-        elif self.method == "morphology":
-            walls = self._extract_morphology(binary_image)
-        else:  # hybrid
-            walls = self._extract_hybrid(binary_image)
+        if self.tiling.applies_to(binary_image.shape):
+            # 타일별 추출 → 전역 좌표 변환 → 아래 병합 단계에서 경계 선분 재결합
+            walls = collect_tiles(binary_image, self._extract_tile, self.tiling)
+            rooms = self._detect_rooms_downsampled(binary_image)
+        else:
+            walls = self._extract_walls(binary_image)
+            rooms = None
 
-        # 벽 병합 (근접 선분 합치기)
+        # 벽 병합 (근접 선분 합치기) 후 길이 필터 - 타일 경계에서 잘린 조각을 먼저 이어붙인다
         walls = self._merge_walls(walls)
+        walls = [w for w in walls if w.length >= self.min_wall_length]
 
         # 방 영역 감지
-        rooms = self._detect_rooms(binary_image)
+        if rooms is None:
+            rooms = self._detect_rooms(binary_image)
 
         logger.info(f"벽 추출 완료 - 벽: {len(walls)}개, 방: {len(rooms)}개")
         return {"walls": walls, "rooms": rooms}
 
+    def _extract_walls(self, binary: np.ndarray) -> List[WallSegment]:
+        """설정된 방법으로 벽 선분 추출"""
+        if self.method == "hough":
+            return self._extract_hough(binary)
+        elif self.method == "morphology":
+            return self._extract_morphology(binary)
+        else:  # hybrid
+            return self._extract_hybrid(binary)
+
+    def _extract_tile(self, tile_image: np.ndarray, tile: Tile) -> List[WallSegment]:
+        """타일 하나에서 벽 추출 후 core 영역으로 잘라 전역 좌표로 변환"""
+        walls = []
+        for w in self._extract_walls(tile_image):
+            clipped = _clip_segment(
+                w.start[0] + tile.px0, w.start[1] + tile.py0,
+                w.end[0] + tile.px0, w.end[1] + tile.py0,
+                tile.x0, tile.y0, tile.x1, tile.y1,
+            )
+            if clipped is None:
+                continue
+            wall = self._create_wall_segment(*clipped)
+            if wall:
+                walls.append(wall)
+        return walls
+
+    def _detect_rooms_downsampled(self, binary: np.ndarray) -> List[RoomPolygon]:
+        """타일 모드용 방 감지 - 한 타일 크기로 축소한 전체 이미지에서 감지 후 좌표 복원"""
+        h, w = binary.shape[:2]
+        scale = self.tiling.tile_size / max(h, w)
+        small = cv2.resize(binary, (max(1, int(w * scale)), max(1, int(h * scale))),
+                           interpolation=cv2.INTER_AREA)
+        # 축소로 흐려진 얇은 벽도 유지
+        _, small = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY)
+
+        inv = 1.0 / scale
+        return [
+            RoomPolygon(
+                contour=np.round(r.contour * inv).astype(np.int32),
+                area=r.area * inv * inv,
+                center=(r.center[0] * inv, r.center[1] * inv),
+                bounding_rect=tuple(int(round(v * inv)) for v in r.bounding_rect),
+            )
+            for r in self._detect_rooms(small)
+        ]
+
     def _extract_hough(self, binary: np.ndarray) -> List[WallSegment]:
         """Hough Line Transform으로 직선 추출"""
         lines = cv2.HoughLinesP(
@@ -122,32 +177,38 @@ class WallExtractor:
         for line in lines:
             x1, y1, x2, y2 = line[0]
             wall = self._create_wall_segment(x1, y1, x2, y2)
-            if wall and wall.length >= self.min_wall_length:
+            if wall:
                 walls.append(wall)
 
         return walls
 
     def _extract_morphology(self, binary: np.ndarray) -> List[WallSegment]:
         """형태학적 처리로 벽 영역 추출 후 골격화"""
+        pool = self.pool
         # 수평 벽 추출
         h_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
-        h_walls = cv2.morphologyEx(binary, cv2.MORPH_OPEN, h_kernel, iterations=1)
+        h_walls = cv2.morphologyEx(binary, cv2.MORPH_OPEN, h_kernel,
+                                   dst=pool.acquire(binary.shape), iterations=1)
 
         # 수직 벽 추출
         v_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 40))
-        v_walls = cv2.morphologyEx(binary, cv2.MORPH_OPEN, v_kernel, iterations=1)
+        v_walls = cv2.morphologyEx(binary, cv2.MORPH_OPEN, v_kernel,
+                                   dst=pool.acquire(binary.shape), iterations=1)
 
         # 합치기
-        combined = cv2.bitwise_or(h_walls, v_walls)
+        combined = cv2.bitwise_or(h_walls, v_walls, dst=h_walls)
+        pool.release(v_walls)
 
         # 골격화 (Skeletonize)
         skeleton = self._skeletonize(combined)
+        pool.release(combined)
 
         # 골격에서 Hough로 직선 추출
         lines = cv2.HoughLinesP(
             skeleton, 1, np.pi / 180,
             threshold=30, minLineLength=30, maxLineGap=15
         )
+        pool.release(skeleton)
 
         walls = []
         if lines is not None:
@@ -165,25 +226,30 @@ class WallExtractor:
         kernel = cv2.getStructuringElement(
             cv2.MORPH_RECT, (self.morph_kernel, self.morph_kernel)
         )
+        pool = self.pool
         # 작은 노이즈 제거
-        cleaned = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=1)
+        cleaned = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel,
+                                   dst=pool.acquire(binary.shape), iterations=1)
         # 벽 연결 강화
-        cleaned = cv2.morphologyEx(cleaned, cv2.MORPH_CLOSE, kernel, iterations=2)
+        cleaned = cv2.morphologyEx(cleaned, cv2.MORPH_CLOSE, kernel, dst=cleaned, iterations=2)
 
         # 벽 두께 범위 필터 (너무 두꺼운 것은 영역, 너무 얇은 것은 노이즈)
-        dist = cv2.distanceTransform(cleaned, cv2.DIST_L2, 5)
-        wall_mask = np.zeros_like(binary)
-        wall_mask[
-            (dist >= self.wall_thickness_min / 2) &
-            (dist <= self.wall_thickness_max / 2)
-        ] = 255
+        dist = cv2.distanceTransform(cleaned, cv2.DIST_L2, 5,
+                                     dst=pool.acquire(binary.shape, np.float32))
+        wall_mask = cv2.inRange(
+            dist, self.wall_thickness_min / 2, self.wall_thickness_max / 2,
+            dst=pool.acquire(binary.shape),
+        )
+        pool.release(dist)
 
         # 벽 mask가 너무 작으면 원본 사용
-        if np.sum(wall_mask > 0) < np.sum(binary > 0) * 0.05:
+        if cv2.countNonZero(wall_mask) < cv2.countNonZero(binary) * 0.05:
+            pool.release(wall_mask)
             wall_mask = cleaned
 
         # Step 2: Hough Transform
         walls_hough = self._extract_hough(wall_mask)
+        pool.release(wall_mask, cleaned)
 
         # Step 3: 형태학적 결과도 보충
         walls_morph = self._extract_morphology(binary)
@@ -217,29 +283,37 @@ class WallExtractor:
         )
 
     def _merge_walls(self, walls: List[WallSegment]) -> List[WallSegment]:
-        """근접한 같은 방향 벽 선분 병합"""
+        """
+        근접한 같은 방향 벽 선분 병합
+
+        병합된 선분을 기준으로 계속 비교하고, 변화가 없을 때까지 반복해
+        타일 경계 등에서 여러 조각으로 나뉜 벽도 하나로 이어붙인다.
+        """
         if not walls:
             return walls
 
-        merged = []
-        used = set()
+        while True:
+            merged = []
+            used = set()
 
-        for i, w1 in enumerate(walls):
-            if i in used:
-                continue
-            best_merge = w1
-            for j, w2 in enumerate(walls):
-                if j <= i or j in used:
+            for i, w1 in enumerate(walls):
+                if i in used:
                     continue
-                if w1.orientation != w2.orientation:
-                    continue
-                if self._should_merge(w1, w2):
-                    best_merge = self._merge_two_walls(best_merge, w2)
-                    used.add(j)
-            merged.append(best_merge)
-            used.add(i)
-
-        return merged
+                best_merge = w1
+                for j, w2 in enumerate(walls):
+                    if j <= i or j in used:
+                        continue
+                    if w1.orientation != w2.orientation:
+                        continue
+                    if self._should_merge(best_merge, w2):
+                        best_merge = self._merge_two_walls(best_merge, w2)
+                        used.add(j)
+                merged.append(best_merge)
+                used.add(i)
+
+            if len(merged) == len(walls):
+                return merged
+            walls = merged
 
     def _should_merge(self, w1: WallSegment, w2: WallSegment) -> bool:
         """두 벽 선분이 병합 가능한지 판단"""
@@ -307,15 +381,17 @@ class WallExtractor:
         """닫힌 영역(방) 감지"""
         # 벽 영역을 팽창시켜 틈새 메우기
         kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-        closed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel, iterations=3)
+        closed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel,
+                                  dst=self.pool.acquire(binary.shape), iterations=3)
 
         # 반전 (방=전경)
-        inverted = cv2.bitwise_not(closed)
+        inverted = cv2.bitwise_not(closed, dst=closed)
 
         # 컨투어 추출
         contours, hierarchy = cv2.findContours(
             inverted, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE
         )
+        self.pool.release(inverted)
 
         rooms = []
         img_area = binary.shape[0] * binary.shape[1]
@@ -354,18 +430,50 @@ class WallExtractor:
         return rooms
 
     def _skeletonize(self, binary: np.ndarray) -> np.ndarray:
-        """이미지 골격화 (Zhang-Suen Thinning)"""
-        skeleton = np.zeros_like(binary)
+        """
+        이미지 골격화 (Zhang-Suen Thinning)
+
+        반환 배열은 풀 버퍼이므로 사용 후 self.pool.release()로 반환한다.
+        """
+        pool = self.pool
+        skeleton = pool.zeros(binary.shape)
         element = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
-        temp = binary.copy()
+        temp = pool.acquire(binary.shape)
+        np.copyto(temp, binary)
+        eroded = pool.acquire(binary.shape)
+        diff = pool.acquire(binary.shape)
 
         while True:
-            eroded = cv2.erode(temp, element)
-            dilated = cv2.dilate(eroded, element)
-            diff = cv2.subtract(temp, dilated)
-            skeleton = cv2.bitwise_or(skeleton, diff)
-            temp = eroded.copy()
+            cv2.erode(temp, element, dst=eroded)
+            cv2.dilate(eroded, element, dst=diff)
+            cv2.subtract(temp, diff, dst=diff)
+            cv2.bitwise_or(skeleton, diff, dst=skeleton)
+            # 복사 대신 버퍼 교체
+            temp, eroded = eroded, temp
             if cv2.countNonZero(temp) == 0:
                 break
 
+        pool.release(temp, eroded, diff)
         return skeleton
+
+
+def _clip_segment(
+    x1: float, y1: float, x2: float, y2: float,
+    xmin: float, ymin: float, xmax: float, ymax: float,
+) -> Optional[Tuple[float, float, float, float]]:
+    """선분을 사각형 [xmin, xmax) x [ymin, ymax)로 자르기 (Liang-Barsky)"""
+    dx, dy = x2 - x1, y2 - y1
+    t0, t1 = 0.0, 1.0
+    for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+        if p == 0:
+            if q < 0:
+                return None
+            continue
+        t = q / p
+        if p < 0:
+            t0 = max(t0, t)
+        else:
+            t1 = min(t1, t)
+        if t0 > t1:
+            return None
+    return x1 + t0 * dx, y1 + t0 * dy, x1 + t1 * dx, y1 + t1 * dy
@@ -45,6 +45,243 @@ class TestPreprocessor:
         assert info["original_size"] == (800, 1000)
         assert info["scale_factor"] == 1280 / 1000
 
+    def test_lazy_products(self):
+        from src.preprocessor import FloorPlanPreprocessor
+        pp = FloorPlanPreprocessor({"target_size": 640, "deskew": False})
+        img = np.ones((400, 300, 3), dtype=np.uint8) * 255
+
+        result = pp.process(img)
+        assert result.computed == ()
+
+        # OCR/심볼 경로만 읽으면 이진화는 계산되지 않음
+        result["for_ocr"]
+        result["scale_info"]
+        assert "binary" not in result.computed
+        assert "enhanced" in result.computed
+
+        # 메모이즈: 같은 객체 반환
+        assert result["binary"] is result["for_wall"]
+        assert result.get("missing") is None
+        with pytest.raises(KeyError):
+            result["missing"]
+
+    def test_no_copy_and_memory_budget(self):
+        from src.preprocessor import BYTES_PER_PIXEL, FloorPlanPreprocessor
+        img = np.ones((400, 300, 3), dtype=np.uint8) * 255
+
+        result = FloorPlanPreprocessor({"deskew": False}).process(img)
+        original = result["original"]
+        assert np.shares_memory(original, img)
+        assert not original.flags.writeable
+        result["binary"]
+        stats = result.memory_stats
+        assert stats["input_bytes"] == img.nbytes
+        assert stats["peak_bytes"] >= stats["resident_bytes"] > img.nbytes
+
+        # 예산 초과 → 작업 해상도 하향 (픽셀 수 1/4)
+        budget_mb = 400 * 300 * BYTES_PER_PIXEL / 4 / 1024 / 1024
+        pp = FloorPlanPreprocessor({"deskew": False, "memory_budget_mb": budget_mb})
+        result = pp.process(img)
+        assert result["original"].shape[:2] == (200, 150)
+        assert result["scale_info"]["working_scale"] == pytest.approx(0.5)
+
+    def test_tiled_binary(self):
+        import cv2
+        from src.preprocessor import FloorPlanPreprocessor
+        img = np.ones((700, 900, 3), dtype=np.uint8) * 255
+        cv2.rectangle(img, (100, 100), (800, 600), (0, 0, 0), 8)
+
+        config = {"deskew": False, "denoise_engine": "median"}
+        full = FloorPlanPreprocessor(config).process(img)["binary"]
+        tiled_pp = FloorPlanPreprocessor(
+            dict(config, tiling={"enabled": True, "tile_size": 256, "overlap": 32})
+        )
+        tiled = tiled_pp.process(img)["binary"]
+        assert tiled.shape == full.shape
+        assert np.count_nonzero(tiled != full) < full.size * 0.001
+
+    def test_roi_crop(self):
+        import cv2
+        from src.preprocessor import FloorPlanPreprocessor
+        pp = FloorPlanPreprocessor({"deskew": False, "roi_crop": True})
+
+        # 도곽선 + 본 도면 + 우측 하단 표제란
+        img = np.ones((1000, 1400, 3), dtype=np.uint8) * 255
+        cv2.rectangle(img, (10, 10), (1390, 990), (0, 0, 0), 2)
+        cv2.rectangle(img, (150, 150), (850, 750), (0, 0, 0), 8)
+        cv2.line(img, (500, 150), (500, 750), (0, 0, 0), 6)
+        cv2.rectangle(img, (1100, 850), (1350, 950), (0, 0, 0), 2)
+
+        result = pp.process(img)
+        x, y, w, h = result["scale_info"]["roi"]
+        assert x <= 150 and y <= 150 and x + w >= 850 and y + h >= 750
+        assert x + w < 1100
+        assert result["binary"].shape == (h, w)
+        assert result["scale_info"]["page_size"] == (1400, 1000)
+        assert np.shares_memory(result["original"], img)
+
+        # 한 장에 평면도 두 개 (A/B 타입) + 표제란 → 두 도면을 모두 포함
+        img = np.ones((1000, 1400, 3), dtype=np.uint8) * 255
+        cv2.rectangle(img, (10, 10), (1390, 990), (0, 0, 0), 2)
+        cv2.rectangle(img, (100, 150), (600, 700), (0, 0, 0), 8)
+        cv2.rectangle(img, (800, 200), (1250, 650), (0, 0, 0), 8)
+        cv2.rectangle(img, (1100, 850), (1350, 950), (0, 0, 0), 2)
+        x, y, w, h = pp.process(img)["scale_info"]["roi"]
+        assert x <= 100 and y <= 150 and x + w >= 1250 and y + h >= 700
+        assert y + h < 850
+
+    def test_deskew_single_warp(self):
+        import cv2
+        from src.preprocessor import FloorPlanPreprocessor
+        pp = FloorPlanPreprocessor({"deskew": True, "skew_max_size": 512})
+
+        img = np.ones((900, 1200, 3), dtype=np.uint8) * 255
+        cv2.rectangle(img, (150, 150), (1050, 750), (0, 0, 0), 8)
+        cv2.line(img, (600, 150), (600, 750), (0, 0, 0), 6)
+        M = cv2.getRotationMatrix2D((600, 450), 3.0, 1.0)
+        skewed = cv2.warpAffine(img, M, (1200, 900), borderValue=(255, 255, 255))
+
+        result = pp.process(skewed)
+        assert abs(result.skew_angle + 3.0) < 0.5
+        assert result["binary"].shape == result["original"].shape[:2]
+
+        # 90° 방향 보정은 가로/세로를 교환
+        rotated = pp._align_image(skewed, 90, 0.0)
+        assert rotated.shape[:2] == (1200, 900)
+        assert pp._align_image(skewed, 90, 1.0).shape[:2] == (1200, 900)
+
+    def test_denoise_engines(self):
+        from src.preprocessor import DENOISE_ENGINES, FloorPlanPreprocessor
+        img = np.ones((300, 400, 3), dtype=np.uint8) * 255
+        img[100:110, 50:350] = 0
+
+        for engine in DENOISE_ENGINES:
+            pp = FloorPlanPreprocessor({"denoise_engine": engine, "deskew": False})
+            binary = pp.process(img)["binary"]
+            assert binary.shape == (300, 400)
+            assert binary[105, 200] == 255
+
+        with pytest.raises(ValueError):
+            FloorPlanPreprocessor({"denoise_engine": "gaussian"})
+        for scale in (0, 1.0, 2):
+            with pytest.raises(ValueError):
+                FloorPlanPreprocessor({"denoise_engine": "nlm_downsampled", "denoise_scale": scale})
+
+    def test_color_layers(self):
+        from src.preprocessor import COLOR_LAYERS, FloorPlanPreprocessor
+        img = np.full((300, 400, 3), 255, dtype=np.uint8)
+        img[100:110, 50:350] = (0, 0, 0)        # 검정 벽
+        img[200:203, 50:350] = (0, 0, 220)      # 빨강 치수선
+        img[250:270, 100:140] = (200, 80, 0)    # 파랑 주석
+
+        pp = FloorPlanPreprocessor({"deskew": False, "color_layers": {"enabled": True}})
+        result = pp.process(img)
+        labels = result["color_layers"]
+        assert labels[105, 200] == COLOR_LAYERS["walls"]
+        assert labels[201, 200] == COLOR_LAYERS["dimensions"]
+        assert labels[260, 120] == COLOR_LAYERS["annotation"]
+
+        # 벽 추출은 벽 레이어만, OCR은 텍스트 레이어만
+        assert result["for_wall"][105, 200] == 255
+        assert result["for_wall"][201, 200] == 0
+        assert result["for_ocr"][105, 200] == 255
+        assert result["for_ocr"][201, 200] < 255
+
+        # 비활성화 시 기존 산출물 그대로
+        plain = FloorPlanPreprocessor({"deskew": False}).process(img)
+        assert plain["color_layers"] is None
+        assert plain["for_wall"] is plain["binary"]
+
+
+class TestDocument:
+    """다중 페이지 문서 테스트"""
+
+    def _make_pdf(self, path, n_pages):
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        for i in range(n_pages):
+            page = doc.new_page(width=216, height=72)
+            page.insert_text((20, 40), f"page {i + 1}")
+        doc.save(str(path))
+        doc.close()
+
+    def test_load_pages(self, tmp_path):
+        from src.preprocessor import FloorPlanPreprocessor
+        pdf = tmp_path / "set.pdf"
+        self._make_pdf(pdf, 3)
+
+        pp = FloorPlanPreprocessor({})
+        pages = [page for page, _ in pp.load_pages(str(pdf))]
+        assert len(pages) == 3
+        assert pages[0].shape == (300, 900, 3)  # 300 DPI
+        assert FloorPlanPreprocessor.load_image(str(pdf)).shape == pages[0].shape
+
+    def test_render_resolution(self, tmp_path):
+        from src.preprocessor import FloorPlanPreprocessor
+        pdf = tmp_path / "sheet.pdf"
+        self._make_pdf(pdf, 1)
+
+        # 최대 픽셀 수 제한 → DPI 자동 하향 (216x72pt @300DPI = 270,000px)
+        pp = FloorPlanPreprocessor({"render_dpi": 300, "render_max_pixels": 67_500})
+        page, info = pp.load_page(str(pdf))
+        assert page.shape[:2] == (150, 450)
+        assert info["render_dpi"] == pytest.approx(150)
+
+        # 클립 영역만 래스터화
+        pp = FloorPlanPreprocessor({"render_dpi": 144, "render_clip": [0, 0, 108, 72]})
+        page, _ = next(pp.load_pages(str(pdf)))
+        assert page.shape[:2] == (144, 216)
+
+    def test_reduced_decode(self, tmp_path):
+        import cv2
+        from src.preprocessor import FloorPlanPreprocessor
+        img = np.full((1500, 2000, 3), 255, np.uint8)
+        cv2.rectangle(img, (200, 200), (1800, 1300), (0, 0, 0), 20)
+        ok, buf = cv2.imencode(".jpg", img)
+        assert ok
+
+        # 2000x1500 → 1/2 디코딩(1000x750) 후 20만 픽셀로 축소
+        pp = FloorPlanPreprocessor({"render_max_pixels": 200_000, "deskew": False})
+        image, info = pp.decode_image(buf.tobytes())
+        assert image.shape[0] * image.shape[1] <= 200_000
+        assert info["source_size"] == (2000, 1500)
+        assert info["source_scale"] == pytest.approx(image.shape[1] / 2000)
+
+        result = pp.process(image, source_info=info)
+        assert result["scale_info"]["effective_scale"] == pytest.approx(info["source_scale"])
+
+        # 파일 경로도 같은 규칙으로 디코딩
+        path = tmp_path / "scan.jpg"
+        path.write_bytes(buf.tobytes())
+        page, _ = pp.load_page(str(path))
+        assert page.shape == image.shape
+
+    def test_run_document(self, tmp_path, monkeypatch):
+        from src.pipeline import FloorPlanPipeline
+        pdf = tmp_path / "set.pdf"
+        self._make_pdf(pdf, 4)
+
+        pipeline = FloorPlanPipeline(str(tmp_path / "missing.yaml"))
+        calls = []
+
+        pipeline.batch_pages = 3
+
+        def fake_run_batch(pages, output_dir="outputs", visualize=None):
+            calls.append([base_name for _, _, base_name in pages])
+            return [
+                {"summary": {"symbols": 1, "texts": 2, "walls": 3, "rooms": 0}}
+                for _ in pages
+            ]
+
+        monkeypatch.setattr(pipeline, "run_batch", fake_run_batch)
+        doc = pipeline.run_document(str(pdf), output_dir=str(tmp_path))
+
+        # batch_pages 단위로 묶여 실행
+        assert calls == [["set_p001", "set_p002", "set_p003"], ["set_p004"]]
+        assert [p["page"] for p in doc["pages"]] == [1, 2, 3, 4]
+        assert doc["summary"]["pages"] == 4
+        assert doc["summary"]["walls"] == 12
+
 
 class TestSymbolDetector:
     """심볼 감지 모듈 테스트"""
@@ -70,6 +307,363 @@ class TestSymbolDetector:
         assert CLASS_NAMES_KO[0] == "벽"
         assert CLASS_NAMES_EN[4] == "window"
 
+    def test_detect_batch(self, monkeypatch):
+        from src.symbol_detector import SymbolDetector
+        detector = SymbolDetector({"batch_size": 2})
+        detector.model = object()  # 모델 로드 생략
+        calls = []
+
+        def fake_infer(frames, imgsz=None, model=None):
+            calls.append(len(frames))
+            return [
+                np.array([[10, 20, 30, 40, 0.5, 1], [0, 0, 8, 8, 0.9, 4]], np.float32)
+                for _ in frames
+            ]
+
+        monkeypatch.setattr(detector, "_infer", fake_infer)
+        frames = [np.zeros((64, 64, 3), np.uint8) for _ in range(5)]
+        infos = [{"scale_factor": 0.5}] * 4 + [None]
+        batches = detector.detect_batch(frames, infos)
+
+        assert calls == [2, 2, 1]
+        assert len(batches) == 5
+        # 신뢰도 정렬 + 레터박스 좌표 → 원본 좌표
+        assert batches[0][0].class_name == "window"
+        assert batches[0][1].bbox == (20, 40, 60, 80)
+        assert batches[4][1].bbox == (10, 20, 30, 40)
+        assert batches[0].model_version == "external"  # 결과에 모델 버전 기록
+
+        with pytest.raises(ValueError):
+            detector.detect_batch(frames, infos[:2])
+
+    def test_detection_set(self):
+        from src.symbol_detector import DetectionSet
+        ds = DetectionSet.from_array(np.array([
+            [10, 20, 30, 40, 0.5, 1],
+            [0, 0, 8, 8, 0.9, 4],
+            [50, 50, 70, 90, 0.3, 4],
+        ]))
+        ranked = ds.sorted()
+        assert ranked.confidences.tolist() == pytest.approx([0.9, 0.5, 0.3])
+        assert len(ds.above(0.4)) == 2
+        assert ds.of_classes([4]).class_names == ["window", "window"]
+
+        # dict는 Detection.to_dict()와 같은 형식
+        moved = ranked.translate(100, 0).scale(0.5)
+        assert moved.to_dicts() == [d.to_dict() for d in moved]
+        assert moved[1].bbox == pytest.approx((55, 10, 65, 20))
+        assert moved.to_dicts()[1]["area"] == 100.0
+        assert len(DetectionSet.from_detections(list(ds))) == 3
+
+    def test_letterboxed_input(self, monkeypatch):
+        from src.preprocessor import FloorPlanPreprocessor
+        from src.symbol_detector import SymbolDetector
+        result = FloorPlanPreprocessor({"target_size": 640, "deskew": False}).process(
+            np.full((1000, 800, 3), 255, np.uint8)
+        )
+        detector = SymbolDetector({"img_size": 1280})
+        detector.model = object()
+        sizes = []
+
+        def fake_infer(frames, imgsz=None, model=None):
+            sizes.append(imgsz)
+            # 이미지 안 박스 + 우측 경계에 걸친 박스 + 패딩 영역에만 있는 박스
+            return [np.array([
+                [64, 128, 128, 256, 0.9, 1],
+                [500, 0, 540, 64, 0.8, 1],
+                [600, 0, 630, 64, 0.7, 1],
+            ], np.float32)]
+
+        monkeypatch.setattr(detector, "_infer", fake_infer)
+        detections = detector.detect(result["for_yolo"], result["scale_info"])
+
+        # 레터박스 크기 그대로 추론 (img_size로 다시 리사이즈하지 않음)
+        assert sizes == [640]
+        assert len(detections) == 2
+        assert detections[0].bbox == pytest.approx((100, 200, 200, 400))
+        assert detections[1].bbox == pytest.approx((781.25, 0, 800, 100))
+
+    def test_non_max_suppression(self):
+        from src.symbol_detector import non_max_suppression
+        boxes = np.array([
+            [0, 0, 100, 100],
+            [5, 5, 105, 105],     # 0과 거의 겹침 → 제거
+            [0, 0, 40, 100],      # 0에 포함된 잘린 박스 → ios에서만 제거
+            [5, 5, 105, 105],     # 다른 클래스 → 유지
+        ], dtype=np.float32)
+        scores = np.array([0.9, 0.8, 0.7, 0.6])
+        classes = np.array([1, 1, 1, 2])
+
+        assert non_max_suppression(boxes, scores, classes, 0.5, "iou").tolist() == [0, 2, 3]
+        assert non_max_suppression(boxes, scores, classes, 0.5, "ios").tolist() == [0, 3]
+        assert len(non_max_suppression(boxes[:0], scores[:0])) == 0
+
+        # 점수순 청크 단위 계산은 한 번에 계산한 결과와 같다 (청크 경계를 넘는 억제 포함)
+        rng = np.random.default_rng(0)
+        xy = rng.uniform(0, 200, (300, 2))
+        boxes = np.hstack([xy, xy + rng.uniform(10, 40, (300, 2))])
+        scores = rng.uniform(0, 1, 300)
+        classes = rng.integers(0, 3, 300)
+        full = non_max_suppression(boxes, scores, classes, 0.3, chunk=len(boxes))
+        for metric in ("iou", "ios"):
+            assert np.array_equal(
+                non_max_suppression(boxes, scores, classes, 0.3, metric, chunk=7),
+                non_max_suppression(boxes, scores, classes, 0.3, metric, chunk=len(boxes)),
+            )
+        assert 0 < len(full) < 300
+
+    def test_detect_sliced(self, monkeypatch):
+        from src.symbol_detector import SymbolDetector
+        detector = SymbolDetector({
+            "slicing": {"enabled": True, "tile_size": 100, "overlap": 0.2,
+                        "batch_size": 4, "full_frame": False},
+        })
+        detector.model = object()
+        symbol = (150, 30, 170, 50)  # 페이지 좌표의 심볼 하나
+        batches = []
+
+        def fake_infer(frames, imgsz=None, model=None):
+            batches.append((len(frames), imgsz))
+            # 타일 안의 검은 영역을 그대로 박스로 반환 (타일 좌표)
+            outputs = []
+            for f in frames:
+                ys, xs = np.nonzero(f[..., 0] == 0)
+                outputs.append(
+                    np.array([[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1, 0.9, 6]],
+                             np.float32) if len(xs) else np.empty((0, 6), np.float32)
+                )
+            return outputs
+
+        monkeypatch.setattr(detector, "_infer", fake_infer)
+        image = np.full((100, 260, 3), 255, np.uint8)
+        image[symbol[1]:symbol[3], symbol[0]:symbol[2]] = 0
+
+        # 260px → 타일 x0 = 0, 80, 160 (마지막은 가장자리 정렬)
+        detections = detector.detect_sliced(image)
+        assert batches == [(3, 100)]
+        assert len(detections) == 1  # 겹침 영역 중복은 병합
+        assert detections[0].bbox == symbol
+        assert detections[0].class_name == "toilet"
+
+    def test_detect_cascade(self, monkeypatch):
+        from src.symbol_detector import SymbolDetector
+        detector = SymbolDetector({
+            "cascade": {"enabled": True, "coarse_size": 640, "fine_size": 1280,
+                        "crop_size": 640, "refine_below": 0.5},
+        })
+        detector.model = object()
+        calls = []
+
+        def fake_infer(frames, imgsz=None, model=None):
+            calls.append((len(frames), imgsz, frames[0].shape[:2]))
+            if imgsz == 640 and frames[0].shape[0] == 2560:
+                # 저해상도: 큰 심볼(확실) + 작은 심볼(애매)
+                return [np.array([
+                    [100, 100, 600, 400, 0.95, 10],
+                    [2000, 2000, 2030, 2030, 0.3, 8],
+                ], np.float32)]
+            # 고해상도 크롭 (x0 = y0 = 1280, 이미지 끝에 맞춤): 작은 심볼을 높은 신뢰도로
+            return [np.array([[720, 720, 750, 750, 0.9, 8]], np.float32)]
+
+        monkeypatch.setattr(detector, "_infer", fake_infer)
+        image = np.full((2560, 2560, 3), 255, np.uint8)
+        detections = detector.detect_cascade(image)
+
+        # 2560px를 1280 등가 해상도로 → 크롭 1280px 하나만 재추론
+        assert calls == [(1, 640, (2560, 2560)), (1, 640, (1280, 1280))]
+        assert len(detections) == 2
+        assert detections[0].class_name == "stairs"
+        assert detections[1].confidence == pytest.approx(0.9)
+        assert detections[1].bbox == pytest.approx((2000, 2000, 2030, 2030))
+
+        with pytest.raises(ValueError):
+            SymbolDetector({"cascade": {"enabled": True}, "slicing": {"enabled": True}})
+
+    def test_deferred_visualization(self, tmp_path):
+        import cv2
+        from src.pipeline import FloorPlanPipeline
+        from src.symbol_detector import DetectionSet
+        detections = DetectionSet.from_array(np.array([[1000, 400, 2000, 1200, 0.9, 1]]))
+        image = np.full((2000, 4000, 3), 255, np.uint8)
+        image.flags.writeable = False  # 전처리 원본은 읽기 전용 뷰
+
+        # 시각화는 기본 꺼짐, 켜면 백그라운드에서 max_size로 축소 렌더링
+        pipeline = FloorPlanPipeline(str(tmp_path / "missing.yaml"))
+        assert pipeline.visualize is False
+        pipeline.vis_max_size = 1000
+        path = str(tmp_path / "vis.png")
+        pipeline._render_visualization(image, detections, path)
+        pipeline.wait_visualizations()
+        assert not pipeline.visualization_pending(path)
+
+        vis = cv2.imread(path)
+        assert vis.shape == (500, 1000, 3)
+        # 박스도 같은 비율로 축소 (x 250~500, y 100~300)
+        assert (vis[200, 250] != 255).any() and (vis[200, 240] == 255).all()
+        assert (vis[50, 750] == 255).all()
+
+
+class TestOnnxBackend:
+    """ONNX Runtime 백엔드 테스트"""
+
+    def _constant_model(self, path, pred, names="{0: 'door_swing', 1: 'window'}"):
+        """입력과 무관하게 pred (1, 4 + nc, N)를 출력하는 ONNX 그래프"""
+        onnx = pytest.importorskip("onnx")
+        pytest.importorskip("onnxruntime")
+        from onnx import TensorProto, helper, numpy_helper
+        graph = helper.make_graph(
+            [
+                helper.make_node("ReduceMean", ["images"], ["m"], keepdims=0),
+                helper.make_node("Mul", ["m", "zero"], ["z"]),
+                helper.make_node("Add", ["pred", "z"], ["output0"]),
+            ],
+            "const",
+            [helper.make_tensor_value_info("images", TensorProto.FLOAT, [1, 3, 64, 64])],
+            [helper.make_tensor_value_info("output0", TensorProto.FLOAT, list(pred.shape))],
+            initializer=[
+                numpy_helper.from_array(pred.astype(np.float32), "pred"),
+                numpy_helper.from_array(np.zeros((), np.float32), "zero"),
+            ],
+        )
+        model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)], ir_version=8)
+        model.metadata_props.add(key="names", value=names)
+        onnx.save(model, str(path))
+
+    def test_decode_and_letterbox(self, tmp_path):
+        from src.symbol_detector import SymbolDetector
+        # 앵커 3개: 클래스 1 박스 두 개(겹침) + 임계값 미만 하나 (cx, cy, w, h, s0, s1)
+        pred = np.array([
+            [32, 32, 16, 8, 0.1, 0.9],
+            [33, 32, 16, 8, 0.1, 0.8],
+            [10, 10, 4, 4, 0.1, 0.1],
+        ]).T[None]
+        path = tmp_path / "const.onnx"
+        self._constant_model(path, pred)
+
+        detector = SymbolDetector({
+            "backend": "onnxruntime", "onnx_path": str(path),
+            "confidence_threshold": 0.25, "onnxruntime": {"intra_op_threads": 1},
+        })
+        # 128x64 프레임 → 배율 0.5, 상하 패딩 16px
+        frame = np.full((64, 128, 3), 255, np.uint8)
+        detections = detector.detect(frame)
+
+        assert detector.model.names == {0: "door_swing", 1: "window"}
+        assert len(detections) == 1  # NMS로 중복 제거
+        det = detections[0]
+        assert (det.class_id, det.class_name) == (4, "window")  # 모델 id 1 → 표준 id
+        assert det.confidence == pytest.approx(0.9)
+        assert det.bbox == pytest.approx((48, 24, 80, 40))
+
+    def test_decode_caps_nms_candidates(self):
+        from src.onnx_backend import decode_predictions
+        # 겹치지 않는 앵커 5개 (점수 0.5~0.9) → 점수 상위 max_nms개만 NMS 후보
+        pred = np.array([[20 * i, 0, 10, 10, 0.5 + 0.1 * i] for i in range(5)]).T
+        boxes = decode_predictions(pred, conf=0.25, iou=0.45, max_det=300, max_nms=2)
+        assert boxes[:, 4].tolist() == pytest.approx([0.9, 0.8])
+        assert len(decode_predictions(pred, conf=0.25, iou=0.45, max_det=300)) == 5
+
+    def test_class_ids_follow_model_names(self, tmp_path):
+        from src.symbol_detector import SymbolDetector
+        # 학습 데이터셋 순서 (dataset.yaml): 0=door_swing, 2=window, 7=stove (표준 클래스에 없음)
+        pred = np.zeros((3, 12))
+        pred[:, :4] = [[10, 10, 8, 8], [30, 30, 8, 8], [50, 50, 8, 8]]
+        pred[0, 4 + 0] = pred[1, 4 + 2] = pred[2, 4 + 7] = 0.9
+        path = tmp_path / "dataset.onnx"
+        self._constant_model(path, pred.T[None], names=str({
+            0: "door_swing", 1: "door_sliding", 2: "window", 3: "toilet",
+            4: "sink", 5: "kitchen_sink", 6: "bathtub", 7: "stove",
+        }))
+
+        detector = SymbolDetector({"backend": "onnxruntime", "onnx_path": str(path)})
+        detections = detector.detect(np.full((64, 64, 3), 255, np.uint8))
+
+        assert sorted(detections.class_names) == ["door_swing", "window"]
+        assert sorted(detections.class_ids.tolist()) == [1, 4]
+
+    def test_int8_precision_path(self, tmp_path):
+        from src.symbol_detector import SymbolDetector
+        pred = np.array([[32, 32, 16, 8, 0.1, 0.9]]).T[None]
+        path = tmp_path / "const.int8.onnx"
+        self._constant_model(path, pred)
+
+        detector = SymbolDetector({
+            "backend": "onnxruntime", "precision": "int8",
+            "onnx_path": str(tmp_path / "missing.onnx"), "onnx_int8_path": str(path),
+        })
+        detector.load_model()
+        assert detector.model.model_path == str(path)
+        with pytest.raises(ValueError):
+            SymbolDetector({"precision": "fp16"})
+
+    def test_parity_with_ultralytics(self, tmp_path):
+        ultralytics = pytest.importorskip("ultralytics")
+        pytest.importorskip("onnxruntime")
+        import cv2
+        from src.symbol_detector import SymbolDetector
+
+        model = ultralytics.YOLO("yolov8n.yaml")  # 무작위 가중치 (다운로드 없음)
+        pt_path = tmp_path / "parity.pt"
+        model.save(str(pt_path))
+        onnx_path = ultralytics.YOLO(str(pt_path)).export(format="onnx", imgsz=320, opset=12)
+
+        image = np.full((480, 640, 3), 255, np.uint8)
+        cv2.rectangle(image, (100, 100), (540, 380), (0, 0, 0), 6)
+        common = {"confidence_threshold": 0.001, "img_size": 320, "device": "cpu",
+                  "max_detections": 50}
+        torch_dets = SymbolDetector(dict(common, model_path=str(pt_path))).detect(image)
+        onnx_dets = SymbolDetector(
+            dict(common, backend="onnxruntime", onnx_path=onnx_path)
+        ).detect(image)
+
+        n = min(len(torch_dets), len(onnx_dets), 10)
+        assert n > 0
+        for a, b in zip(torch_dets[:n], onnx_dets[:n]):
+            assert a.class_id == b.class_id
+            assert a.confidence == pytest.approx(b.confidence, abs=1e-3)
+            assert np.allclose(a.bbox, b.bbox, atol=1.0)
+
+
+class TestModelRegistry:
+    """모델 레지스트리 테스트"""
+
+    def test_versioned_hot_swap(self, tmp_path):
+        from src.model_registry import ModelRegistry, file_sha256
+        old, new = tmp_path / "old.pt", tmp_path / "new.pt"
+        old.write_bytes(b"weights-v1")
+        new.write_bytes(b"weights-v2")
+        loads, warmed = [], []
+
+        def loader(path):
+            if not Path(path).exists():
+                raise FileNotFoundError(path)
+            loads.append(path)
+            return {"path": path}
+
+        registry = ModelRegistry(loader, warmup=warmed.append)
+        info = registry.load(str(old))
+        assert info.version == f"old@{file_sha256(str(old))[:12]}"
+        assert warmed == [{"path": str(old)}]
+
+        # 체크섬이 같으면 다시 로드하지 않음
+        assert registry.load(str(old)) is info
+        assert len(loads) == 1
+
+        # 진행 중 요청은 시작 시 잡은 인스턴스를 계속 사용
+        in_flight = registry.active
+        registry.load_async(str(new), version="v2").result(timeout=10)
+        assert in_flight[1] == {"path": str(old)}
+        assert registry.version == "v2"
+        assert registry.active[1] == {"path": str(new)}
+
+        # 로드 실패 시 기존 모델 유지
+        with pytest.raises(FileNotFoundError):
+            registry.load(str(tmp_path / "missing.pt"))
+        status = registry.status()
+        assert status["active"]["version"] == "v2"
+        assert status["last_error"].startswith("missing")
+        assert status["history"] == [info.version, "v2"]
+
 
 class TestTextRecognizer:
     """텍스트 인식 모듈 테스트"""
@@ -97,6 +691,176 @@ class TestTextRecognizer:
         assert tr._classify_text("3,600") == "dimension"
         assert tr._classify_text("2400") == "dimension"
 
+    def test_classify_fuzzy_room_name(self):
+        from src.text_index import AhoCorasick, FuzzyIndex
+        from src.text_recognizer import TextRecognizer
+        # 겹치는 패턴: 실패 링크로 "방"을 놓치지 않음
+        matcher = AhoCorasick(["드레스룸", "스튜디오", "방"])
+        assert matcher.search("드레스튜디오") == "스튜디오"
+        assert matcher.search("드레스방") == "방"
+        assert matcher.search("거실") is None
+
+        tr = TextRecognizer({"room_names": [f"테스트룸{i}" for i in range(2000)]})
+        assert tr._classify_text("안방 12.3㎡") == "room_name"
+        assert tr._classify_text("테스트룸1234") == "room_name"
+        # OCR 오인식 근사 일치 (음절 안의 자모 하나 치환/누락), 숫자는 그대로
+        assert tr._classify_text("거싈") == "room_name"
+        assert tr._classify_text("다용도싈") == "room_name"
+        assert tr._classify_text("드래스룸") == "room_name"
+        assert tr._classify_text("주바") == "room_name"  # 받침 누락
+        assert tr._classify_text("3,600") == "dimension"
+        assert tr._classify_text("계단실") == "unknown"
+        # 자모 단위 거리: 음절이 통째로 다른 두 글자 단어, 두 글자 영문 약어는 일치하지 않음
+        for text in ("주차", "침대", "창문", "배관", "DR", "CR", "FR", "AR", "ET"):
+            assert tr._classify_text(text) == "unknown", text
+
+        index = FuzzyIndex(["거실", "주방", "방"], max_distance=1, min_length=4)
+        assert index.lookup("주빙") == ("주방", 1)
+        assert index.lookup("주차") is None  # ㅊㅏ ↔ ㅂㅏㅇ: 자모 거리 2
+        assert index.lookup("밤") is None  # 한 음절은 정확 일치만
+        assert TextRecognizer({"fuzzy": {"enabled": False}})._classify_text("다용도싈") == "unknown"
+
+    def test_text_region_proposals(self):
+        import cv2
+        from src.text_recognizer import TextRecognizer
+        img = np.full((1200, 1600), 255, np.uint8)
+        cv2.rectangle(img, (100, 100), (1500, 1100), 0, 12)            # 외벽
+        cv2.ellipse(img, (600, 400), (150, 150), 0, 0, 90, 0, 2)        # 문 열림 호
+        cv2.rectangle(img, (900, 700), (960, 760), 0, -1)               # 기둥
+        cv2.putText(img, "3,600", (300, 300), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+        cv2.putText(img, "LIVING", (700, 900), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+
+        tr = TextRecognizer({"batch": {"enabled": False}})
+        regions = tr.proposer.propose(tr.proposer.binarize(img))
+        # 벽/호/기둥은 제외, 텍스트 두 줄만 후보
+        assert len(regions) == 2
+        assert ((regions[:, 0] < 310) & (regions[:, 2] > 420)).any()
+        assert ((regions[:, 1] < 860) & (regions[:, 3] > 900) & (regions[:, 0] > 650)).any()
+
+        class FakeReader:
+            def __init__(self):
+                self.shapes = []
+
+            def readtext(self, crop, **kwargs):
+                self.shapes.append(crop.shape)
+                h, w = crop.shape[:2]
+                return [([[2, 2], [w - 2, 2], [w - 2, h - 2], [2, h - 2]], "거실", 0.9)]
+
+        # 크롭만 인식하고 결과는 페이지 좌표로 복원
+        tr.reader = FakeReader()
+        blocks = tr.recognize(img)
+        assert sorted(tr.reader.shapes) == sorted(
+            (y2 - y1, x2 - x1) for x1, y1, x2, y2 in regions.tolist()
+        )
+        assert sorted(b.bbox[:2] for b in blocks) == sorted(
+            (x1 + 2, y1 + 2) for x1, y1, _, _ in regions.tolist()
+        )
+
+    def test_recognize_batch_mosaic(self):
+        import cv2
+        from src.text_recognizer import TextRecognizer
+        from src.text_regions import TextRegionProposer, pack_mosaics
+        pages = []
+        for labels in (["3,600", "LIVING"], ["2,400", "KITCHEN", "12.3"]):
+            img = np.full((1200, 1600), 255, np.uint8)
+            cv2.rectangle(img, (100, 100), (1500, 1100), 0, 12)
+            for j, label in enumerate(labels):
+                cv2.putText(img, label, (200 + 300 * j, 300 + 250 * j),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1.2 + 0.4 * j, 0, 3)
+            pages.append(img)
+
+        # 높이 버킷별 행, 캔버스 크기 제한
+        mosaics = pack_mosaics([(40, 300), (70, 200), (45, 100), (30, 3000)], 600, 16)
+        assert mosaics[0] == (30, 3000, [(3, 0, 0)])  # 초과 크기는 단독 캔버스
+        # 40/45px → 48px 행에 나란히 (여백 = 행 높이), 70px → 다음 행
+        assert mosaics[1] == (128 + 80, 448, [(0, 0, 0), (2, 348, 0), (1, 0, 128)])
+
+        class FakeReader:
+            """캔버스에서 글자 덩어리를 찾아 텍스트로 반환"""
+            def __init__(self):
+                self.calls = 0
+                self.finder = TextRegionProposer({"padding": 0})
+
+            def readtext(self, image, **kwargs):
+                self.calls += 1
+                boxes = self.finder.propose(self.finder.binarize(image))
+                return [([[x1, y1], [x2, y1], [x2, y2], [x1, y2]], "TEXT", 0.9)
+                        for x1, y1, x2, y2 in boxes.tolist()]
+
+        tr = TextRecognizer({})
+        tr.reader = FakeReader()
+        results = tr.recognize_batch(pages)
+        # 두 페이지 후보 5개가 모자이크 한 장으로 엔진 1회 호출
+        assert tr.reader.calls == 1
+        assert [len(blocks) for blocks in results] == [2, 3]
+        for img, blocks in zip(pages, results):
+            regions = tr.proposer.propose(tr.proposer.binarize(img))
+            for b in blocks:
+                x1, y1, x2, y2 = b.bbox
+                assert ((regions[:, 0] <= x1) & (regions[:, 1] <= y1)
+                        & (regions[:, 2] >= x2) & (regions[:, 3] >= y2)).any()
+                # 페이지의 글자 잉크 위치와 일치
+                assert (img[y1:y2, x1:x2] < 128).any()
+
+    def test_digit_tier(self):
+        import cv2
+        from src.text_recognizer import TextRecognizer
+        img = np.full((1200, 1600), 255, np.uint8)
+        cv2.line(img, (200, 320), (700, 320), 0, 2)  # 치수선
+        cv2.putText(img, "3,600", (380, 305), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+        label = np.full((60, 200), 255, np.uint8)
+        cv2.putText(label, "2400", (20, 48), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+        img[500:700, 1300:1360] = cv2.rotate(label, cv2.ROTATE_90_COUNTERCLOCKWISE)  # 세로 치수
+        cv2.putText(img, "kitchen", (700, 900), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+        cv2.putText(img, "LIVING", (300, 1000), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+
+        tr = TextRecognizer({})
+        binary = tr.proposer.binarize(img)
+        regions = tr.proposer.propose(binary)
+        numeric, vertical = tr.proposer.classify_numeric(binary, regions)
+        # 치수선 옆 "3,600", 숫자 모양 세로 "2400", 대문자 "LIVING"도 모양으로 후보
+        assert numeric.tolist() == [True, True, False, True]
+        assert vertical.tolist() == [False, True, False, False]
+
+        class DigitReader:
+            """잉크 덩어리 수로 읽은 척 (숫자 허용 목록으로 읽은 영문은 형식 불일치)"""
+            def __init__(self):
+                self.boxes = []
+
+            def recognize(self, image, horizontal_list, free_list, allowlist, batch_size):
+                self.boxes.append(horizontal_list)
+                results = []
+                for x1, x2, y1, y2 in horizontal_list:
+                    stats = cv2.connectedComponentsWithStats(255 - image[y1:y2, x1:x2])[2][1:]
+                    n = int((stats[:, 2] < (x2 - x1) / 2).sum())  # 치수선 제외
+                    text = {5: "3,600", 4: "2400"}.get(n, "11")
+                    results.append(([[x1, y1], [x2, y1], [x2, y2], [x1, y2]], text, 0.9))
+                return results
+
+        class Reader:
+            def __init__(self):
+                self.calls = 0
+
+            def readtext(self, image, **kwargs):
+                self.calls += 1
+                return []
+
+        tr.reader, tr.digit_reader = Reader(), DigitReader()
+        blocks = tr.recognize(img, binary=binary)
+        # 숫자 후보 3개는 검출 없이 한 번에, 치수 형식 불일치 (LIVING)는 전체 모델로
+        assert len(tr.digit_reader.boxes) == 1 and len(tr.digit_reader.boxes[0]) == 3
+        # 세로 치수는 가로로 돌려 인식
+        x1, y1, x2, y2 = regions[1].tolist()
+        digit_sizes = [(bx2 - bx1, by2 - by1) for bx1, bx2, by1, by2 in tr.digit_reader.boxes[0]]
+        assert (y2 - y1, x2 - x1) in digit_sizes
+        assert tr.reader.calls == 1
+        assert sorted((b.text, b.bbox) for b in blocks) == sorted([
+            ("3,600", tuple(regions[0].tolist())),
+            ("2400", tuple(regions[1].tolist())),
+        ])
+        values = [d["value_mm"] for d in tr.extract_dimensions(blocks)]
+        assert values in ([3600, 2400], [2400, 3600])
+
 
 class TestWallExtractor:
     """벽 추출 모듈 테스트"""
@@ -136,6 +900,49 @@ class TestWallExtractor:
         assert "walls" in result
         assert "rooms" in result
 
+    def test_extract_tiled(self):
+        from src.wall_extractor import WallExtractor
+        import cv2
+        config = {
+            "method": "hough",
+            "hough": {"threshold": 50, "min_line_length": 30, "max_line_gap": 10},
+            "merge": {"distance_tolerance": 10, "min_wall_length": 20},
+            "tiling": {"enabled": True, "tile_size": 200, "overlap": 40, "workers": 2},
+        }
+        we = WallExtractor(config)
+
+        binary = np.zeros((500, 700), dtype=np.uint8)
+        cv2.line(binary, (50, 250), (650, 250), 255, 3)  # 4개 타일을 가로지르는 벽
+        cv2.rectangle(binary, (60, 60), (640, 440), 255, 5)
+
+        result = we.extract(binary)
+        long_walls = [
+            w for w in result["walls"]
+            if w.orientation == "horizontal" and abs(w.start[1] - 250) < 5
+        ]
+        assert len(long_walls) == 1
+        assert long_walls[0].length > 550
+        assert len(result["rooms"]) >= 1
+
+    def test_extract_tiled_seam_wall(self):
+        from src.wall_extractor import WallExtractor
+        import cv2
+        # 타일 경계 (x=200)에 걸친 100px 벽: 타일마다 보이는 조각은 약 60px로 min_wall_length 미만
+        config = {
+            "method": "hough",
+            "hough": {"threshold": 30, "min_line_length": 30, "max_line_gap": 10},
+            "merge": {"distance_tolerance": 10, "min_wall_length": 80},
+            "tiling": {"enabled": True, "tile_size": 200, "overlap": 10, "workers": 1},
+        }
+        binary = np.zeros((200, 400), dtype=np.uint8)
+        cv2.line(binary, (150, 100), (250, 100), 255, 3)
+
+        walls = WallExtractor(config).extract(binary)["walls"]
+        assert len(walls) == 1
+        assert walls[0].length > 90
+        untiled = WallExtractor(dict(config, tiling={"enabled": False})).extract(binary)
+        assert len(untiled["walls"]) == 1
+
     def test_room_detection(self):
         from src.wall_extractor import WallExtractor
         we = WallExtractor({"method": "hybrid"})
@@ -148,6 +955,90 @@ class TestWallExtractor:
         result = we.extract(binary)
         assert len(result["rooms"]) >= 1
 
+    def test_buffer_pool_reuse(self):
+        from src.buffer_pool import BufferPool
+        from src.preprocessor import FloorPlanPreprocessor
+        from src.wall_extractor import WallExtractor
+        import cv2
+        img = np.full((400, 500, 3), 255, dtype=np.uint8)
+        cv2.rectangle(img, (50, 50), (450, 350), (0, 0, 0), 6)
+
+        def run(pool):
+            pp = FloorPlanPreprocessor({"deskew": False, "denoise_engine": "median"}, pool=pool)
+            result = pp.process(img)
+            binary = result["for_wall"].copy()
+            walls = WallExtractor({"method": "hybrid"}, pool=pool).extract(result["for_wall"])
+            result.release()
+            return binary, walls
+
+        pool = BufferPool()
+        binary, walls = run(pool)
+        first = pool.stats()
+        binary2, walls2 = run(pool)
+        second = pool.stats()
+
+        # 두 번째 요청은 새 할당 없이 풀 버퍼만 사용
+        assert second["misses"] == first["misses"]
+        assert second["hits"] > first["hits"]
+        assert second["saved_bytes"] > 0
+        np.testing.assert_array_equal(binary, binary2)
+        assert len(walls) == len(walls2)
+
+        # 풀 없이 실행한 결과와 동일
+        plain_binary, plain_walls = run(None)
+        np.testing.assert_array_equal(binary, plain_binary)
+        assert len(walls) == len(plain_walls)
+
+
+class TestSymbolSnapper:
+    """문/창문 → 벽 스냅 테스트"""
+
+    def test_snap_to_host_wall(self):
+        from src.symbol_detector import DetectionSet
+        from src.symbol_snapper import SymbolSnapper
+        from src.vectorizer import FloorPlanVectorizer
+        from src.wall_extractor import WallSegment
+        walls = [
+            WallSegment((0, 100), (400, 100), 6, "horizontal", 400),
+            WallSegment((200, 0), (200, 300), 6, "vertical", 300),
+        ]
+        detections = DetectionSet.from_array(np.array([
+            [50, 90, 110, 140, 0.9, 1],    # 문 - 가로 벽에 걸침
+            [190, 95, 260, 105, 0.8, 4],   # 창문 - 교차점 근처, 가로 벽 관통
+            [205, 150, 215, 200, 0.7, 4],  # 창문 - 세로 벽 옆 5px
+            [300, 250, 350, 290, 0.6, 4],  # 창문 - 주변에 벽 없음
+            [50, 90, 110, 140, 0.9, 6],    # 변기 - 스냅 대상 아님
+        ]))
+
+        snaps = SymbolSnapper({"max_distance": 20}).snap(detections, walls)
+        assert snaps.wall_ids.tolist() == [0, 0, 1, -1, -1]
+        assert snaps.offsets[0] == pytest.approx(80)
+        assert snaps.distances[2] == pytest.approx(5)
+        assert snaps.points[2].tolist() == pytest.approx([200, 175])
+
+        v = FloorPlanVectorizer({"scale_factor": 2.0, "auto_detect_scale": False})
+        data = v.vectorize(walls, [], detections, [], [], (400, 300), offset=(10, 0), snaps=snaps)
+        assert data["walls"][1]["id"] == "wall-1"
+        assert data["symbols"][0]["wallId"] == "wall-0"
+        assert data["symbols"][0]["offset_mm"] == 160.0
+        assert data["symbols"][2]["wall_point"] == {"x": 420.0, "y": 350.0}
+        assert data["symbols"][3]["wallId"] is None
+
+    def test_grid_index_matches_brute_force(self):
+        from src.symbol_snapper import WallGridIndex, _box_segment_metrics
+        rng = np.random.default_rng(0)
+        starts = rng.uniform(-50, 3000, (2000, 2))
+        ends = starts + rng.uniform(-300, 300, (2000, 2))
+        segments = np.hstack([starts, ends])
+        index = WallGridIndex(segments, 64)
+
+        for box in rng.uniform(0, 2900, (50, 2)):
+            box = np.array([*box, *(box + 60)])
+            dist, _ = _box_segment_metrics(box, segments)
+            near = set(np.flatnonzero(dist <= 20).tolist())
+            found = set(index.query(*(box + [-20, -20, 20, 20])).tolist())
+            assert near <= found
+
 
 class TestVectorizer:
     """벡터화 모듈 테스트"""
@@ -165,6 +1056,49 @@ class TestVectorizer:
         v.to_json(data, output)
         assert Path(output).exists()
 
+    def test_offset_to_page_coordinates(self):
+        from src.vectorizer import FloorPlanVectorizer
+        from src.wall_extractor import WallSegment
+        v = FloorPlanVectorizer({"scale_factor": 2.0, "auto_detect_scale": False})
+        wall = WallSegment(start=(0, 0), end=(100, 0), thickness=5.0,
+                           orientation="horizontal", length=100.0)
+
+        data = v.vectorize([wall], [], [], [], [], image_size=(500, 400), offset=(10, 20))
+        assert data["walls"][0]["start"] == {"x": 20.0, "y": 40.0}
+        assert data["walls"][0]["end"] == {"x": 220.0, "y": 40.0}
+        assert data["canvas"] == {"width": 1000.0, "height": 800.0}
+
+    def test_working_scale_to_page_coordinates(self):
+        from src.preprocessor import BYTES_PER_PIXEL, FloorPlanPreprocessor
+        from src.symbol_detector import DetectionSet
+        from src.text_recognizer import TextBlock
+        from src.vectorizer import FloorPlanVectorizer
+        from src.wall_extractor import WallSegment
+        img = np.ones((400, 300, 3), dtype=np.uint8) * 255
+        budget_mb = 400 * 300 * BYTES_PER_PIXEL / 4 / 1024 / 1024
+
+        outputs, scales = [], []
+        for config in ({"deskew": False}, {"deskew": False, "memory_budget_mb": budget_mb}):
+            info = FloorPlanPreprocessor(config).process(img)["scale_info"]
+            k = info["working_scale"]  # 작업 해상도 좌표 = 페이지 좌표 x k
+            scales.append(k)
+            wall = WallSegment(start=(40 * k, 60 * k), end=(240 * k, 60 * k), thickness=6 * k,
+                               orientation="horizontal", length=200 * k)
+            symbols = DetectionSet.from_array(np.array([[20 * k, 40 * k, 60 * k, 80 * k, 0.9, 4]]))
+            texts = [TextBlock("거실", 0.9, (100 * k, 120 * k, 140 * k, 140 * k), "room_name")]
+            v = FloorPlanVectorizer({"scale_factor": 2.0, "auto_detect_scale": False})
+            outputs.append(v.vectorize(
+                [wall], [], symbols, texts, [], image_size=info["page_size"],
+                offset=info["roi"][:2], input_scale=k,
+            ))
+
+        assert scales == [1.0, pytest.approx(0.5)]
+        full, budget = outputs
+        for key in ("canvas", "walls", "symbols", "texts"):
+            assert budget[key] == full[key]
+        assert full["walls"][0]["start"] == {"x": 80.0, "y": 120.0}
+        assert full["texts"][0]["bbox"] == {"x1": 100, "y1": 120, "x2": 140, "y2": 140}
+
     def test_to_svg(self, tmp_path):
         from src.vectorizer import FloorPlanVectorizer
         v = FloorPlanVectorizer({"scale_factor": 1.0})
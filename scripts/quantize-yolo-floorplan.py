@@ -0,0 +1,238 @@
+"""
+INPICK 도면 심볼 감지 모델 INT8 양자화 + 정확도/지연시간 리포트
+Usage: python scripts/quantize-yolo-floorplan.py [--mode static|dynamic]
+
+사전 요구:
+  pip install onnxruntime onnx ultralytics
+  python scripts/train-yolo-floorplan.py  (public/models/floorplan-yolo.onnx 생성)
+
+출력:
+  public/models/floorplan-yolo.int8.onnx
+  public/models/quantization-report.md (클래스별 mAP50 + p50/p95 지연시간, FP32 vs INT8)
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+from onnxruntime.quantization import CalibrationDataReader
+
+# 프로젝트 루트
+ROOT = Path(__file__).parent.parent
+DATASET_DIR = ROOT / "datasets" / "floorplan-yolo"
+MODEL_OUTPUT = ROOT / "public" / "models"
+FLOORPLAN_AI = ROOT / "python" / "floorplan-ai"
+
+sys.path.insert(0, str(FLOORPLAN_AI))
+from src.onnx_backend import OnnxYoloModel, letterbox  # noqa: E402
+
+
+def _load_train_module():
+    """학습 스크립트의 검증/지표 함수 재사용 (파일명에 '-'가 있어 경로로 로드)"""
+    spec = importlib.util.spec_from_file_location(
+        "train_yolo_floorplan", ROOT / "scripts" / "train-yolo-floorplan.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _list_images(split: str, limit: int) -> list:
+    paths = sorted((DATASET_DIR / "images" / split).glob("*.png"))
+    if limit:
+        # 분할 전체에서 고르게 추출
+        step = max(1, len(paths) // limit)
+        paths = paths[::step][:limit]
+    return paths
+
+
+def _to_input(image: np.ndarray, size: int) -> np.ndarray:
+    """BGR 이미지 → (1, 3, S, S) RGB float32 (OnnxYoloModel.infer와 같은 전처리)"""
+    padded, _, _ = letterbox(image, size)
+    return np.ascontiguousarray(
+        padded[None, ..., ::-1].transpose(0, 3, 1, 2), dtype=np.float32
+    ) / 255.0
+
+
+class FloorplanCalibrationReader(CalibrationDataReader):
+    """정적 양자화 보정 데이터 - 학습셋 도면 이미지를 모델 입력 형태로 공급"""
+
+    def __init__(self, paths: list, input_name: str, size: int):
+        self.paths = iter(paths)
+        self.input_name = input_name
+        self.size = size
+
+    def get_next(self):
+        for path in self.paths:
+            image = cv2.imread(str(path))
+            if image is not None:
+                return {self.input_name: _to_input(image, self.size)}
+        return None
+
+
+def quantize(model_path: Path, output_path: Path, mode: str, calib_paths: list,
+             exclude_head: bool, work_dir: Path) -> Path:
+    """FP32 ONNX → INT8 ONNX (중간 그래프는 work_dir에 저장)"""
+    import onnx
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_dynamic, quantize_static
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    # 양자화 전 그래프 정리 (shape 추론 + 상수 접기)
+    prepped = work_dir / "prepped.onnx"
+    quant_pre_process(str(model_path), str(prepped), skip_symbolic_shape=True)
+
+    model = onnx.load(str(prepped))
+    # Detect 헤드(박스 디코드/DFL)는 값 범위가 넓어 INT8 오차가 크므로 FP32 유지
+    head_prefix = "/model.22/"
+    excluded = [n.name for n in model.graph.node if n.name.startswith(head_prefix)] \
+        if exclude_head else []
+
+    if mode == "dynamic":
+        print("\n[QUANT] Dynamic INT8 (weights only, activations at runtime)...")
+        quantize_dynamic(
+            str(prepped), str(output_path),
+            weight_type=QuantType.QInt8,
+            nodes_to_exclude=excluded,
+        )
+    else:
+        input_meta = model.graph.input[0]
+        size = input_meta.type.tensor_type.shape.dim[2].dim_value or 640
+        print(f"\n[QUANT] Static INT8 - calibration: {len(calib_paths)} images @ {size}px")
+        reader = FloorplanCalibrationReader(calib_paths, input_meta.name, size)
+        quantize_static(
+            str(prepped), str(output_path), reader,
+            quant_format=QuantFormat.QDQ,
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            nodes_to_exclude=excluded,
+        )
+
+    size_mb = output_path.stat().st_size / (1024 * 1024)
+    print(f"[OK] INT8 model: {output_path} "
+          f"({size_mb:.1f} MB, {len(excluded)} head nodes kept FP32)")
+    return output_path
+
+
+def measure_latency(model_path: Path, paths: list, repeat: int, threads: int) -> dict:
+    """이미지당 추론 지연시간 (레터박스 + 추론 + 디코드/NMS) p50/p95"""
+    model = OnnxYoloModel(str(model_path), {"intra_op_threads": threads})
+    images = [img for img in (cv2.imread(str(p)) for p in paths) if img is not None]
+    if not images:
+        return {"p50_ms": None, "p95_ms": None}
+
+    model.infer([images[0]], imgsz=640, conf=0.25, iou=0.45, max_det=300)  # 워밍업
+    latencies = []
+    for _ in range(repeat):
+        for image in images:
+            t = time.perf_counter()
+            model.infer([image], imgsz=640, conf=0.25, iou=0.45, max_det=300)
+            latencies.append(time.perf_counter() - t)
+    return {
+        "p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 1),
+        "p95_ms": round(float(np.percentile(latencies, 95)) * 1000, 1),
+    }
+
+
+def _local_dataset_yaml(work_dir: Path) -> Path:
+    """dataset.yaml의 path를 현재 체크아웃 경로로 바꾼 사본 (work_dir에 저장)"""
+    import yaml
+
+    with open(DATASET_DIR / "dataset.yaml", "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    data["path"] = str(DATASET_DIR)
+    out = work_dir / "dataset.yaml"
+    out.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+    return out
+
+
+def write_report(rows: dict, classes: list, path: Path):
+    """모델별 지표 → 마크다운 표 + JSON"""
+    header = ["model", "size_mb", "mAP50", "mAP50-95", *classes, "p50_ms", "p95_ms"]
+    lines = [
+        "# Floor plan detector quantization report",
+        "",
+        "| " + " | ".join(header) + " |",
+        "|---" * len(header) + "|",
+    ]
+    for name, row in rows.items():
+        ap50 = row.get("ap50", {})
+        cells = [
+            name, row["size_mb"],
+            *(f"{row[k]:.3f}" if row.get(k) is not None else "-" for k in ("mAP50", "mAP50-95")),
+            *(f"{ap50[c]:.3f}" if c in ap50 else "-" for c in classes),
+            row["p50_ms"], row["p95_ms"],
+        ]
+        lines.append("| " + " | ".join(str(c) for c in cells) + " |")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    path.with_suffix(".json").write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    print("\n".join(lines))
+    print(f"\n[OK] Report: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="INPICK floor plan detector INT8 quantization")
+    parser.add_argument("--model", default=str(MODEL_OUTPUT / "floorplan-yolo.onnx"))
+    parser.add_argument("--output", default=str(MODEL_OUTPUT / "floorplan-yolo.int8.onnx"))
+    parser.add_argument("--mode", choices=["static", "dynamic"], default="static")
+    parser.add_argument("--calib-images", type=int, default=200, help="보정 이미지 수 (학습셋)")
+    parser.add_argument("--latency-images", type=int, default=50, help="지연시간 측정 이미지 수 (검증셋)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=0, help="ONNX Runtime intra-op 스레드 (0 = 자동)")
+    parser.add_argument("--keep-head-int8", action="store_true", help="Detect 헤드도 양자화")
+    parser.add_argument("--skip-eval", action="store_true", help="mAP 평가 생략 (ultralytics 불필요)")
+    parser.add_argument("--report", default=str(MODEL_OUTPUT / "quantization-report.md"))
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("  INPICK Floor Plan Symbol Detector - INT8 Quantization")
+    print("=" * 50)
+
+    model_path = Path(args.model)
+    if not model_path.exists():
+        print(f"[ERROR] ONNX model not found: {model_path}")
+        print("   Run: python scripts/train-yolo-floorplan.py")
+        sys.exit(1)
+
+    calib_paths = _list_images("train", args.calib_images)
+    if args.mode == "static" and not calib_paths:
+        print(f"[ERROR] No calibration images in {DATASET_DIR / 'images' / 'train'}")
+        print("   Run: npx tsx scripts/generate-synthetic-training.ts")
+        sys.exit(1)
+
+    # 중간 산출물 (전처리 그래프, 로컬 dataset.yaml)은 실행이 끝나면 삭제
+    with tempfile.TemporaryDirectory(prefix="floorplan-quant-") as tmp:
+        work_dir = Path(tmp)
+        int8_path = quantize(model_path, Path(args.output), args.mode, calib_paths,
+                             exclude_head=not args.keep_head_int8, work_dir=work_dir)
+
+        # mAP 평가를 할 때만 학습 스크립트 (ultralytics) 로드
+        train = None if args.skip_eval else _load_train_module()
+        latency_paths = _list_images("val", args.latency_images)
+        data_yaml = None if args.skip_eval else _local_dataset_yaml(work_dir)
+
+        rows = {}
+        for name, path in (("fp32", model_path), (f"int8-{args.mode}", int8_path)):
+            print(f"\n[EVAL] {name}: {path.name}")
+            row = {"size_mb": round(path.stat().st_size / (1024 * 1024), 2)}
+            if data_yaml:
+                summary = train.summarize_metrics(train.evaluate_model(path, data_yaml))
+                train.print_metrics(summary)
+                row.update(summary)
+            row.update(measure_latency(path, latency_paths, args.repeat, args.threads))
+            print(f"   p50={row['p50_ms']}ms p95={row['p95_ms']}ms")
+            rows[name] = row
+
+    write_report(rows, train.CLASSES if train else [], Path(args.report))
+
+
+if __name__ == "__main__":
+    main()
@@ -136,23 +136,47 @@ def export_onnx(results):
 
 def validate_model(results):
     """학습 결과 검증"""
+    best_pt = Path(results.save_dir) / "weights" / "best.pt"
+    print("\n[VAL] Validation results:")
+    metrics = evaluate_model(best_pt)
+    print_metrics(summarize_metrics(metrics))
+    return metrics
+
+
+def evaluate_model(model_path, data_yaml=None, imgsz=640):
+    """모델 검증 (.pt 또는 .onnx) → ultralytics 검증 지표"""
     from ultralytics import YOLO
 
-    best_pt = Path(results.save_dir) / "weights" / "best.pt"
-    model = YOLO(str(best_pt))
+    model = YOLO(str(model_path), task="detect")
+    return model.val(
+        data=str(data_yaml or DATASET_DIR / "dataset.yaml"),
+        imgsz=imgsz,
+        verbose=False,
+    )
 
-    print("\n[VAL] Validation results:")
-    metrics = model.val(data=str(DATASET_DIR / "dataset.yaml"))
 
-    print(f"   mAP50: {metrics.box.map50:.3f}")
-    print(f"   mAP50-95: {metrics.box.map:.3f}")
+def summarize_metrics(metrics) -> dict:
+    """검증 지표 → {"mAP50", "mAP50-95", "ap50": {클래스: AP50}}"""
+    # ap50은 검증셋에 등장한 클래스 순서 (ap_class_index)
+    ap50 = {
+        CLASSES[int(c)]: float(metrics.box.ap50[i])
+        for i, c in enumerate(metrics.box.ap_class_index)
+        if int(c) < len(CLASSES)
+    }
+    return {
+        "mAP50": float(metrics.box.map50),
+        "mAP50-95": float(metrics.box.map),
+        "ap50": ap50,
+    }
 
-    # 클래스별 AP
-    for i, cls_name in enumerate(CLASSES):
-        if i < len(metrics.box.ap50):
-            print(f"   {cls_name}: AP50={metrics.box.ap50[i]:.3f}")
 
-    return metrics
+def print_metrics(summary: dict):
+    print(f"   mAP50: {summary['mAP50']:.3f}")
+    print(f"   mAP50-95: {summary['mAP50-95']:.3f}")
+
+    # 클래스별 AP
+    for cls_name, ap in summary["ap50"].items():
+        print(f"   {cls_name}: AP50={ap:.3f}")
 
 
 def main():
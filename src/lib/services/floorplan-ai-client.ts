@@ -19,6 +19,7 @@ export interface FloorplanAIResult {
     scale_factor: number;
     canvas: { width: number; height: number };
     walls: {
+      id?: string;
       type: string;
       start: { x: number; y: number };
       end: { x: number; y: number };
@@ -40,6 +41,11 @@ export interface FloorplanAIResult {
       confidence: number;
       bbox: { x1: number; y1: number; x2: number; y2: number };
       center: { x: number; y: number };
+      /** 호스트 벽 ID (문/창문, 서버 측 벽 스냅 결과) */
+      wallId?: string | null;
+      /** 벽 시작점 → 심볼 중심 투영점 거리 (mm) */
+      offset_mm?: number;
+      wall_point?: { x: number; y: number };
     }[];
     texts: {
       text: string;
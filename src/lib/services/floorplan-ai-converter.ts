@@ -185,7 +185,7 @@ export function convertFloorplanAIResult(
     }
 
     return {
-      id: `wall-${i}`,
+      id: w.id ?? `wall-${i}`,
       start: { x: mmToM(w.start.x), y: mmToM(w.start.y) },
       end: { x: mmToM(w.end.x), y: mmToM(w.end.y) },
       thickness: mmToM(thicknessMm),
@@ -230,7 +230,7 @@ export function convertFloorplanAIResult(
           width: mmToM(Math.max(widthMm, heightMm)),
           height: mmToM(Math.min(widthMm, heightMm)),
           rotation: 0,
-          wallId: '',
+          wallId: sym.wallId ?? '',
         });
         break;
 
@@ -289,8 +289,9 @@ export function convertFloorplanAIResult(
     }
   }
 
-  // --- window에 가장 가까운 벽 할당 ---
+  // --- window에 가장 가까운 벽 할당 (서버에서 스냅되지 않은 창문만) ---
   for (const win of windows) {
+    if (win.wallId) continue;
     let minDist = Infinity;
     for (const wall of walls) {
       const wmx = (wall.start.x + wall.end.x) / 2;